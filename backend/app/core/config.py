@@ -3,6 +3,8 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Virtual Assistant"
+    DEBUG: bool = False
+    METRICS_ENABLED: bool = False  # per-stage timings in app.core.metrics
     DATABASE_URL: str
     REDIS_URL: str
     JWT_SECRET: str
@@ -12,6 +14,38 @@ class Settings(BaseSettings):
     SMTP_PASS: str
     SMTP_FROM: str
 
+    # DSL parser
+    DSL_CACHE_SIZE: int = 1024   # 0 disables the parse cache
+    DSL_FASTPATH: bool = True    # keyword pre-parser for fixed-shape commands
+    DSL_ENGINE: str = "tree"     # tree (parse tree + visitor) | stream (no tree) | template (stream + shape cache)
+    DSL_LEXER: str = "antlr"     # antlr (generated ATN lexer) | regex (app/gen/dsl_lexer.py)
+    DSL_EXECUTOR: str = "thread" # inline | thread | process
+    DSL_WORKERS: int = 2
+    DSL_QUEUE_SIZE: int = 64     # parses queued or running at once
+    DSL_TIMEOUT: float = 2.0     # seconds per parse, queueing included
+    DSL_PARSE_DEADLINE: float = 0.5  # seconds of parsing before the worker gives up
+    DSL_MAX_CHARS: int = 2000    # longer inputs are rejected before parsing
+    DSL_MAX_TOKENS: int = 256
+    DSL_SUGGESTIONS: int = 3     # "did you mean" commands on parse errors; 0 disables
+    DSL_BATCH_MAX_BYTES: int = 16 << 20  # request body of /dsl/parse/batch; larger ones get 413
+
+    CHAT_PAGE_SIZE: int = 20         # tasks per "show tasks" / "more" page
+
+    # Table images in chat replies
+    CHAT_TABLE_FORMAT: str = "image" # image | png | svg | table, for clients that do not negotiate (Accept / ?format=)
+    RENDER_IMAGE_FORMAT: str = "png" # what "image" means: png (raster <img>) | svg (inline vector)
+    RENDER_EXECUTOR: str = "thread"  # inline | thread | process
+    RENDER_WORKERS: int = 2
+    RENDER_QUEUE_SIZE: int = 16      # renders queued or running; past it replies fall back to text
+    RENDER_TIMEOUT: float = 10.0     # seconds per render, queueing included
+    RENDER_CACHE_SIZE: int = 256     # rendered tables kept by content hash; 0 disables
+    RENDER_CACHE_BYTES: int = 32 << 20
+
+    # Pending confirmations ("... anyway? (Yes/No)")
+    PENDING_BACKEND: str = "memory"  # memory (one process) | redis (shared by workers, REDIS_URL)
+    PENDING_TTL: float = 300         # seconds an unanswered action is kept
+    PENDING_MAX_SIZE: int = 10_000   # oldest entries are evicted past this
+
     class Config:
         env_file = "app/.env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,84 @@
+# app/core/metrics.py
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from app.core.config import settings
+
+
+class Summary:
+    """Count / mean / max over all observations, p50 / p99 over the last ``window``."""
+
+    __slots__ = ("count", "total", "max", "recent")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.recent.append(value)
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.recent)
+        pct = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": pct(0.50),
+            "p99": pct(0.99),
+        }
+
+
+class Metrics:
+    """In-process named summaries (``dsl.lex_ms``, ``chat.handle_ms``, ...).
+
+    When disabled, ``observe`` and ``time`` return before doing any work.
+    """
+
+    def __init__(self, enabled: bool = True, window: int = 1024):
+        self.enabled = enabled
+        self.window = window
+        self._summaries: Dict[str, Summary] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = Summary(self.window)
+            summary.add(value)
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Observe the duration of the block in milliseconds."""
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - t0) * 1e3)
+
+    def snapshot(self, prefix: str = "") -> dict:
+        with self._lock:
+            return {name: s.snapshot() for name, s in sorted(self._summaries.items())
+                    if name.startswith(prefix)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._summaries.clear()
+
+
+METRICS = Metrics(enabled=settings.METRICS_ENABLED)
@@ -2,7 +2,7 @@
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, WebSocket, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.hash import bcrypt
@@ -36,6 +36,31 @@ def create_access_token(data: dict[str, Any],
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=ALGORITHM)
 
 
+def decode_token(token: str) -> Optional[dict[str, Any]]:
+    """Claims of a valid access token with a subject, else None."""
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    return payload if payload.get("sub") is not None else None
+
+
+async def user_from_token(token: str, session: AsyncSession) -> Optional[User]:
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return await session.get(User, payload["sub"])
+
+
+def websocket_token(ws: WebSocket) -> Optional[str]:
+    """Bearer token of a WebSocket handshake: the header, else ``?token=``."""
+    # browsers cannot set headers on a WebSocket handshake
+    auth = ws.headers.get("authorization", "")
+    if auth[:7].lower() == "bearer ":
+        return auth[7:].strip()
+    return ws.query_params.get("token")
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme),
                            session: AsyncSession = Depends(get_session)) -> User:
     credentials_exception = HTTPException(
@@ -43,15 +68,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme),
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGORITHM])
-        uid: str | None = payload.get("sub")
-    except JWTError:
-        raise credentials_exception
-
-    if uid is None:
-        raise credentials_exception
-    user = await session.get(User, uid)
+    user = await user_from_token(token, session)
     if user is None:
         raise credentials_exception
     return user
@@ -2,11 +2,12 @@ grammar AssistantDSL;
 options { caseInsensitive = true; }
 
 // ────────────── parser rules ──────────────
-program: command EOF;
+program: command (commandSep command)* EOF;
+commandSep: 'and' 'then'?;   // "remind me to A in 2 hours and show tasks"
 
 command: greetingCommand | actionCommand | supportCommand | confirmCommand;
 greetingCommand: introduce | greeting | asking;
-actionCommand: createAction | viewAction | deleteAction | modifyAction;
+actionCommand: createAction | viewAction | pageAction | deleteAction | modifyAction;
 supportCommand: supportTasks | supportGreetings | supportInfor;
 confirmCommand: affirmative | negative;
 
@@ -17,12 +18,13 @@ supportInfor: KSUPPORT 'bot' 'information';
 
 // greetings
 introduce: 'what' 'is' 'your' 'name' QUESTION?;
-greeting: kgreeting ('my' 'name' 'is' IDENTIFIER)?;
+greeting: kgreeting ('my' 'name' 'is' word)?;
 asking: kasking 'are' 'you' QUESTION?;
 
 // actions
 createAction: kcreate taskTitle dueSpec? rruleClause? statusClause?;
 viewAction: KVIEW 'tasks';
+pageAction: 'next' 'page' | KVIEW? 'more' 'tasks'?;   // continues the last viewAction
 deleteAction: kdelete taskTitle dueSpec?;
 modifyAction: kmodify taskTitle dueSpec? SET fieldAssign (',' fieldAssign)*;
 
@@ -31,8 +33,9 @@ dueSpec: IN INT timeUnit | AT DATE TIME;
 timeUnit: MINUTE | HOUR | DAY;
 rruleClause: REPEAT EVERY INT? timeUnit;
 statusClause: AS STATUS;
-fieldAssign: IDENTIFIER '=' (IDENTIFIER | STATUS);
-taskTitle: IDENTIFIER (IDENTIFIER)*;
+fieldAssign: word '=' (word | STATUS);
+taskTitle: word+;
+word: IDENTIFIER | 'next' | 'page' | 'more' | 'and' | 'then';   // free words: paging keywords and separators are still ordinary words
 
 // confirmations
 affirmative: YES;
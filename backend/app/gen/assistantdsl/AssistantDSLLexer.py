@@ -10,205 +10,216 @@ else:
 
 def serializedATN():
     return [
-        4,0,42,538,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,47,572,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
         26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
         32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
-        39,7,39,2,40,7,40,2,41,7,41,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,
-        1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
-        1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,
-        1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,11,1,11,1,
-        11,1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,14,1,15,1,15,1,15,1,16,1,
-        16,1,16,1,16,1,16,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,
-        18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,
-        18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,3,18,206,8,18,1,
-        19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,3,19,217,8,19,1,20,1,
-        20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,3,20,231,8,
-        20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,
-        21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,3,21,257,
-        8,21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,
-        1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,
-        1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,3,22,295,
-        8,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,
+        1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,
+        1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,
+        1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,
+        1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,12,
+        1,12,1,12,1,12,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,15,
+        1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,18,1,18,
+        1,19,1,19,1,19,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,22,1,22,
         1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,
-        1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,3,23,333,
-        8,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,
-        1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,
-        1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,3,24,371,
-        8,24,1,25,1,25,1,25,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,
-        1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,30,1,30,1,30,
-        1,30,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,
-        1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,3,31,
-        423,8,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,
-        1,32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,443,8,32,1,33,1,33,1,33,
-        1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,
-        1,33,1,33,1,33,1,33,1,33,3,33,466,8,33,1,34,1,34,1,34,1,34,1,34,
-        1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,3,34,481,8,34,1,35,1,35,
-        1,35,1,35,1,35,1,35,1,35,1,35,1,35,3,35,492,8,35,1,36,1,36,1,36,
-        1,36,1,36,1,36,1,36,3,36,501,8,36,1,37,1,37,1,37,1,37,1,37,1,37,
-        1,37,1,37,1,37,1,37,1,37,1,38,1,38,1,38,1,38,1,38,1,38,1,39,4,39,
-        521,8,39,11,39,12,39,522,1,40,1,40,5,40,527,8,40,10,40,12,40,530,
-        9,40,1,41,4,41,533,8,41,11,41,12,41,534,1,41,1,41,0,0,42,1,1,3,2,
-        5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,
-        15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,
-        26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,
-        37,75,38,77,39,79,40,81,41,83,42,1,0,26,2,0,84,84,116,116,2,0,65,
-        65,97,97,2,0,83,83,115,115,2,0,75,75,107,107,2,0,73,73,105,105,2,
-        0,78,78,110,110,2,0,82,82,114,114,2,0,85,85,117,117,2,0,67,67,99,
-        99,2,0,79,79,111,111,2,0,71,71,103,103,2,0,69,69,101,101,2,0,66,
-        66,98,98,2,0,70,70,102,102,2,0,77,77,109,109,2,0,87,87,119,119,2,
-        0,72,72,104,104,2,0,89,89,121,121,2,0,76,76,108,108,2,0,86,86,118,
-        118,2,0,68,68,100,100,2,0,80,80,112,112,1,0,48,57,2,0,65,90,97,122,
-        3,0,48,57,65,90,97,122,3,0,9,10,13,13,32,32,590,0,1,1,0,0,0,0,3,
-        1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,
-        0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,
-        0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,
-        0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,
-        0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,
-        0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,
-        0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,
-        0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,
-        0,0,0,1,85,1,0,0,0,3,91,1,0,0,0,5,104,1,0,0,0,7,113,1,0,0,0,9,117,
-        1,0,0,0,11,129,1,0,0,0,13,134,1,0,0,0,15,137,1,0,0,0,17,142,1,0,
-        0,0,19,147,1,0,0,0,21,150,1,0,0,0,23,154,1,0,0,0,25,158,1,0,0,0,
-        27,160,1,0,0,0,29,162,1,0,0,0,31,165,1,0,0,0,33,168,1,0,0,0,35,173,
-        1,0,0,0,37,205,1,0,0,0,39,216,1,0,0,0,41,230,1,0,0,0,43,256,1,0,
-        0,0,45,294,1,0,0,0,47,332,1,0,0,0,49,370,1,0,0,0,51,372,1,0,0,0,
-        53,375,1,0,0,0,55,378,1,0,0,0,57,385,1,0,0,0,59,391,1,0,0,0,61,394,
-        1,0,0,0,63,422,1,0,0,0,65,442,1,0,0,0,67,465,1,0,0,0,69,480,1,0,
-        0,0,71,491,1,0,0,0,73,500,1,0,0,0,75,502,1,0,0,0,77,513,1,0,0,0,
-        79,520,1,0,0,0,81,524,1,0,0,0,83,532,1,0,0,0,85,86,7,0,0,0,86,87,
-        7,1,0,0,87,88,7,2,0,0,88,89,7,3,0,0,89,90,7,2,0,0,90,2,1,0,0,0,91,
-        92,7,4,0,0,92,93,7,5,0,0,93,94,7,2,0,0,94,95,7,0,0,0,95,96,7,6,0,
-        0,96,97,7,7,0,0,97,98,7,8,0,0,98,99,7,0,0,0,99,100,7,4,0,0,100,101,
-        7,9,0,0,101,102,7,5,0,0,102,103,7,2,0,0,103,4,1,0,0,0,104,105,7,
-        10,0,0,105,106,7,6,0,0,106,107,7,11,0,0,107,108,7,11,0,0,108,109,
-        7,0,0,0,109,110,7,4,0,0,110,111,7,5,0,0,111,112,7,10,0,0,112,6,1,
-        0,0,0,113,114,7,12,0,0,114,115,7,9,0,0,115,116,7,0,0,0,116,8,1,0,
-        0,0,117,118,7,4,0,0,118,119,7,5,0,0,119,120,7,13,0,0,120,121,7,9,
-        0,0,121,122,7,6,0,0,122,123,7,14,0,0,123,124,7,1,0,0,124,125,7,0,
-        0,0,125,126,7,4,0,0,126,127,7,9,0,0,127,128,7,5,0,0,128,10,1,0,0,
-        0,129,130,7,15,0,0,130,131,7,16,0,0,131,132,7,1,0,0,132,133,7,0,
-        0,0,133,12,1,0,0,0,134,135,7,4,0,0,135,136,7,2,0,0,136,14,1,0,0,
-        0,137,138,7,17,0,0,138,139,7,9,0,0,139,140,7,7,0,0,140,141,7,6,0,
-        0,141,16,1,0,0,0,142,143,7,5,0,0,143,144,7,1,0,0,144,145,7,14,0,
-        0,145,146,7,11,0,0,146,18,1,0,0,0,147,148,7,14,0,0,148,149,7,17,
-        0,0,149,20,1,0,0,0,150,151,7,1,0,0,151,152,7,6,0,0,152,153,7,11,
-        0,0,153,22,1,0,0,0,154,155,7,17,0,0,155,156,7,9,0,0,156,157,7,7,
-        0,0,157,24,1,0,0,0,158,159,5,44,0,0,159,26,1,0,0,0,160,161,5,61,
-        0,0,161,28,1,0,0,0,162,163,7,14,0,0,163,164,7,11,0,0,164,30,1,0,
-        0,0,165,166,7,0,0,0,166,167,7,9,0,0,167,32,1,0,0,0,168,169,7,0,0,
-        0,169,170,7,1,0,0,170,171,7,2,0,0,171,172,7,3,0,0,172,34,1,0,0,0,
-        173,174,5,63,0,0,174,36,1,0,0,0,175,176,7,16,0,0,176,206,7,4,0,0,
-        177,178,7,16,0,0,178,179,7,11,0,0,179,180,7,18,0,0,180,181,7,18,
-        0,0,181,206,7,9,0,0,182,183,7,16,0,0,183,184,7,11,0,0,184,206,7,
-        17,0,0,185,186,7,16,0,0,186,206,7,4,0,0,187,188,7,16,0,0,188,206,
-        7,4,0,0,189,190,7,16,0,0,190,191,7,11,0,0,191,192,7,18,0,0,192,193,
-        7,18,0,0,193,206,7,9,0,0,194,195,7,16,0,0,195,196,7,11,0,0,196,197,
-        7,18,0,0,197,198,7,18,0,0,198,206,7,9,0,0,199,200,7,16,0,0,200,201,
-        7,11,0,0,201,206,7,17,0,0,202,203,7,16,0,0,203,204,7,11,0,0,204,
-        206,7,17,0,0,205,175,1,0,0,0,205,177,1,0,0,0,205,182,1,0,0,0,205,
-        185,1,0,0,0,205,187,1,0,0,0,205,189,1,0,0,0,205,194,1,0,0,0,205,
-        199,1,0,0,0,205,202,1,0,0,0,206,38,1,0,0,0,207,208,7,16,0,0,208,
-        209,7,9,0,0,209,217,7,15,0,0,210,211,7,16,0,0,211,212,7,9,0,0,212,
-        217,7,15,0,0,213,214,7,16,0,0,214,215,7,9,0,0,215,217,7,15,0,0,216,
-        207,1,0,0,0,216,210,1,0,0,0,216,213,1,0,0,0,217,40,1,0,0,0,218,219,
-        7,18,0,0,219,220,7,4,0,0,220,221,7,2,0,0,221,231,7,0,0,0,222,223,
-        7,18,0,0,223,224,7,4,0,0,224,225,7,2,0,0,225,231,7,0,0,0,226,227,
-        7,18,0,0,227,228,7,4,0,0,228,229,7,2,0,0,229,231,7,0,0,0,230,218,
-        1,0,0,0,230,222,1,0,0,0,230,226,1,0,0,0,231,42,1,0,0,0,232,233,7,
-        2,0,0,233,234,7,16,0,0,234,235,7,9,0,0,235,257,7,15,0,0,236,237,
-        7,19,0,0,237,238,7,4,0,0,238,239,7,11,0,0,239,257,7,15,0,0,240,241,
-        7,2,0,0,241,242,7,16,0,0,242,243,7,9,0,0,243,257,7,15,0,0,244,245,
-        7,19,0,0,245,246,7,4,0,0,246,247,7,11,0,0,247,257,7,15,0,0,248,249,
-        7,2,0,0,249,250,7,16,0,0,250,251,7,9,0,0,251,257,7,15,0,0,252,253,
-        7,19,0,0,253,254,7,4,0,0,254,255,7,11,0,0,255,257,7,15,0,0,256,232,
-        1,0,0,0,256,236,1,0,0,0,256,240,1,0,0,0,256,244,1,0,0,0,256,248,
-        1,0,0,0,256,252,1,0,0,0,257,44,1,0,0,0,258,259,7,6,0,0,259,260,7,
-        11,0,0,260,261,7,14,0,0,261,262,7,4,0,0,262,263,7,5,0,0,263,295,
-        7,20,0,0,264,265,7,8,0,0,265,266,7,6,0,0,266,267,7,11,0,0,267,268,
-        7,1,0,0,268,269,7,0,0,0,269,295,7,11,0,0,270,271,7,6,0,0,271,272,
-        7,11,0,0,272,273,7,14,0,0,273,274,7,4,0,0,274,275,7,5,0,0,275,295,
-        7,20,0,0,276,277,7,8,0,0,277,278,7,6,0,0,278,279,7,11,0,0,279,280,
-        7,1,0,0,280,281,7,0,0,0,281,295,7,11,0,0,282,283,7,6,0,0,283,284,
-        7,11,0,0,284,285,7,14,0,0,285,286,7,4,0,0,286,287,7,5,0,0,287,295,
-        7,20,0,0,288,289,7,8,0,0,289,290,7,6,0,0,290,291,7,11,0,0,291,292,
-        7,1,0,0,292,293,7,0,0,0,293,295,7,11,0,0,294,258,1,0,0,0,294,264,
-        1,0,0,0,294,270,1,0,0,0,294,276,1,0,0,0,294,282,1,0,0,0,294,288,
-        1,0,0,0,295,46,1,0,0,0,296,297,7,20,0,0,297,298,7,11,0,0,298,299,
-        7,18,0,0,299,300,7,11,0,0,300,301,7,0,0,0,301,333,7,11,0,0,302,303,
-        7,6,0,0,303,304,7,11,0,0,304,305,7,14,0,0,305,306,7,9,0,0,306,307,
-        7,19,0,0,307,333,7,11,0,0,308,309,7,20,0,0,309,310,7,11,0,0,310,
-        311,7,18,0,0,311,312,7,11,0,0,312,313,7,0,0,0,313,333,7,11,0,0,314,
-        315,7,6,0,0,315,316,7,11,0,0,316,317,7,14,0,0,317,318,7,9,0,0,318,
-        319,7,19,0,0,319,333,7,11,0,0,320,321,7,20,0,0,321,322,7,11,0,0,
-        322,323,7,18,0,0,323,324,7,11,0,0,324,325,7,0,0,0,325,333,7,11,0,
-        0,326,327,7,6,0,0,327,328,7,11,0,0,328,329,7,14,0,0,329,330,7,9,
-        0,0,330,331,7,19,0,0,331,333,7,11,0,0,332,296,1,0,0,0,332,302,1,
-        0,0,0,332,308,1,0,0,0,332,314,1,0,0,0,332,320,1,0,0,0,332,326,1,
-        0,0,0,333,48,1,0,0,0,334,335,7,7,0,0,335,336,7,21,0,0,336,337,7,
-        20,0,0,337,338,7,1,0,0,338,339,7,0,0,0,339,371,7,11,0,0,340,341,
-        7,14,0,0,341,342,7,9,0,0,342,343,7,20,0,0,343,344,7,4,0,0,344,345,
-        7,13,0,0,345,371,7,17,0,0,346,347,7,7,0,0,347,348,7,21,0,0,348,349,
-        7,20,0,0,349,350,7,1,0,0,350,351,7,0,0,0,351,371,7,11,0,0,352,353,
-        7,14,0,0,353,354,7,9,0,0,354,355,7,20,0,0,355,356,7,4,0,0,356,357,
-        7,13,0,0,357,371,7,17,0,0,358,359,7,7,0,0,359,360,7,21,0,0,360,361,
-        7,20,0,0,361,362,7,1,0,0,362,363,7,0,0,0,363,371,7,11,0,0,364,365,
-        7,14,0,0,365,366,7,9,0,0,366,367,7,20,0,0,367,368,7,4,0,0,368,369,
-        7,13,0,0,369,371,7,17,0,0,370,334,1,0,0,0,370,340,1,0,0,0,370,346,
-        1,0,0,0,370,352,1,0,0,0,370,358,1,0,0,0,370,364,1,0,0,0,371,50,1,
-        0,0,0,372,373,7,4,0,0,373,374,7,5,0,0,374,52,1,0,0,0,375,376,7,1,
-        0,0,376,377,7,0,0,0,377,54,1,0,0,0,378,379,7,6,0,0,379,380,7,11,
-        0,0,380,381,7,21,0,0,381,382,7,11,0,0,382,383,7,1,0,0,383,384,7,
-        0,0,0,384,56,1,0,0,0,385,386,7,11,0,0,386,387,7,19,0,0,387,388,7,
-        11,0,0,388,389,7,6,0,0,389,390,7,17,0,0,390,58,1,0,0,0,391,392,7,
-        1,0,0,392,393,7,2,0,0,393,60,1,0,0,0,394,395,7,2,0,0,395,396,7,11,
-        0,0,396,397,7,0,0,0,397,62,1,0,0,0,398,399,7,17,0,0,399,400,7,11,
-        0,0,400,423,7,2,0,0,401,402,7,17,0,0,402,403,7,11,0,0,403,423,7,
-        21,0,0,404,405,7,9,0,0,405,423,7,3,0,0,406,407,7,17,0,0,407,408,
-        7,11,0,0,408,423,7,2,0,0,409,410,7,17,0,0,410,411,7,11,0,0,411,423,
-        7,21,0,0,412,413,7,9,0,0,413,423,7,3,0,0,414,415,7,17,0,0,415,416,
-        7,11,0,0,416,423,7,2,0,0,417,418,7,17,0,0,418,419,7,11,0,0,419,423,
-        7,21,0,0,420,421,7,9,0,0,421,423,7,3,0,0,422,398,1,0,0,0,422,401,
-        1,0,0,0,422,404,1,0,0,0,422,406,1,0,0,0,422,409,1,0,0,0,422,412,
-        1,0,0,0,422,414,1,0,0,0,422,417,1,0,0,0,422,420,1,0,0,0,423,64,1,
-        0,0,0,424,425,7,5,0,0,425,443,7,9,0,0,426,427,7,5,0,0,427,428,7,
-        9,0,0,428,429,7,21,0,0,429,443,7,11,0,0,430,431,7,5,0,0,431,443,
-        7,9,0,0,432,433,7,5,0,0,433,434,7,9,0,0,434,435,7,21,0,0,435,443,
-        7,11,0,0,436,437,7,5,0,0,437,443,7,9,0,0,438,439,7,5,0,0,439,440,
-        7,9,0,0,440,441,7,21,0,0,441,443,7,11,0,0,442,424,1,0,0,0,442,426,
-        1,0,0,0,442,430,1,0,0,0,442,432,1,0,0,0,442,436,1,0,0,0,442,438,
-        1,0,0,0,443,66,1,0,0,0,444,445,7,21,0,0,445,446,7,11,0,0,446,447,
-        7,5,0,0,447,448,7,20,0,0,448,449,7,4,0,0,449,450,7,5,0,0,450,466,
-        7,10,0,0,451,452,7,20,0,0,452,453,7,9,0,0,453,454,7,5,0,0,454,466,
-        7,11,0,0,455,456,7,4,0,0,456,457,7,5,0,0,457,458,7,21,0,0,458,459,
-        7,6,0,0,459,460,7,9,0,0,460,461,7,10,0,0,461,462,7,6,0,0,462,463,
-        7,11,0,0,463,464,7,2,0,0,464,466,7,2,0,0,465,444,1,0,0,0,465,451,
-        1,0,0,0,465,455,1,0,0,0,466,68,1,0,0,0,467,468,7,14,0,0,468,469,
-        7,4,0,0,469,470,7,5,0,0,470,471,7,7,0,0,471,472,7,0,0,0,472,481,
-        7,11,0,0,473,474,7,14,0,0,474,475,7,4,0,0,475,476,7,5,0,0,476,477,
-        7,7,0,0,477,478,7,0,0,0,478,479,7,11,0,0,479,481,7,2,0,0,480,467,
-        1,0,0,0,480,473,1,0,0,0,481,70,1,0,0,0,482,483,7,16,0,0,483,484,
-        7,9,0,0,484,485,7,7,0,0,485,492,7,6,0,0,486,487,7,16,0,0,487,488,
-        7,9,0,0,488,489,7,7,0,0,489,490,7,6,0,0,490,492,7,2,0,0,491,482,
-        1,0,0,0,491,486,1,0,0,0,492,72,1,0,0,0,493,494,7,20,0,0,494,495,
-        7,1,0,0,495,501,7,17,0,0,496,497,7,20,0,0,497,498,7,1,0,0,498,499,
-        7,17,0,0,499,501,7,2,0,0,500,493,1,0,0,0,500,496,1,0,0,0,501,74,
-        1,0,0,0,502,503,7,22,0,0,503,504,7,22,0,0,504,505,7,22,0,0,505,506,
-        7,22,0,0,506,507,5,45,0,0,507,508,7,22,0,0,508,509,7,22,0,0,509,
-        510,5,45,0,0,510,511,7,22,0,0,511,512,7,22,0,0,512,76,1,0,0,0,513,
-        514,7,22,0,0,514,515,7,22,0,0,515,516,5,58,0,0,516,517,7,22,0,0,
-        517,518,7,22,0,0,518,78,1,0,0,0,519,521,7,22,0,0,520,519,1,0,0,0,
-        521,522,1,0,0,0,522,520,1,0,0,0,522,523,1,0,0,0,523,80,1,0,0,0,524,
-        528,7,23,0,0,525,527,7,24,0,0,526,525,1,0,0,0,527,530,1,0,0,0,528,
-        526,1,0,0,0,528,529,1,0,0,0,529,82,1,0,0,0,530,528,1,0,0,0,531,533,
-        7,25,0,0,532,531,1,0,0,0,533,534,1,0,0,0,534,532,1,0,0,0,534,535,
-        1,0,0,0,535,536,1,0,0,0,536,537,6,41,0,0,537,84,1,0,0,0,17,0,205,
-        216,230,256,294,332,370,422,442,465,480,491,500,522,528,534,1,6,
-        0,0
+        1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,
+        1,23,1,23,1,23,1,23,3,23,240,8,23,1,24,1,24,1,24,1,24,1,24,1,24,
+        1,24,1,24,1,24,3,24,251,8,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,
+        1,25,1,25,1,25,1,25,1,25,3,25,265,8,25,1,26,1,26,1,26,1,26,1,26,
+        1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,
+        1,26,1,26,1,26,1,26,1,26,1,26,3,26,291,8,26,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,27,1,27,1,27,1,27,3,27,329,8,27,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,3,28,367,8,28,1,29,1,29,1,29,1,29,
+        1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,
+        1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,
+        1,29,1,29,1,29,1,29,1,29,1,29,3,29,405,8,29,1,30,1,30,1,30,1,31,
+        1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,33,1,33,1,33,1,33,
+        1,33,1,33,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,
+        1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,
+        1,36,1,36,1,36,1,36,1,36,1,36,1,36,3,36,457,8,36,1,37,1,37,1,37,
+        1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
+        1,37,1,37,3,37,477,8,37,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
+        1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
+        3,38,500,8,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,
+        1,39,1,39,1,39,3,39,515,8,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,
+        1,40,1,40,3,40,526,8,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,3,41,
+        535,8,41,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,
+        1,43,1,43,1,43,1,43,1,43,1,43,1,44,4,44,555,8,44,11,44,12,44,556,
+        1,45,1,45,5,45,561,8,45,10,45,12,45,564,9,45,1,46,4,46,567,8,46,
+        11,46,12,46,568,1,46,1,46,0,0,47,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,
+        8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,
+        19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,
+        30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,
+        41,83,42,85,43,87,44,89,45,91,46,93,47,1,0,27,2,0,65,65,97,97,2,
+        0,78,78,110,110,2,0,68,68,100,100,2,0,84,84,116,116,2,0,72,72,104,
+        104,2,0,69,69,101,101,2,0,83,83,115,115,2,0,75,75,107,107,2,0,73,
+        73,105,105,2,0,82,82,114,114,2,0,85,85,117,117,2,0,67,67,99,99,2,
+        0,79,79,111,111,2,0,71,71,103,103,2,0,66,66,98,98,2,0,70,70,102,
+        102,2,0,77,77,109,109,2,0,87,87,119,119,2,0,89,89,121,121,2,0,88,
+        88,120,120,2,0,80,80,112,112,2,0,76,76,108,108,2,0,86,86,118,118,
+        1,0,48,57,2,0,65,90,97,122,3,0,48,57,65,90,97,122,3,0,9,10,13,13,
+        32,32,624,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,
+        0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,
+        0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,
+        0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,
+        0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,
+        0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,
+        0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,
+        0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,
+        0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,
+        0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,1,95,1,0,0,0,3,99,1,0,0,0,5,104,
+        1,0,0,0,7,110,1,0,0,0,9,123,1,0,0,0,11,132,1,0,0,0,13,136,1,0,0,
+        0,15,148,1,0,0,0,17,153,1,0,0,0,19,156,1,0,0,0,21,161,1,0,0,0,23,
+        166,1,0,0,0,25,169,1,0,0,0,27,173,1,0,0,0,29,177,1,0,0,0,31,182,
+        1,0,0,0,33,187,1,0,0,0,35,192,1,0,0,0,37,194,1,0,0,0,39,196,1,0,
+        0,0,41,199,1,0,0,0,43,202,1,0,0,0,45,207,1,0,0,0,47,239,1,0,0,0,
+        49,250,1,0,0,0,51,264,1,0,0,0,53,290,1,0,0,0,55,328,1,0,0,0,57,366,
+        1,0,0,0,59,404,1,0,0,0,61,406,1,0,0,0,63,409,1,0,0,0,65,412,1,0,
+        0,0,67,419,1,0,0,0,69,425,1,0,0,0,71,428,1,0,0,0,73,456,1,0,0,0,
+        75,476,1,0,0,0,77,499,1,0,0,0,79,514,1,0,0,0,81,525,1,0,0,0,83,534,
+        1,0,0,0,85,536,1,0,0,0,87,547,1,0,0,0,89,554,1,0,0,0,91,558,1,0,
+        0,0,93,566,1,0,0,0,95,96,7,0,0,0,96,97,7,1,0,0,97,98,7,2,0,0,98,
+        2,1,0,0,0,99,100,7,3,0,0,100,101,7,4,0,0,101,102,7,5,0,0,102,103,
+        7,1,0,0,103,4,1,0,0,0,104,105,7,3,0,0,105,106,7,0,0,0,106,107,7,
+        6,0,0,107,108,7,7,0,0,108,109,7,6,0,0,109,6,1,0,0,0,110,111,7,8,
+        0,0,111,112,7,1,0,0,112,113,7,6,0,0,113,114,7,3,0,0,114,115,7,9,
+        0,0,115,116,7,10,0,0,116,117,7,11,0,0,117,118,7,3,0,0,118,119,7,
+        8,0,0,119,120,7,12,0,0,120,121,7,1,0,0,121,122,7,6,0,0,122,8,1,0,
+        0,0,123,124,7,13,0,0,124,125,7,9,0,0,125,126,7,5,0,0,126,127,7,5,
+        0,0,127,128,7,3,0,0,128,129,7,8,0,0,129,130,7,1,0,0,130,131,7,13,
+        0,0,131,10,1,0,0,0,132,133,7,14,0,0,133,134,7,12,0,0,134,135,7,3,
+        0,0,135,12,1,0,0,0,136,137,7,8,0,0,137,138,7,1,0,0,138,139,7,15,
+        0,0,139,140,7,12,0,0,140,141,7,9,0,0,141,142,7,16,0,0,142,143,7,
+        0,0,0,143,144,7,3,0,0,144,145,7,8,0,0,145,146,7,12,0,0,146,147,7,
+        1,0,0,147,14,1,0,0,0,148,149,7,17,0,0,149,150,7,4,0,0,150,151,7,
+        0,0,0,151,152,7,3,0,0,152,16,1,0,0,0,153,154,7,8,0,0,154,155,7,6,
+        0,0,155,18,1,0,0,0,156,157,7,18,0,0,157,158,7,12,0,0,158,159,7,10,
+        0,0,159,160,7,9,0,0,160,20,1,0,0,0,161,162,7,1,0,0,162,163,7,0,0,
+        0,163,164,7,16,0,0,164,165,7,5,0,0,165,22,1,0,0,0,166,167,7,16,0,
+        0,167,168,7,18,0,0,168,24,1,0,0,0,169,170,7,0,0,0,170,171,7,9,0,
+        0,171,172,7,5,0,0,172,26,1,0,0,0,173,174,7,18,0,0,174,175,7,12,0,
+        0,175,176,7,10,0,0,176,28,1,0,0,0,177,178,7,1,0,0,178,179,7,5,0,
+        0,179,180,7,19,0,0,180,181,7,3,0,0,181,30,1,0,0,0,182,183,7,20,0,
+        0,183,184,7,0,0,0,184,185,7,13,0,0,185,186,7,5,0,0,186,32,1,0,0,
+        0,187,188,7,16,0,0,188,189,7,12,0,0,189,190,7,9,0,0,190,191,7,5,
+        0,0,191,34,1,0,0,0,192,193,5,44,0,0,193,36,1,0,0,0,194,195,5,61,
+        0,0,195,38,1,0,0,0,196,197,7,16,0,0,197,198,7,5,0,0,198,40,1,0,0,
+        0,199,200,7,3,0,0,200,201,7,12,0,0,201,42,1,0,0,0,202,203,7,3,0,
+        0,203,204,7,0,0,0,204,205,7,6,0,0,205,206,7,7,0,0,206,44,1,0,0,0,
+        207,208,5,63,0,0,208,46,1,0,0,0,209,210,7,4,0,0,210,240,7,8,0,0,
+        211,212,7,4,0,0,212,213,7,5,0,0,213,214,7,21,0,0,214,215,7,21,0,
+        0,215,240,7,12,0,0,216,217,7,4,0,0,217,218,7,5,0,0,218,240,7,18,
+        0,0,219,220,7,4,0,0,220,240,7,8,0,0,221,222,7,4,0,0,222,240,7,8,
+        0,0,223,224,7,4,0,0,224,225,7,5,0,0,225,226,7,21,0,0,226,227,7,21,
+        0,0,227,240,7,12,0,0,228,229,7,4,0,0,229,230,7,5,0,0,230,231,7,21,
+        0,0,231,232,7,21,0,0,232,240,7,12,0,0,233,234,7,4,0,0,234,235,7,
+        5,0,0,235,240,7,18,0,0,236,237,7,4,0,0,237,238,7,5,0,0,238,240,7,
+        18,0,0,239,209,1,0,0,0,239,211,1,0,0,0,239,216,1,0,0,0,239,219,1,
+        0,0,0,239,221,1,0,0,0,239,223,1,0,0,0,239,228,1,0,0,0,239,233,1,
+        0,0,0,239,236,1,0,0,0,240,48,1,0,0,0,241,242,7,4,0,0,242,243,7,12,
+        0,0,243,251,7,17,0,0,244,245,7,4,0,0,245,246,7,12,0,0,246,251,7,
+        17,0,0,247,248,7,4,0,0,248,249,7,12,0,0,249,251,7,17,0,0,250,241,
+        1,0,0,0,250,244,1,0,0,0,250,247,1,0,0,0,251,50,1,0,0,0,252,253,7,
+        21,0,0,253,254,7,8,0,0,254,255,7,6,0,0,255,265,7,3,0,0,256,257,7,
+        21,0,0,257,258,7,8,0,0,258,259,7,6,0,0,259,265,7,3,0,0,260,261,7,
+        21,0,0,261,262,7,8,0,0,262,263,7,6,0,0,263,265,7,3,0,0,264,252,1,
+        0,0,0,264,256,1,0,0,0,264,260,1,0,0,0,265,52,1,0,0,0,266,267,7,6,
+        0,0,267,268,7,4,0,0,268,269,7,12,0,0,269,291,7,17,0,0,270,271,7,
+        22,0,0,271,272,7,8,0,0,272,273,7,5,0,0,273,291,7,17,0,0,274,275,
+        7,6,0,0,275,276,7,4,0,0,276,277,7,12,0,0,277,291,7,17,0,0,278,279,
+        7,22,0,0,279,280,7,8,0,0,280,281,7,5,0,0,281,291,7,17,0,0,282,283,
+        7,6,0,0,283,284,7,4,0,0,284,285,7,12,0,0,285,291,7,17,0,0,286,287,
+        7,22,0,0,287,288,7,8,0,0,288,289,7,5,0,0,289,291,7,17,0,0,290,266,
+        1,0,0,0,290,270,1,0,0,0,290,274,1,0,0,0,290,278,1,0,0,0,290,282,
+        1,0,0,0,290,286,1,0,0,0,291,54,1,0,0,0,292,293,7,9,0,0,293,294,7,
+        5,0,0,294,295,7,16,0,0,295,296,7,8,0,0,296,297,7,1,0,0,297,329,7,
+        2,0,0,298,299,7,11,0,0,299,300,7,9,0,0,300,301,7,5,0,0,301,302,7,
+        0,0,0,302,303,7,3,0,0,303,329,7,5,0,0,304,305,7,9,0,0,305,306,7,
+        5,0,0,306,307,7,16,0,0,307,308,7,8,0,0,308,309,7,1,0,0,309,329,7,
+        2,0,0,310,311,7,11,0,0,311,312,7,9,0,0,312,313,7,5,0,0,313,314,7,
+        0,0,0,314,315,7,3,0,0,315,329,7,5,0,0,316,317,7,9,0,0,317,318,7,
+        5,0,0,318,319,7,16,0,0,319,320,7,8,0,0,320,321,7,1,0,0,321,329,7,
+        2,0,0,322,323,7,11,0,0,323,324,7,9,0,0,324,325,7,5,0,0,325,326,7,
+        0,0,0,326,327,7,3,0,0,327,329,7,5,0,0,328,292,1,0,0,0,328,298,1,
+        0,0,0,328,304,1,0,0,0,328,310,1,0,0,0,328,316,1,0,0,0,328,322,1,
+        0,0,0,329,56,1,0,0,0,330,331,7,2,0,0,331,332,7,5,0,0,332,333,7,21,
+        0,0,333,334,7,5,0,0,334,335,7,3,0,0,335,367,7,5,0,0,336,337,7,9,
+        0,0,337,338,7,5,0,0,338,339,7,16,0,0,339,340,7,12,0,0,340,341,7,
+        22,0,0,341,367,7,5,0,0,342,343,7,2,0,0,343,344,7,5,0,0,344,345,7,
+        21,0,0,345,346,7,5,0,0,346,347,7,3,0,0,347,367,7,5,0,0,348,349,7,
+        9,0,0,349,350,7,5,0,0,350,351,7,16,0,0,351,352,7,12,0,0,352,353,
+        7,22,0,0,353,367,7,5,0,0,354,355,7,2,0,0,355,356,7,5,0,0,356,357,
+        7,21,0,0,357,358,7,5,0,0,358,359,7,3,0,0,359,367,7,5,0,0,360,361,
+        7,9,0,0,361,362,7,5,0,0,362,363,7,16,0,0,363,364,7,12,0,0,364,365,
+        7,22,0,0,365,367,7,5,0,0,366,330,1,0,0,0,366,336,1,0,0,0,366,342,
+        1,0,0,0,366,348,1,0,0,0,366,354,1,0,0,0,366,360,1,0,0,0,367,58,1,
+        0,0,0,368,369,7,10,0,0,369,370,7,20,0,0,370,371,7,2,0,0,371,372,
+        7,0,0,0,372,373,7,3,0,0,373,405,7,5,0,0,374,375,7,16,0,0,375,376,
+        7,12,0,0,376,377,7,2,0,0,377,378,7,8,0,0,378,379,7,15,0,0,379,405,
+        7,18,0,0,380,381,7,10,0,0,381,382,7,20,0,0,382,383,7,2,0,0,383,384,
+        7,0,0,0,384,385,7,3,0,0,385,405,7,5,0,0,386,387,7,16,0,0,387,388,
+        7,12,0,0,388,389,7,2,0,0,389,390,7,8,0,0,390,391,7,15,0,0,391,405,
+        7,18,0,0,392,393,7,10,0,0,393,394,7,20,0,0,394,395,7,2,0,0,395,396,
+        7,0,0,0,396,397,7,3,0,0,397,405,7,5,0,0,398,399,7,16,0,0,399,400,
+        7,12,0,0,400,401,7,2,0,0,401,402,7,8,0,0,402,403,7,15,0,0,403,405,
+        7,18,0,0,404,368,1,0,0,0,404,374,1,0,0,0,404,380,1,0,0,0,404,386,
+        1,0,0,0,404,392,1,0,0,0,404,398,1,0,0,0,405,60,1,0,0,0,406,407,7,
+        8,0,0,407,408,7,1,0,0,408,62,1,0,0,0,409,410,7,0,0,0,410,411,7,3,
+        0,0,411,64,1,0,0,0,412,413,7,9,0,0,413,414,7,5,0,0,414,415,7,20,
+        0,0,415,416,7,5,0,0,416,417,7,0,0,0,417,418,7,3,0,0,418,66,1,0,0,
+        0,419,420,7,5,0,0,420,421,7,22,0,0,421,422,7,5,0,0,422,423,7,9,0,
+        0,423,424,7,18,0,0,424,68,1,0,0,0,425,426,7,0,0,0,426,427,7,6,0,
+        0,427,70,1,0,0,0,428,429,7,6,0,0,429,430,7,5,0,0,430,431,7,3,0,0,
+        431,72,1,0,0,0,432,433,7,18,0,0,433,434,7,5,0,0,434,457,7,6,0,0,
+        435,436,7,18,0,0,436,437,7,5,0,0,437,457,7,20,0,0,438,439,7,12,0,
+        0,439,457,7,7,0,0,440,441,7,18,0,0,441,442,7,5,0,0,442,457,7,6,0,
+        0,443,444,7,18,0,0,444,445,7,5,0,0,445,457,7,20,0,0,446,447,7,12,
+        0,0,447,457,7,7,0,0,448,449,7,18,0,0,449,450,7,5,0,0,450,457,7,6,
+        0,0,451,452,7,18,0,0,452,453,7,5,0,0,453,457,7,20,0,0,454,455,7,
+        12,0,0,455,457,7,7,0,0,456,432,1,0,0,0,456,435,1,0,0,0,456,438,1,
+        0,0,0,456,440,1,0,0,0,456,443,1,0,0,0,456,446,1,0,0,0,456,448,1,
+        0,0,0,456,451,1,0,0,0,456,454,1,0,0,0,457,74,1,0,0,0,458,459,7,1,
+        0,0,459,477,7,12,0,0,460,461,7,1,0,0,461,462,7,12,0,0,462,463,7,
+        20,0,0,463,477,7,5,0,0,464,465,7,1,0,0,465,477,7,12,0,0,466,467,
+        7,1,0,0,467,468,7,12,0,0,468,469,7,20,0,0,469,477,7,5,0,0,470,471,
+        7,1,0,0,471,477,7,12,0,0,472,473,7,1,0,0,473,474,7,12,0,0,474,475,
+        7,20,0,0,475,477,7,5,0,0,476,458,1,0,0,0,476,460,1,0,0,0,476,464,
+        1,0,0,0,476,466,1,0,0,0,476,470,1,0,0,0,476,472,1,0,0,0,477,76,1,
+        0,0,0,478,479,7,20,0,0,479,480,7,5,0,0,480,481,7,1,0,0,481,482,7,
+        2,0,0,482,483,7,8,0,0,483,484,7,1,0,0,484,500,7,13,0,0,485,486,7,
+        2,0,0,486,487,7,12,0,0,487,488,7,1,0,0,488,500,7,5,0,0,489,490,7,
+        8,0,0,490,491,7,1,0,0,491,492,7,20,0,0,492,493,7,9,0,0,493,494,7,
+        12,0,0,494,495,7,13,0,0,495,496,7,9,0,0,496,497,7,5,0,0,497,498,
+        7,6,0,0,498,500,7,6,0,0,499,478,1,0,0,0,499,485,1,0,0,0,499,489,
+        1,0,0,0,500,78,1,0,0,0,501,502,7,16,0,0,502,503,7,8,0,0,503,504,
+        7,1,0,0,504,505,7,10,0,0,505,506,7,3,0,0,506,515,7,5,0,0,507,508,
+        7,16,0,0,508,509,7,8,0,0,509,510,7,1,0,0,510,511,7,10,0,0,511,512,
+        7,3,0,0,512,513,7,5,0,0,513,515,7,6,0,0,514,501,1,0,0,0,514,507,
+        1,0,0,0,515,80,1,0,0,0,516,517,7,4,0,0,517,518,7,12,0,0,518,519,
+        7,10,0,0,519,526,7,9,0,0,520,521,7,4,0,0,521,522,7,12,0,0,522,523,
+        7,10,0,0,523,524,7,9,0,0,524,526,7,6,0,0,525,516,1,0,0,0,525,520,
+        1,0,0,0,526,82,1,0,0,0,527,528,7,2,0,0,528,529,7,0,0,0,529,535,7,
+        18,0,0,530,531,7,2,0,0,531,532,7,0,0,0,532,533,7,18,0,0,533,535,
+        7,6,0,0,534,527,1,0,0,0,534,530,1,0,0,0,535,84,1,0,0,0,536,537,7,
+        23,0,0,537,538,7,23,0,0,538,539,7,23,0,0,539,540,7,23,0,0,540,541,
+        5,45,0,0,541,542,7,23,0,0,542,543,7,23,0,0,543,544,5,45,0,0,544,
+        545,7,23,0,0,545,546,7,23,0,0,546,86,1,0,0,0,547,548,7,23,0,0,548,
+        549,7,23,0,0,549,550,5,58,0,0,550,551,7,23,0,0,551,552,7,23,0,0,
+        552,88,1,0,0,0,553,555,7,23,0,0,554,553,1,0,0,0,555,556,1,0,0,0,
+        556,554,1,0,0,0,556,557,1,0,0,0,557,90,1,0,0,0,558,562,7,24,0,0,
+        559,561,7,25,0,0,560,559,1,0,0,0,561,564,1,0,0,0,562,560,1,0,0,0,
+        562,563,1,0,0,0,563,92,1,0,0,0,564,562,1,0,0,0,565,567,7,26,0,0,
+        566,565,1,0,0,0,567,568,1,0,0,0,568,566,1,0,0,0,568,569,1,0,0,0,
+        569,570,1,0,0,0,570,571,6,46,0,0,571,94,1,0,0,0,17,0,239,250,264,
+        290,328,366,404,456,476,499,514,525,534,556,562,568,1,6,0,0
     ]
 
 class AssistantDSLLexer(Lexer):
@@ -234,41 +245,47 @@ class AssistantDSLLexer(Lexer):
     T__14 = 15
     T__15 = 16
     T__16 = 17
-    QUESTION = 18
-    KGREETING = 19
-    KASKING = 20
-    KSUPPORT = 21
-    KVIEW = 22
-    KCREATE = 23
-    KDELETE = 24
-    KMODIFY = 25
-    IN = 26
-    AT = 27
-    REPEAT = 28
-    EVERY = 29
-    AS = 30
-    SET = 31
-    YES = 32
-    NO = 33
-    STATUS = 34
-    MINUTE = 35
-    HOUR = 36
-    DAY = 37
-    DATE = 38
-    TIME = 39
-    INT = 40
-    IDENTIFIER = 41
-    WS = 42
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    T__20 = 21
+    T__21 = 22
+    QUESTION = 23
+    KGREETING = 24
+    KASKING = 25
+    KSUPPORT = 26
+    KVIEW = 27
+    KCREATE = 28
+    KDELETE = 29
+    KMODIFY = 30
+    IN = 31
+    AT = 32
+    REPEAT = 33
+    EVERY = 34
+    AS = 35
+    SET = 36
+    YES = 37
+    NO = 38
+    STATUS = 39
+    MINUTE = 40
+    HOUR = 41
+    DAY = 42
+    DATE = 43
+    TIME = 44
+    INT = 45
+    IDENTIFIER = 46
+    WS = 47
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
     modeNames = [ "DEFAULT_MODE" ]
 
     literalNames = [ "<INVALID>",
-            "'tasks'", "'instructions'", "'greeting'", "'bot'", "'information'", 
-            "'what'", "'is'", "'your'", "'name'", "'my'", "'are'", "'you'", 
-            "','", "'='", "'me'", "'to'", "'task'", "'?'", "'in'", "'at'", 
-            "'repeat'", "'every'", "'as'", "'set'" ]
+            "'and'", "'then'", "'tasks'", "'instructions'", "'greeting'", 
+            "'bot'", "'information'", "'what'", "'is'", "'your'", "'name'", 
+            "'my'", "'are'", "'you'", "'next'", "'page'", "'more'", "','", 
+            "'='", "'me'", "'to'", "'task'", "'?'", "'in'", "'at'", "'repeat'", 
+            "'every'", "'as'", "'set'" ]
 
     symbolicNames = [ "<INVALID>",
             "QUESTION", "KGREETING", "KASKING", "KSUPPORT", "KVIEW", "KCREATE", 
@@ -278,7 +295,8 @@ class AssistantDSLLexer(Lexer):
 
     ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
                   "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
-                  "T__14", "T__15", "T__16", "QUESTION", "KGREETING", "KASKING", 
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "T__20", "T__21", "QUESTION", "KGREETING", "KASKING", 
                   "KSUPPORT", "KVIEW", "KCREATE", "KDELETE", "KMODIFY", 
                   "IN", "AT", "REPEAT", "EVERY", "AS", "SET", "YES", "NO", 
                   "STATUS", "MINUTE", "HOUR", "DAY", "DATE", "TIME", "INT", 
@@ -17,6 +17,15 @@ class AssistantDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by AssistantDSLParser#commandSep.
+    def enterCommandSep(self, ctx:AssistantDSLParser.CommandSepContext):
+        pass
+
+    # Exit a parse tree produced by AssistantDSLParser#commandSep.
+    def exitCommandSep(self, ctx:AssistantDSLParser.CommandSepContext):
+        pass
+
+
     # Enter a parse tree produced by AssistantDSLParser#command.
     def enterCommand(self, ctx:AssistantDSLParser.CommandContext):
         pass
@@ -134,6 +143,15 @@ class AssistantDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by AssistantDSLParser#pageAction.
+    def enterPageAction(self, ctx:AssistantDSLParser.PageActionContext):
+        pass
+
+    # Exit a parse tree produced by AssistantDSLParser#pageAction.
+    def exitPageAction(self, ctx:AssistantDSLParser.PageActionContext):
+        pass
+
+
     # Enter a parse tree produced by AssistantDSLParser#deleteAction.
     def enterDeleteAction(self, ctx:AssistantDSLParser.DeleteActionContext):
         pass
@@ -206,6 +224,15 @@ class AssistantDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by AssistantDSLParser#word.
+    def enterWord(self, ctx:AssistantDSLParser.WordContext):
+        pass
+
+    # Exit a parse tree produced by AssistantDSLParser#word.
+    def exitWord(self, ctx:AssistantDSLParser.WordContext):
+        pass
+
+
     # Enter a parse tree produced by AssistantDSLParser#affirmative.
     def enterAffirmative(self, ctx:AssistantDSLParser.AffirmativeContext):
         pass
@@ -10,75 +10,87 @@ else:
 
 def serializedATN():
     return [
-        4,1,42,209,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,47,241,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
         2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
         7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
-        2,27,7,27,2,28,7,28,2,29,7,29,1,0,1,0,1,0,1,1,1,1,1,1,1,1,3,1,68,
-        8,1,1,2,1,2,1,2,3,2,73,8,2,1,3,1,3,1,3,1,3,3,3,79,8,3,1,4,1,4,1,
-        4,3,4,84,8,4,1,5,1,5,3,5,88,8,5,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,7,
-        1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,3,9,107,8,9,1,10,1,10,1,10,1,
-        10,1,10,3,10,114,8,10,1,11,1,11,1,11,1,11,3,11,120,8,11,1,12,1,12,
-        1,12,3,12,125,8,12,1,12,3,12,128,8,12,1,12,3,12,131,8,12,1,13,1,
-        13,1,13,1,14,1,14,1,14,3,14,139,8,14,1,15,1,15,1,15,3,15,144,8,15,
-        1,15,1,15,1,15,1,15,5,15,150,8,15,10,15,12,15,153,9,15,1,16,1,16,
-        1,16,1,16,1,16,1,16,3,16,161,8,16,1,17,1,17,1,18,1,18,1,18,3,18,
-        168,8,18,1,18,1,18,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,21,1,21,
-        5,21,181,8,21,10,21,12,21,184,9,21,1,22,1,22,1,23,1,23,1,24,1,24,
-        1,25,1,25,1,26,1,26,1,27,1,27,3,27,198,8,27,1,27,3,27,201,8,27,1,
-        28,1,28,1,28,1,29,1,29,1,29,1,29,0,0,30,0,2,4,6,8,10,12,14,16,18,
-        20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,0,2,
-        1,0,35,37,2,0,34,34,41,41,203,0,60,1,0,0,0,2,67,1,0,0,0,4,72,1,0,
-        0,0,6,78,1,0,0,0,8,83,1,0,0,0,10,87,1,0,0,0,12,89,1,0,0,0,14,93,
-        1,0,0,0,16,97,1,0,0,0,18,101,1,0,0,0,20,108,1,0,0,0,22,115,1,0,0,
-        0,24,121,1,0,0,0,26,132,1,0,0,0,28,135,1,0,0,0,30,140,1,0,0,0,32,
-        160,1,0,0,0,34,162,1,0,0,0,36,164,1,0,0,0,38,171,1,0,0,0,40,174,
-        1,0,0,0,42,178,1,0,0,0,44,185,1,0,0,0,46,187,1,0,0,0,48,189,1,0,
-        0,0,50,191,1,0,0,0,52,193,1,0,0,0,54,195,1,0,0,0,56,202,1,0,0,0,
-        58,205,1,0,0,0,60,61,3,2,1,0,61,62,5,0,0,1,62,1,1,0,0,0,63,68,3,
-        4,2,0,64,68,3,6,3,0,65,68,3,8,4,0,66,68,3,10,5,0,67,63,1,0,0,0,67,
-        64,1,0,0,0,67,65,1,0,0,0,67,66,1,0,0,0,68,3,1,0,0,0,69,73,3,18,9,
-        0,70,73,3,20,10,0,71,73,3,22,11,0,72,69,1,0,0,0,72,70,1,0,0,0,72,
-        71,1,0,0,0,73,5,1,0,0,0,74,79,3,24,12,0,75,79,3,26,13,0,76,79,3,
-        28,14,0,77,79,3,30,15,0,78,74,1,0,0,0,78,75,1,0,0,0,78,76,1,0,0,
-        0,78,77,1,0,0,0,79,7,1,0,0,0,80,84,3,12,6,0,81,84,3,14,7,0,82,84,
-        3,16,8,0,83,80,1,0,0,0,83,81,1,0,0,0,83,82,1,0,0,0,84,9,1,0,0,0,
-        85,88,3,44,22,0,86,88,3,46,23,0,87,85,1,0,0,0,87,86,1,0,0,0,88,11,
-        1,0,0,0,89,90,5,21,0,0,90,91,5,1,0,0,91,92,5,2,0,0,92,13,1,0,0,0,
-        93,94,5,21,0,0,94,95,5,3,0,0,95,96,5,2,0,0,96,15,1,0,0,0,97,98,5,
-        21,0,0,98,99,5,4,0,0,99,100,5,5,0,0,100,17,1,0,0,0,101,102,5,6,0,
-        0,102,103,5,7,0,0,103,104,5,8,0,0,104,106,5,9,0,0,105,107,5,18,0,
-        0,106,105,1,0,0,0,106,107,1,0,0,0,107,19,1,0,0,0,108,113,3,50,25,
-        0,109,110,5,10,0,0,110,111,5,9,0,0,111,112,5,7,0,0,112,114,5,41,
-        0,0,113,109,1,0,0,0,113,114,1,0,0,0,114,21,1,0,0,0,115,116,3,52,
-        26,0,116,117,5,11,0,0,117,119,5,12,0,0,118,120,5,18,0,0,119,118,
-        1,0,0,0,119,120,1,0,0,0,120,23,1,0,0,0,121,122,3,54,27,0,122,124,
-        3,42,21,0,123,125,3,32,16,0,124,123,1,0,0,0,124,125,1,0,0,0,125,
-        127,1,0,0,0,126,128,3,36,18,0,127,126,1,0,0,0,127,128,1,0,0,0,128,
-        130,1,0,0,0,129,131,3,38,19,0,130,129,1,0,0,0,130,131,1,0,0,0,131,
-        25,1,0,0,0,132,133,5,22,0,0,133,134,5,1,0,0,134,27,1,0,0,0,135,136,
-        3,56,28,0,136,138,3,42,21,0,137,139,3,32,16,0,138,137,1,0,0,0,138,
-        139,1,0,0,0,139,29,1,0,0,0,140,141,3,58,29,0,141,143,3,42,21,0,142,
-        144,3,32,16,0,143,142,1,0,0,0,143,144,1,0,0,0,144,145,1,0,0,0,145,
-        146,5,31,0,0,146,151,3,40,20,0,147,148,5,13,0,0,148,150,3,40,20,
-        0,149,147,1,0,0,0,150,153,1,0,0,0,151,149,1,0,0,0,151,152,1,0,0,
-        0,152,31,1,0,0,0,153,151,1,0,0,0,154,155,5,26,0,0,155,156,5,40,0,
-        0,156,161,3,34,17,0,157,158,5,27,0,0,158,159,5,38,0,0,159,161,5,
-        39,0,0,160,154,1,0,0,0,160,157,1,0,0,0,161,33,1,0,0,0,162,163,7,
-        0,0,0,163,35,1,0,0,0,164,165,5,28,0,0,165,167,5,29,0,0,166,168,5,
-        40,0,0,167,166,1,0,0,0,167,168,1,0,0,0,168,169,1,0,0,0,169,170,3,
-        34,17,0,170,37,1,0,0,0,171,172,5,30,0,0,172,173,5,34,0,0,173,39,
-        1,0,0,0,174,175,5,41,0,0,175,176,5,14,0,0,176,177,7,1,0,0,177,41,
-        1,0,0,0,178,182,5,41,0,0,179,181,5,41,0,0,180,179,1,0,0,0,181,184,
-        1,0,0,0,182,180,1,0,0,0,182,183,1,0,0,0,183,43,1,0,0,0,184,182,1,
-        0,0,0,185,186,5,32,0,0,186,45,1,0,0,0,187,188,5,33,0,0,188,47,1,
-        0,0,0,189,190,1,0,0,0,190,49,1,0,0,0,191,192,5,19,0,0,192,51,1,0,
-        0,0,193,194,5,20,0,0,194,53,1,0,0,0,195,197,5,23,0,0,196,198,5,15,
-        0,0,197,196,1,0,0,0,197,198,1,0,0,0,198,200,1,0,0,0,199,201,5,16,
-        0,0,200,199,1,0,0,0,200,201,1,0,0,0,201,55,1,0,0,0,202,203,5,24,
-        0,0,203,204,5,17,0,0,204,57,1,0,0,0,205,206,5,25,0,0,206,207,5,17,
-        0,0,207,59,1,0,0,0,19,67,72,78,83,87,106,113,119,124,127,130,138,
-        143,151,160,167,182,197,200
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,1,0,
+        1,0,1,0,1,0,5,0,71,8,0,10,0,12,0,74,9,0,1,0,1,0,1,1,1,1,3,1,80,8,
+        1,1,2,1,2,1,2,1,2,3,2,86,8,2,1,3,1,3,1,3,3,3,91,8,3,1,4,1,4,1,4,
+        1,4,1,4,3,4,98,8,4,1,5,1,5,1,5,3,5,103,8,5,1,6,1,6,3,6,107,8,6,1,
+        7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,
+        1,10,3,10,126,8,10,1,11,1,11,1,11,1,11,1,11,3,11,133,8,11,1,12,1,
+        12,1,12,1,12,3,12,139,8,12,1,13,1,13,1,13,3,13,144,8,13,1,13,3,13,
+        147,8,13,1,13,3,13,150,8,13,1,14,1,14,1,14,1,15,1,15,1,15,3,15,158,
+        8,15,1,15,1,15,3,15,162,8,15,3,15,164,8,15,1,16,1,16,1,16,3,16,169,
+        8,16,1,17,1,17,1,17,3,17,174,8,17,1,17,1,17,1,17,1,17,5,17,180,8,
+        17,10,17,12,17,183,9,17,1,18,1,18,1,18,1,18,1,18,1,18,3,18,191,8,
+        18,1,19,1,19,1,20,1,20,1,20,3,20,198,8,20,1,20,1,20,1,21,1,21,1,
+        21,1,22,1,22,1,22,1,22,3,22,209,8,22,1,23,4,23,212,8,23,11,23,12,
+        23,213,1,24,1,24,1,25,1,25,1,26,1,26,1,27,1,27,1,28,1,28,1,29,1,
+        29,1,30,1,30,3,30,230,8,30,1,30,3,30,233,8,30,1,31,1,31,1,31,1,32,
+        1,32,1,32,1,32,0,0,33,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,
+        32,34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,0,2,1,0,40,42,
+        3,0,1,2,15,17,46,46,239,0,66,1,0,0,0,2,77,1,0,0,0,4,85,1,0,0,0,6,
+        90,1,0,0,0,8,97,1,0,0,0,10,102,1,0,0,0,12,106,1,0,0,0,14,108,1,0,
+        0,0,16,112,1,0,0,0,18,116,1,0,0,0,20,120,1,0,0,0,22,127,1,0,0,0,
+        24,134,1,0,0,0,26,140,1,0,0,0,28,151,1,0,0,0,30,163,1,0,0,0,32,165,
+        1,0,0,0,34,170,1,0,0,0,36,190,1,0,0,0,38,192,1,0,0,0,40,194,1,0,
+        0,0,42,201,1,0,0,0,44,204,1,0,0,0,46,211,1,0,0,0,48,215,1,0,0,0,
+        50,217,1,0,0,0,52,219,1,0,0,0,54,221,1,0,0,0,56,223,1,0,0,0,58,225,
+        1,0,0,0,60,227,1,0,0,0,62,234,1,0,0,0,64,237,1,0,0,0,66,72,3,4,2,
+        0,67,68,3,2,1,0,68,69,3,4,2,0,69,71,1,0,0,0,70,67,1,0,0,0,71,74,
+        1,0,0,0,72,70,1,0,0,0,72,73,1,0,0,0,73,75,1,0,0,0,74,72,1,0,0,0,
+        75,76,5,0,0,1,76,1,1,0,0,0,77,79,5,1,0,0,78,80,5,2,0,0,79,78,1,0,
+        0,0,79,80,1,0,0,0,80,3,1,0,0,0,81,86,3,6,3,0,82,86,3,8,4,0,83,86,
+        3,10,5,0,84,86,3,12,6,0,85,81,1,0,0,0,85,82,1,0,0,0,85,83,1,0,0,
+        0,85,84,1,0,0,0,86,5,1,0,0,0,87,91,3,20,10,0,88,91,3,22,11,0,89,
+        91,3,24,12,0,90,87,1,0,0,0,90,88,1,0,0,0,90,89,1,0,0,0,91,7,1,0,
+        0,0,92,98,3,26,13,0,93,98,3,28,14,0,94,98,3,30,15,0,95,98,3,32,16,
+        0,96,98,3,34,17,0,97,92,1,0,0,0,97,93,1,0,0,0,97,94,1,0,0,0,97,95,
+        1,0,0,0,97,96,1,0,0,0,98,9,1,0,0,0,99,103,3,14,7,0,100,103,3,16,
+        8,0,101,103,3,18,9,0,102,99,1,0,0,0,102,100,1,0,0,0,102,101,1,0,
+        0,0,103,11,1,0,0,0,104,107,3,50,25,0,105,107,3,52,26,0,106,104,1,
+        0,0,0,106,105,1,0,0,0,107,13,1,0,0,0,108,109,5,26,0,0,109,110,5,
+        3,0,0,110,111,5,4,0,0,111,15,1,0,0,0,112,113,5,26,0,0,113,114,5,
+        5,0,0,114,115,5,4,0,0,115,17,1,0,0,0,116,117,5,26,0,0,117,118,5,
+        6,0,0,118,119,5,7,0,0,119,19,1,0,0,0,120,121,5,8,0,0,121,122,5,9,
+        0,0,122,123,5,10,0,0,123,125,5,11,0,0,124,126,5,23,0,0,125,124,1,
+        0,0,0,125,126,1,0,0,0,126,21,1,0,0,0,127,132,3,56,28,0,128,129,5,
+        12,0,0,129,130,5,11,0,0,130,131,5,9,0,0,131,133,3,48,24,0,132,128,
+        1,0,0,0,132,133,1,0,0,0,133,23,1,0,0,0,134,135,3,58,29,0,135,136,
+        5,13,0,0,136,138,5,14,0,0,137,139,5,23,0,0,138,137,1,0,0,0,138,139,
+        1,0,0,0,139,25,1,0,0,0,140,141,3,60,30,0,141,143,3,46,23,0,142,144,
+        3,36,18,0,143,142,1,0,0,0,143,144,1,0,0,0,144,146,1,0,0,0,145,147,
+        3,40,20,0,146,145,1,0,0,0,146,147,1,0,0,0,147,149,1,0,0,0,148,150,
+        3,42,21,0,149,148,1,0,0,0,149,150,1,0,0,0,150,27,1,0,0,0,151,152,
+        5,27,0,0,152,153,5,3,0,0,153,29,1,0,0,0,154,155,5,15,0,0,155,164,
+        5,16,0,0,156,158,5,27,0,0,157,156,1,0,0,0,157,158,1,0,0,0,158,159,
+        1,0,0,0,159,161,5,17,0,0,160,162,5,3,0,0,161,160,1,0,0,0,161,162,
+        1,0,0,0,162,164,1,0,0,0,163,154,1,0,0,0,163,157,1,0,0,0,164,31,1,
+        0,0,0,165,166,3,62,31,0,166,168,3,46,23,0,167,169,3,36,18,0,168,
+        167,1,0,0,0,168,169,1,0,0,0,169,33,1,0,0,0,170,171,3,64,32,0,171,
+        173,3,46,23,0,172,174,3,36,18,0,173,172,1,0,0,0,173,174,1,0,0,0,
+        174,175,1,0,0,0,175,176,5,36,0,0,176,181,3,44,22,0,177,178,5,18,
+        0,0,178,180,3,44,22,0,179,177,1,0,0,0,180,183,1,0,0,0,181,179,1,
+        0,0,0,181,182,1,0,0,0,182,35,1,0,0,0,183,181,1,0,0,0,184,185,5,31,
+        0,0,185,186,5,45,0,0,186,191,3,38,19,0,187,188,5,32,0,0,188,189,
+        5,43,0,0,189,191,5,44,0,0,190,184,1,0,0,0,190,187,1,0,0,0,191,37,
+        1,0,0,0,192,193,7,0,0,0,193,39,1,0,0,0,194,195,5,33,0,0,195,197,
+        5,34,0,0,196,198,5,45,0,0,197,196,1,0,0,0,197,198,1,0,0,0,198,199,
+        1,0,0,0,199,200,3,38,19,0,200,41,1,0,0,0,201,202,5,35,0,0,202,203,
+        5,39,0,0,203,43,1,0,0,0,204,205,3,48,24,0,205,208,5,19,0,0,206,209,
+        3,48,24,0,207,209,5,39,0,0,208,206,1,0,0,0,208,207,1,0,0,0,209,45,
+        1,0,0,0,210,212,3,48,24,0,211,210,1,0,0,0,212,213,1,0,0,0,213,211,
+        1,0,0,0,213,214,1,0,0,0,214,47,1,0,0,0,215,216,7,1,0,0,216,49,1,
+        0,0,0,217,218,5,37,0,0,218,51,1,0,0,0,219,220,5,38,0,0,220,53,1,
+        0,0,0,221,222,1,0,0,0,222,55,1,0,0,0,223,224,5,24,0,0,224,57,1,0,
+        0,0,225,226,5,25,0,0,226,59,1,0,0,0,227,229,5,28,0,0,228,230,5,20,
+        0,0,229,228,1,0,0,0,229,230,1,0,0,0,230,232,1,0,0,0,231,233,5,21,
+        0,0,232,231,1,0,0,0,232,233,1,0,0,0,233,61,1,0,0,0,234,235,5,29,
+        0,0,235,236,5,22,0,0,236,63,1,0,0,0,237,238,5,30,0,0,238,239,5,22,
+        0,0,239,65,1,0,0,0,25,72,79,85,90,97,102,106,125,132,138,143,146,
+        149,157,161,163,168,173,181,190,197,208,213,229,232
     ]
 
 class AssistantDSLParser ( Parser ):
@@ -91,62 +103,67 @@ class AssistantDSLParser ( Parser ):
 
     sharedContextCache = PredictionContextCache()
 
-    literalNames = [ "<INVALID>", "'tasks'", "'instructions'", "'greeting'", 
-                     "'bot'", "'information'", "'what'", "'is'", "'your'", 
-                     "'name'", "'my'", "'are'", "'you'", "','", "'='", "'me'", 
-                     "'to'", "'task'", "'?'", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "'in'", "'at'", "'repeat'", "'every'", 
-                     "'as'", "'set'" ]
+    literalNames = [ "<INVALID>", "'and'", "'then'", "'tasks'", "'instructions'", 
+                     "'greeting'", "'bot'", "'information'", "'what'", "'is'", 
+                     "'your'", "'name'", "'my'", "'are'", "'you'", "'next'", 
+                     "'page'", "'more'", "','", "'='", "'me'", "'to'", "'task'", 
+                     "'?'", "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "<INVALID>", "'in'", "'at'", 
+                     "'repeat'", "'every'", "'as'", "'set'" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "<INVALID>", "<INVALID>", "QUESTION", "KGREETING", 
-                      "KASKING", "KSUPPORT", "KVIEW", "KCREATE", "KDELETE", 
-                      "KMODIFY", "IN", "AT", "REPEAT", "EVERY", "AS", "SET", 
-                      "YES", "NO", "STATUS", "MINUTE", "HOUR", "DAY", "DATE", 
-                      "TIME", "INT", "IDENTIFIER", "WS" ]
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "QUESTION", 
+                      "KGREETING", "KASKING", "KSUPPORT", "KVIEW", "KCREATE", 
+                      "KDELETE", "KMODIFY", "IN", "AT", "REPEAT", "EVERY", 
+                      "AS", "SET", "YES", "NO", "STATUS", "MINUTE", "HOUR", 
+                      "DAY", "DATE", "TIME", "INT", "IDENTIFIER", "WS" ]
 
     RULE_program = 0
-    RULE_command = 1
-    RULE_greetingCommand = 2
-    RULE_actionCommand = 3
-    RULE_supportCommand = 4
-    RULE_confirmCommand = 5
-    RULE_supportTasks = 6
-    RULE_supportGreetings = 7
-    RULE_supportInfor = 8
-    RULE_introduce = 9
-    RULE_greeting = 10
-    RULE_asking = 11
-    RULE_createAction = 12
-    RULE_viewAction = 13
-    RULE_deleteAction = 14
-    RULE_modifyAction = 15
-    RULE_dueSpec = 16
-    RULE_timeUnit = 17
-    RULE_rruleClause = 18
-    RULE_statusClause = 19
-    RULE_fieldAssign = 20
-    RULE_taskTitle = 21
-    RULE_affirmative = 22
-    RULE_negative = 23
-    RULE_kintroduce = 24
-    RULE_kgreeting = 25
-    RULE_kasking = 26
-    RULE_kcreate = 27
-    RULE_kdelete = 28
-    RULE_kmodify = 29
-
-    ruleNames =  [ "program", "command", "greetingCommand", "actionCommand", 
-                   "supportCommand", "confirmCommand", "supportTasks", "supportGreetings", 
-                   "supportInfor", "introduce", "greeting", "asking", "createAction", 
-                   "viewAction", "deleteAction", "modifyAction", "dueSpec", 
-                   "timeUnit", "rruleClause", "statusClause", "fieldAssign", 
-                   "taskTitle", "affirmative", "negative", "kintroduce", 
-                   "kgreeting", "kasking", "kcreate", "kdelete", "kmodify" ]
+    RULE_commandSep = 1
+    RULE_command = 2
+    RULE_greetingCommand = 3
+    RULE_actionCommand = 4
+    RULE_supportCommand = 5
+    RULE_confirmCommand = 6
+    RULE_supportTasks = 7
+    RULE_supportGreetings = 8
+    RULE_supportInfor = 9
+    RULE_introduce = 10
+    RULE_greeting = 11
+    RULE_asking = 12
+    RULE_createAction = 13
+    RULE_viewAction = 14
+    RULE_pageAction = 15
+    RULE_deleteAction = 16
+    RULE_modifyAction = 17
+    RULE_dueSpec = 18
+    RULE_timeUnit = 19
+    RULE_rruleClause = 20
+    RULE_statusClause = 21
+    RULE_fieldAssign = 22
+    RULE_taskTitle = 23
+    RULE_word = 24
+    RULE_affirmative = 25
+    RULE_negative = 26
+    RULE_kintroduce = 27
+    RULE_kgreeting = 28
+    RULE_kasking = 29
+    RULE_kcreate = 30
+    RULE_kdelete = 31
+    RULE_kmodify = 32
+
+    ruleNames =  [ "program", "commandSep", "command", "greetingCommand", 
+                   "actionCommand", "supportCommand", "confirmCommand", 
+                   "supportTasks", "supportGreetings", "supportInfor", "introduce", 
+                   "greeting", "asking", "createAction", "viewAction", "pageAction", 
+                   "deleteAction", "modifyAction", "dueSpec", "timeUnit", 
+                   "rruleClause", "statusClause", "fieldAssign", "taskTitle", 
+                   "word", "affirmative", "negative", "kintroduce", "kgreeting", 
+                   "kasking", "kcreate", "kdelete", "kmodify" ]
 
     EOF = Token.EOF
     T__0=1
@@ -166,31 +183,36 @@ class AssistantDSLParser ( Parser ):
     T__14=15
     T__15=16
     T__16=17
-    QUESTION=18
-    KGREETING=19
-    KASKING=20
-    KSUPPORT=21
-    KVIEW=22
-    KCREATE=23
-    KDELETE=24
-    KMODIFY=25
-    IN=26
-    AT=27
-    REPEAT=28
-    EVERY=29
-    AS=30
-    SET=31
-    YES=32
-    NO=33
-    STATUS=34
-    MINUTE=35
-    HOUR=36
-    DAY=37
-    DATE=38
-    TIME=39
-    INT=40
-    IDENTIFIER=41
-    WS=42
+    T__17=18
+    T__18=19
+    T__19=20
+    T__20=21
+    T__21=22
+    QUESTION=23
+    KGREETING=24
+    KASKING=25
+    KSUPPORT=26
+    KVIEW=27
+    KCREATE=28
+    KDELETE=29
+    KMODIFY=30
+    IN=31
+    AT=32
+    REPEAT=33
+    EVERY=34
+    AS=35
+    SET=36
+    YES=37
+    NO=38
+    STATUS=39
+    MINUTE=40
+    HOUR=41
+    DAY=42
+    DATE=43
+    TIME=44
+    INT=45
+    IDENTIFIER=46
+    WS=47
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -208,13 +230,23 @@ class AssistantDSLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def command(self):
-            return self.getTypedRuleContext(AssistantDSLParser.CommandContext,0)
+        def command(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(AssistantDSLParser.CommandContext)
+            else:
+                return self.getTypedRuleContext(AssistantDSLParser.CommandContext,i)
 
 
         def EOF(self):
             return self.getToken(AssistantDSLParser.EOF, 0)
 
+        def commandSep(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(AssistantDSLParser.CommandSepContext)
+            else:
+                return self.getTypedRuleContext(AssistantDSLParser.CommandSepContext,i)
+
+
         def getRuleIndex(self):
             return AssistantDSLParser.RULE_program
 
@@ -239,11 +271,24 @@ class AssistantDSLParser ( Parser ):
 
         localctx = AssistantDSLParser.ProgramContext(self, self._ctx, self.state)
         self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 60
+            self.state = 66
             self.command()
-            self.state = 61
+            self.state = 72
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==1:
+                self.state = 67
+                self.commandSep()
+                self.state = 68
+                self.command()
+                self.state = 74
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 75
             self.match(AssistantDSLParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -254,6 +299,60 @@ class AssistantDSLParser ( Parser ):
         return localctx
 
 
+    class CommandSepContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return AssistantDSLParser.RULE_commandSep
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCommandSep" ):
+                listener.enterCommandSep(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCommandSep" ):
+                listener.exitCommandSep(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCommandSep" ):
+                return visitor.visitCommandSep(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def commandSep(self):
+
+        localctx = AssistantDSLParser.CommandSepContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_commandSep)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 77
+            self.match(AssistantDSLParser.T__0)
+            self.state = 79
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==2:
+                self.state = 78
+                self.match(AssistantDSLParser.T__1)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class CommandContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -300,29 +399,29 @@ class AssistantDSLParser ( Parser ):
     def command(self):
 
         localctx = AssistantDSLParser.CommandContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 2, self.RULE_command)
+        self.enterRule(localctx, 4, self.RULE_command)
         try:
-            self.state = 67
+            self.state = 85
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [6, 19, 20]:
+            if token in [8, 24, 25]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 63
+                self.state = 81
                 self.greetingCommand()
                 pass
-            elif token in [22, 23, 24, 25]:
+            elif token in [15, 17, 27, 28, 29, 30]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 64
+                self.state = 82
                 self.actionCommand()
                 pass
-            elif token in [21]:
+            elif token in [26]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 65
+                self.state = 83
                 self.supportCommand()
                 pass
-            elif token in [32, 33]:
+            elif token in [37, 38]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 66
+                self.state = 84
                 self.confirmCommand()
                 pass
             else:
@@ -379,24 +478,24 @@ class AssistantDSLParser ( Parser ):
     def greetingCommand(self):
 
         localctx = AssistantDSLParser.GreetingCommandContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 4, self.RULE_greetingCommand)
+        self.enterRule(localctx, 6, self.RULE_greetingCommand)
         try:
-            self.state = 72
+            self.state = 90
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [6]:
+            if token in [8]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 69
+                self.state = 87
                 self.introduce()
                 pass
-            elif token in [19]:
+            elif token in [24]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 70
+                self.state = 88
                 self.greeting()
                 pass
-            elif token in [20]:
+            elif token in [25]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 71
+                self.state = 89
                 self.asking()
                 pass
             else:
@@ -426,6 +525,10 @@ class AssistantDSLParser ( Parser ):
             return self.getTypedRuleContext(AssistantDSLParser.ViewActionContext,0)
 
 
+        def pageAction(self):
+            return self.getTypedRuleContext(AssistantDSLParser.PageActionContext,0)
+
+
         def deleteAction(self):
             return self.getTypedRuleContext(AssistantDSLParser.DeleteActionContext,0)
 
@@ -457,33 +560,41 @@ class AssistantDSLParser ( Parser ):
     def actionCommand(self):
 
         localctx = AssistantDSLParser.ActionCommandContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 6, self.RULE_actionCommand)
+        self.enterRule(localctx, 8, self.RULE_actionCommand)
         try:
-            self.state = 78
+            self.state = 97
             self._errHandler.sync(self)
-            token = self._input.LA(1)
-            if token in [23]:
+            la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
+            if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 74
+                self.state = 92
                 self.createAction()
                 pass
-            elif token in [22]:
+
+            elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 75
+                self.state = 93
                 self.viewAction()
                 pass
-            elif token in [24]:
+
+            elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 76
-                self.deleteAction()
+                self.state = 94
+                self.pageAction()
                 pass
-            elif token in [25]:
+
+            elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 77
+                self.state = 95
+                self.deleteAction()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 96
                 self.modifyAction()
                 pass
-            else:
-                raise NoViableAltException(self)
+
 
         except RecognitionException as re:
             localctx.exception = re
@@ -536,26 +647,26 @@ class AssistantDSLParser ( Parser ):
     def supportCommand(self):
 
         localctx = AssistantDSLParser.SupportCommandContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 8, self.RULE_supportCommand)
+        self.enterRule(localctx, 10, self.RULE_supportCommand)
         try:
-            self.state = 83
+            self.state = 102
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 80
+                self.state = 99
                 self.supportTasks()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 81
+                self.state = 100
                 self.supportGreetings()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 82
+                self.state = 101
                 self.supportInfor()
                 pass
 
@@ -607,19 +718,19 @@ class AssistantDSLParser ( Parser ):
     def confirmCommand(self):
 
         localctx = AssistantDSLParser.ConfirmCommandContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 10, self.RULE_confirmCommand)
+        self.enterRule(localctx, 12, self.RULE_confirmCommand)
         try:
-            self.state = 87
+            self.state = 106
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [32]:
+            if token in [37]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 85
+                self.state = 104
                 self.affirmative()
                 pass
-            elif token in [33]:
+            elif token in [38]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 86
+                self.state = 105
                 self.negative()
                 pass
             else:
@@ -667,15 +778,15 @@ class AssistantDSLParser ( Parser ):
     def supportTasks(self):
 
         localctx = AssistantDSLParser.SupportTasksContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_supportTasks)
+        self.enterRule(localctx, 14, self.RULE_supportTasks)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 89
+            self.state = 108
             self.match(AssistantDSLParser.KSUPPORT)
-            self.state = 90
-            self.match(AssistantDSLParser.T__0)
-            self.state = 91
-            self.match(AssistantDSLParser.T__1)
+            self.state = 109
+            self.match(AssistantDSLParser.T__2)
+            self.state = 110
+            self.match(AssistantDSLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -718,15 +829,15 @@ class AssistantDSLParser ( Parser ):
     def supportGreetings(self):
 
         localctx = AssistantDSLParser.SupportGreetingsContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_supportGreetings)
+        self.enterRule(localctx, 16, self.RULE_supportGreetings)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 93
+            self.state = 112
             self.match(AssistantDSLParser.KSUPPORT)
-            self.state = 94
-            self.match(AssistantDSLParser.T__2)
-            self.state = 95
-            self.match(AssistantDSLParser.T__1)
+            self.state = 113
+            self.match(AssistantDSLParser.T__4)
+            self.state = 114
+            self.match(AssistantDSLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -769,15 +880,15 @@ class AssistantDSLParser ( Parser ):
     def supportInfor(self):
 
         localctx = AssistantDSLParser.SupportInforContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_supportInfor)
+        self.enterRule(localctx, 18, self.RULE_supportInfor)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 97
+            self.state = 116
             self.match(AssistantDSLParser.KSUPPORT)
-            self.state = 98
-            self.match(AssistantDSLParser.T__3)
-            self.state = 99
-            self.match(AssistantDSLParser.T__4)
+            self.state = 117
+            self.match(AssistantDSLParser.T__5)
+            self.state = 118
+            self.match(AssistantDSLParser.T__6)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -820,23 +931,23 @@ class AssistantDSLParser ( Parser ):
     def introduce(self):
 
         localctx = AssistantDSLParser.IntroduceContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_introduce)
+        self.enterRule(localctx, 20, self.RULE_introduce)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 101
-            self.match(AssistantDSLParser.T__5)
-            self.state = 102
-            self.match(AssistantDSLParser.T__6)
-            self.state = 103
+            self.state = 120
             self.match(AssistantDSLParser.T__7)
-            self.state = 104
+            self.state = 121
             self.match(AssistantDSLParser.T__8)
-            self.state = 106
+            self.state = 122
+            self.match(AssistantDSLParser.T__9)
+            self.state = 123
+            self.match(AssistantDSLParser.T__10)
+            self.state = 125
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==18:
-                self.state = 105
+            if _la==23:
+                self.state = 124
                 self.match(AssistantDSLParser.QUESTION)
 
 
@@ -860,8 +971,9 @@ class AssistantDSLParser ( Parser ):
             return self.getTypedRuleContext(AssistantDSLParser.KgreetingContext,0)
 
 
-        def IDENTIFIER(self):
-            return self.getToken(AssistantDSLParser.IDENTIFIER, 0)
+        def word(self):
+            return self.getTypedRuleContext(AssistantDSLParser.WordContext,0)
+
 
         def getRuleIndex(self):
             return AssistantDSLParser.RULE_greeting
@@ -886,24 +998,24 @@ class AssistantDSLParser ( Parser ):
     def greeting(self):
 
         localctx = AssistantDSLParser.GreetingContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_greeting)
+        self.enterRule(localctx, 22, self.RULE_greeting)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 108
+            self.state = 127
             self.kgreeting()
-            self.state = 113
+            self.state = 132
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==10:
-                self.state = 109
-                self.match(AssistantDSLParser.T__9)
-                self.state = 110
+            if _la==12:
+                self.state = 128
+                self.match(AssistantDSLParser.T__11)
+                self.state = 129
+                self.match(AssistantDSLParser.T__10)
+                self.state = 130
                 self.match(AssistantDSLParser.T__8)
-                self.state = 111
-                self.match(AssistantDSLParser.T__6)
-                self.state = 112
-                self.match(AssistantDSLParser.IDENTIFIER)
+                self.state = 131
+                self.word()
 
 
         except RecognitionException as re:
@@ -952,21 +1064,21 @@ class AssistantDSLParser ( Parser ):
     def asking(self):
 
         localctx = AssistantDSLParser.AskingContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_asking)
+        self.enterRule(localctx, 24, self.RULE_asking)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 115
+            self.state = 134
             self.kasking()
-            self.state = 116
-            self.match(AssistantDSLParser.T__10)
-            self.state = 117
-            self.match(AssistantDSLParser.T__11)
-            self.state = 119
+            self.state = 135
+            self.match(AssistantDSLParser.T__12)
+            self.state = 136
+            self.match(AssistantDSLParser.T__13)
+            self.state = 138
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==18:
-                self.state = 118
+            if _la==23:
+                self.state = 137
                 self.match(AssistantDSLParser.QUESTION)
 
 
@@ -1029,35 +1141,35 @@ class AssistantDSLParser ( Parser ):
     def createAction(self):
 
         localctx = AssistantDSLParser.CreateActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 24, self.RULE_createAction)
+        self.enterRule(localctx, 26, self.RULE_createAction)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 121
+            self.state = 140
             self.kcreate()
-            self.state = 122
+            self.state = 141
             self.taskTitle()
-            self.state = 124
+            self.state = 143
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==26 or _la==27:
-                self.state = 123
+            if _la==31 or _la==32:
+                self.state = 142
                 self.dueSpec()
 
 
-            self.state = 127
+            self.state = 146
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==28:
-                self.state = 126
+            if _la==33:
+                self.state = 145
                 self.rruleClause()
 
 
-            self.state = 130
+            self.state = 149
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==30:
-                self.state = 129
+            if _la==35:
+                self.state = 148
                 self.statusClause()
 
 
@@ -1103,13 +1215,92 @@ class AssistantDSLParser ( Parser ):
     def viewAction(self):
 
         localctx = AssistantDSLParser.ViewActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 26, self.RULE_viewAction)
+        self.enterRule(localctx, 28, self.RULE_viewAction)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 132
+            self.state = 151
             self.match(AssistantDSLParser.KVIEW)
-            self.state = 133
-            self.match(AssistantDSLParser.T__0)
+            self.state = 152
+            self.match(AssistantDSLParser.T__2)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PageActionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def KVIEW(self):
+            return self.getToken(AssistantDSLParser.KVIEW, 0)
+
+        def getRuleIndex(self):
+            return AssistantDSLParser.RULE_pageAction
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPageAction" ):
+                listener.enterPageAction(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPageAction" ):
+                listener.exitPageAction(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPageAction" ):
+                return visitor.visitPageAction(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def pageAction(self):
+
+        localctx = AssistantDSLParser.PageActionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_pageAction)
+        self._la = 0 # Token type
+        try:
+            self.state = 163
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [15]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 154
+                self.match(AssistantDSLParser.T__14)
+                self.state = 155
+                self.match(AssistantDSLParser.T__15)
+                pass
+            elif token in [17, 27]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 157
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==27:
+                    self.state = 156
+                    self.match(AssistantDSLParser.KVIEW)
+
+
+                self.state = 159
+                self.match(AssistantDSLParser.T__16)
+                self.state = 161
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==3:
+                    self.state = 160
+                    self.match(AssistantDSLParser.T__2)
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1161,19 +1352,19 @@ class AssistantDSLParser ( Parser ):
     def deleteAction(self):
 
         localctx = AssistantDSLParser.DeleteActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_deleteAction)
+        self.enterRule(localctx, 32, self.RULE_deleteAction)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 135
+            self.state = 165
             self.kdelete()
-            self.state = 136
+            self.state = 166
             self.taskTitle()
-            self.state = 138
+            self.state = 168
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==26 or _la==27:
-                self.state = 137
+            if _la==31 or _la==32:
+                self.state = 167
                 self.dueSpec()
 
 
@@ -1238,35 +1429,35 @@ class AssistantDSLParser ( Parser ):
     def modifyAction(self):
 
         localctx = AssistantDSLParser.ModifyActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_modifyAction)
+        self.enterRule(localctx, 34, self.RULE_modifyAction)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 140
+            self.state = 170
             self.kmodify()
-            self.state = 141
+            self.state = 171
             self.taskTitle()
-            self.state = 143
+            self.state = 173
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==26 or _la==27:
-                self.state = 142
+            if _la==31 or _la==32:
+                self.state = 172
                 self.dueSpec()
 
 
-            self.state = 145
+            self.state = 175
             self.match(AssistantDSLParser.SET)
-            self.state = 146
+            self.state = 176
             self.fieldAssign()
-            self.state = 151
+            self.state = 181
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==13:
-                self.state = 147
-                self.match(AssistantDSLParser.T__12)
-                self.state = 148
+            while _la==18:
+                self.state = 177
+                self.match(AssistantDSLParser.T__17)
+                self.state = 178
                 self.fieldAssign()
-                self.state = 153
+                self.state = 183
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1328,27 +1519,27 @@ class AssistantDSLParser ( Parser ):
     def dueSpec(self):
 
         localctx = AssistantDSLParser.DueSpecContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_dueSpec)
+        self.enterRule(localctx, 36, self.RULE_dueSpec)
         try:
-            self.state = 160
+            self.state = 190
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [26]:
+            if token in [31]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 154
+                self.state = 184
                 self.match(AssistantDSLParser.IN)
-                self.state = 155
+                self.state = 185
                 self.match(AssistantDSLParser.INT)
-                self.state = 156
+                self.state = 186
                 self.timeUnit()
                 pass
-            elif token in [27]:
+            elif token in [32]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 157
+                self.state = 187
                 self.match(AssistantDSLParser.AT)
-                self.state = 158
+                self.state = 188
                 self.match(AssistantDSLParser.DATE)
-                self.state = 159
+                self.state = 189
                 self.match(AssistantDSLParser.TIME)
                 pass
             else:
@@ -1402,13 +1593,13 @@ class AssistantDSLParser ( Parser ):
     def timeUnit(self):
 
         localctx = AssistantDSLParser.TimeUnitContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_timeUnit)
+        self.enterRule(localctx, 38, self.RULE_timeUnit)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 162
+            self.state = 192
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 240518168576) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 7696581394432) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -1465,23 +1656,23 @@ class AssistantDSLParser ( Parser ):
     def rruleClause(self):
 
         localctx = AssistantDSLParser.RruleClauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 36, self.RULE_rruleClause)
+        self.enterRule(localctx, 40, self.RULE_rruleClause)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 164
+            self.state = 194
             self.match(AssistantDSLParser.REPEAT)
-            self.state = 165
+            self.state = 195
             self.match(AssistantDSLParser.EVERY)
-            self.state = 167
+            self.state = 197
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==40:
-                self.state = 166
+            if _la==45:
+                self.state = 196
                 self.match(AssistantDSLParser.INT)
 
 
-            self.state = 169
+            self.state = 199
             self.timeUnit()
         except RecognitionException as re:
             localctx.exception = re
@@ -1528,12 +1719,12 @@ class AssistantDSLParser ( Parser ):
     def statusClause(self):
 
         localctx = AssistantDSLParser.StatusClauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 38, self.RULE_statusClause)
+        self.enterRule(localctx, 42, self.RULE_statusClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 171
+            self.state = 201
             self.match(AssistantDSLParser.AS)
-            self.state = 172
+            self.state = 202
             self.match(AssistantDSLParser.STATUS)
         except RecognitionException as re:
             localctx.exception = re
@@ -1551,11 +1742,12 @@ class AssistantDSLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
+        def word(self, i:int=None):
             if i is None:
-                return self.getTokens(AssistantDSLParser.IDENTIFIER)
+                return self.getTypedRuleContexts(AssistantDSLParser.WordContext)
             else:
-                return self.getToken(AssistantDSLParser.IDENTIFIER, i)
+                return self.getTypedRuleContext(AssistantDSLParser.WordContext,i)
+
 
         def STATUS(self):
             return self.getToken(AssistantDSLParser.STATUS, 0)
@@ -1583,21 +1775,27 @@ class AssistantDSLParser ( Parser ):
     def fieldAssign(self):
 
         localctx = AssistantDSLParser.FieldAssignContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 40, self.RULE_fieldAssign)
-        self._la = 0 # Token type
+        self.enterRule(localctx, 44, self.RULE_fieldAssign)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 174
-            self.match(AssistantDSLParser.IDENTIFIER)
-            self.state = 175
-            self.match(AssistantDSLParser.T__13)
-            self.state = 176
-            _la = self._input.LA(1)
-            if not(_la==34 or _la==41):
-                self._errHandler.recoverInline(self)
+            self.state = 204
+            self.word()
+            self.state = 205
+            self.match(AssistantDSLParser.T__18)
+            self.state = 208
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [1, 2, 15, 16, 17, 46]:
+                self.state = 206
+                self.word()
+                pass
+            elif token in [39]:
+                self.state = 207
+                self.match(AssistantDSLParser.STATUS)
+                pass
             else:
-                self._errHandler.reportMatch(self)
-                self.consume()
+                raise NoViableAltException(self)
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1614,11 +1812,12 @@ class AssistantDSLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self, i:int=None):
+        def word(self, i:int=None):
             if i is None:
-                return self.getTokens(AssistantDSLParser.IDENTIFIER)
+                return self.getTypedRuleContexts(AssistantDSLParser.WordContext)
             else:
-                return self.getToken(AssistantDSLParser.IDENTIFIER, i)
+                return self.getTypedRuleContext(AssistantDSLParser.WordContext,i)
+
 
         def getRuleIndex(self):
             return AssistantDSLParser.RULE_taskTitle
@@ -1643,22 +1842,76 @@ class AssistantDSLParser ( Parser ):
     def taskTitle(self):
 
         localctx = AssistantDSLParser.TaskTitleContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_taskTitle)
-        self._la = 0 # Token type
+        self.enterRule(localctx, 46, self.RULE_taskTitle)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 178
-            self.match(AssistantDSLParser.IDENTIFIER)
-            self.state = 182
+            self.state = 211 
             self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==41:
-                self.state = 179
-                self.match(AssistantDSLParser.IDENTIFIER)
-                self.state = 184
+            _alt = 1
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt == 1:
+                    self.state = 210
+                    self.word()
+
+                else:
+                    raise NoViableAltException(self)
+                self.state = 213 
                 self._errHandler.sync(self)
-                _la = self._input.LA(1)
+                _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class WordContext(ParserRuleContext):
+        __slots__ = 'parser'
 
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIER(self):
+            return self.getToken(AssistantDSLParser.IDENTIFIER, 0)
+
+        def getRuleIndex(self):
+            return AssistantDSLParser.RULE_word
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterWord" ):
+                listener.enterWord(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitWord" ):
+                listener.exitWord(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWord" ):
+                return visitor.visitWord(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def word(self):
+
+        localctx = AssistantDSLParser.WordContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_word)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 215
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 70368744407046) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1701,10 +1954,10 @@ class AssistantDSLParser ( Parser ):
     def affirmative(self):
 
         localctx = AssistantDSLParser.AffirmativeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_affirmative)
+        self.enterRule(localctx, 50, self.RULE_affirmative)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 185
+            self.state = 217
             self.match(AssistantDSLParser.YES)
         except RecognitionException as re:
             localctx.exception = re
@@ -1748,10 +2001,10 @@ class AssistantDSLParser ( Parser ):
     def negative(self):
 
         localctx = AssistantDSLParser.NegativeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 46, self.RULE_negative)
+        self.enterRule(localctx, 52, self.RULE_negative)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 187
+            self.state = 219
             self.match(AssistantDSLParser.NO)
         except RecognitionException as re:
             localctx.exception = re
@@ -1793,7 +2046,7 @@ class AssistantDSLParser ( Parser ):
     def kintroduce(self):
 
         localctx = AssistantDSLParser.KintroduceContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 48, self.RULE_kintroduce)
+        self.enterRule(localctx, 54, self.RULE_kintroduce)
         try:
             self.enterOuterAlt(localctx, 1)
 
@@ -1839,10 +2092,10 @@ class AssistantDSLParser ( Parser ):
     def kgreeting(self):
 
         localctx = AssistantDSLParser.KgreetingContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 50, self.RULE_kgreeting)
+        self.enterRule(localctx, 56, self.RULE_kgreeting)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 191
+            self.state = 223
             self.match(AssistantDSLParser.KGREETING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1886,10 +2139,10 @@ class AssistantDSLParser ( Parser ):
     def kasking(self):
 
         localctx = AssistantDSLParser.KaskingContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 52, self.RULE_kasking)
+        self.enterRule(localctx, 58, self.RULE_kasking)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 193
+            self.state = 225
             self.match(AssistantDSLParser.KASKING)
         except RecognitionException as re:
             localctx.exception = re
@@ -1933,26 +2186,26 @@ class AssistantDSLParser ( Parser ):
     def kcreate(self):
 
         localctx = AssistantDSLParser.KcreateContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 54, self.RULE_kcreate)
+        self.enterRule(localctx, 60, self.RULE_kcreate)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 195
+            self.state = 227
             self.match(AssistantDSLParser.KCREATE)
-            self.state = 197
+            self.state = 229
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==15:
-                self.state = 196
-                self.match(AssistantDSLParser.T__14)
+            if _la==20:
+                self.state = 228
+                self.match(AssistantDSLParser.T__19)
 
 
-            self.state = 200
+            self.state = 232
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==16:
-                self.state = 199
-                self.match(AssistantDSLParser.T__15)
+            if _la==21:
+                self.state = 231
+                self.match(AssistantDSLParser.T__20)
 
 
         except RecognitionException as re:
@@ -1997,13 +2250,13 @@ class AssistantDSLParser ( Parser ):
     def kdelete(self):
 
         localctx = AssistantDSLParser.KdeleteContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 56, self.RULE_kdelete)
+        self.enterRule(localctx, 62, self.RULE_kdelete)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 202
+            self.state = 234
             self.match(AssistantDSLParser.KDELETE)
-            self.state = 203
-            self.match(AssistantDSLParser.T__16)
+            self.state = 235
+            self.match(AssistantDSLParser.T__21)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2046,13 +2299,13 @@ class AssistantDSLParser ( Parser ):
     def kmodify(self):
 
         localctx = AssistantDSLParser.KmodifyContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 58, self.RULE_kmodify)
+        self.enterRule(localctx, 64, self.RULE_kmodify)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 205
+            self.state = 237
             self.match(AssistantDSLParser.KMODIFY)
-            self.state = 206
-            self.match(AssistantDSLParser.T__16)
+            self.state = 238
+            self.match(AssistantDSLParser.T__21)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
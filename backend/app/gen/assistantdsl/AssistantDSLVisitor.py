@@ -14,6 +14,11 @@ class AssistantDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by AssistantDSLParser#commandSep.
+    def visitCommandSep(self, ctx:AssistantDSLParser.CommandSepContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by AssistantDSLParser#command.
     def visitCommand(self, ctx:AssistantDSLParser.CommandContext):
         return self.visitChildren(ctx)
@@ -79,6 +84,11 @@ class AssistantDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by AssistantDSLParser#pageAction.
+    def visitPageAction(self, ctx:AssistantDSLParser.PageActionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by AssistantDSLParser#deleteAction.
     def visitDeleteAction(self, ctx:AssistantDSLParser.DeleteActionContext):
         return self.visitChildren(ctx)
@@ -119,6 +129,11 @@ class AssistantDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by AssistantDSLParser#word.
+    def visitWord(self, ctx:AssistantDSLParser.WordContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by AssistantDSLParser#affirmative.
     def visitAffirmative(self, ctx:AssistantDSLParser.AffirmativeContext):
         return self.visitChildren(ctx)
@@ -0,0 +1,68 @@
+# app/gen/dsl_cache.py
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
+# WS is skipped by the lexer, so any run of it separates tokens the same way.
+_WS_RUN = re.compile(r"[ \t\r\n]+")
+
+
+def normalize(text: str) -> str:
+    """Cache key for *text*: surrounding blanks stripped, inner runs collapsed.
+
+    Case is preserved because IDENTIFIER values (titles, names) keep it.
+    """
+    return _WS_RUN.sub(" ", text).strip(" ")
+
+
+class LRUCache:
+    """Bounded LRU mapping with hit / miss / eviction counters."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
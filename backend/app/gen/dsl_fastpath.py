@@ -0,0 +1,95 @@
+# app/gen/dsl_fastpath.py
+"""Hand-written recognizer for the fixed-shape DSL commands.
+
+Confirmations, ``viewAction``, ``pageAction`` and the three
+``supportCommand`` forms are a handful of keywords with no slots, so they
+are matched with a keyword table instead of the ANTLR runtime. Anything else returns ``None`` and the caller
+falls back to the generated parser.
+"""
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+from .assistantdsl.AssistantDSLLexer import AssistantDSLLexer
+from .assistantdsl.AssistantDSLParser import AssistantDSLParser
+
+GRAMMAR_FILE = os.path.join(os.path.dirname(__file__), "AssistantDSL.g4")
+
+# lexer rule whose body is only quoted literals, e.g. KVIEW: ('show' | 'view');
+_LITERAL_RULE = re.compile(r"^([A-Z][A-Z_]*)\s*:\s*\(?\s*('[^;]*')\s*\)?\s*;", re.M)
+_LITERAL      = re.compile(r"'([^']*)'")
+_WS           = re.compile(r"[ \t\r\n]+")
+
+
+def _build_keyword_table() -> Dict[str, int]:
+    """Map every lower-cased token literal of the grammar to its token type.
+
+    Implicit tokens (``'tasks'``, ``'bot'`` ...) come from the parser's
+    type-indexed ``literalNames``, named keyword rules (``KVIEW``, ``YES``
+    ...) from the grammar file. The lowest token type wins, as it does in
+    the ANTLR lexer.
+    """
+    pairs = []
+    for ttype, lit in enumerate(AssistantDSLParser.literalNames):
+        if lit.startswith("'"):
+            pairs.append((ttype, lit[1:-1]))
+    with open(GRAMMAR_FILE, encoding="utf-8") as f:
+        grammar = f.read()
+    lexer_part = grammar[grammar.index("lexer rules"):]
+    for name, body in _LITERAL_RULE.findall(lexer_part):
+        ttype = getattr(AssistantDSLLexer, name, None)
+        if ttype is None:
+            continue
+        for lit in _LITERAL.findall(body):
+            pairs.append((ttype, lit))
+    table: Dict[str, int] = {}
+    for ttype, lit in sorted(pairs):
+        table.setdefault(lit.lower(), ttype)  # grammar is caseInsensitive
+    return table
+
+
+KEYWORDS: Dict[str, int] = _build_keyword_table()
+
+
+def _lit(text: str) -> int:
+    return KEYWORDS[text]
+
+
+L = AssistantDSLLexer
+# token-type sequence -> skeleton produced by _Visitor for the same input
+SHAPES: Dict[Tuple[int, ...], dict] = {
+    (L.YES,):                                          {"action": "confirm", "value": True},
+    (L.NO,):                                           {"action": "confirm", "value": False},
+    (L.KVIEW, _lit("tasks")):                          {"action": "view"},
+    (_lit("next"), _lit("page")):                      {"action": "next_page"},
+    (_lit("more"),):                                   {"action": "next_page"},
+    (_lit("more"), _lit("tasks")):                     {"action": "next_page"},
+    (L.KVIEW, _lit("more")):                           {"action": "next_page"},
+    (L.KVIEW, _lit("more"), _lit("tasks")):            {"action": "next_page"},
+    (L.KSUPPORT, _lit("tasks"), _lit("instructions")): {"action": "instruction_tasks"},
+    (L.KSUPPORT, _lit("greeting"), _lit("instructions")): {"action": "instruction_greetings"},
+    (L.KSUPPORT, _lit("bot"), _lit("information")):    {"action": "instruction_infor"},
+}
+del L
+
+_MAX_WORDS = max(len(shape) for shape in SHAPES)
+
+
+def match(text: str) -> Optional[dict]:
+    """Return the skeleton for a fixed-shape command, or ``None``.
+
+    The returned dict is shared; callers must copy it before mutating
+    (``dsl_parser.resolve`` does).
+    """
+    words = _WS.split(text.strip(" \t\r\n"))
+    if len(words) > _MAX_WORDS:
+        return None
+    shape = []
+    for word in words:
+        if not word.isascii():
+            return None
+        ttype = KEYWORDS.get(word.lower())
+        if ttype is None:
+            return None
+        shape.append(ttype)
+    return SHAPES.get(tuple(shape))
@@ -0,0 +1,124 @@
+# app/gen/dsl_incremental.py
+"""Incremental parsing of utterances that arrive in chunks (live voice input).
+
+:class:`IncrementalParser` keeps the tokens lexed so far and, on every
+appended chunk, re-lexes only the tail whose tokens could still change.
+The parse of the token prefix goes through the SLL streaming engine with a
+recording builder; like the token-shape templates it depends only on the
+token types, so the events are cached per type prefix and replayed for the
+next utterance with the same shape (``"remind me to <words>"`` and so on).
+"""
+from typing import List, Tuple
+
+from antlr4 import CommonTokenStream, Token
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.Token import CommonToken
+from antlr4.error.Errors import ParseCancellationException
+
+from .dsl_cache import LRUCache
+from .dsl_lexer import RegexLexer
+from .dsl_parser import _RecordingBuilder, _StreamingParser, _parse_sll, _replay_builder
+
+# Longest token whose match can still change when text is appended, other
+# than the last token: DATE reads 10 characters before it can decide.
+MAX_LOOKAHEAD = 10
+
+PREFIX_CACHE_SIZE = 1024
+# token types of a prefix -> (status, events)
+PREFIXES = LRUCache(PREFIX_CACHE_SIZE)
+
+COMPLETE, PARTIAL, INVALID = "complete", "partial", "invalid"
+
+_EOF = CommonToken(type=Token.EOF)
+_EOF.text = "<EOF>"
+
+
+def _parse_prefix(tokens: List[CommonToken]) -> Tuple[str, tuple]:
+    """SLL-parse *tokens*; the recorded events stop where the parser gave up.
+
+    An impossible date or time (``2025-13-01``) raises ValueError like the
+    other engines; it depends on token text, so it must not be cached.
+    """
+    parser = _StreamingParser(CommonTokenStream(ListTokenSource(list(tokens))))
+    parser.builder = builder = _RecordingBuilder()
+    parser.buildParseTrees = False
+    try:
+        _parse_sll(parser)
+        status = COMPLETE
+    except ParseCancellationException as e:
+        # running out of input is a prefix; any other offending token is not
+        cause = e.args[0] if e.args else None
+        offending = getattr(cause, "offendingToken", None)
+        status = PARTIAL if offending is None or offending.type == Token.EOF else INVALID
+    return status, tuple(builder.events)
+
+
+def _due_state(due: dict) -> str | None:
+    if not due:
+        return None
+    if due.keys() >= {"date", "time"} or due.keys() >= {"amount", "unit"}:
+        return COMPLETE
+    return PARTIAL
+
+
+class IncrementalParser:
+    """Partial intent of an utterance that grows chunk by chunk."""
+
+    def __init__(self):
+        self._lexer = RegexLexer()
+        self._lexer.removeErrorListeners()
+        self.reset()
+
+    def reset(self) -> None:
+        self.text = ""
+        self.tokens: List[CommonToken] = []
+        self.lexed = 0  # characters lexed so far, re-lexed tails included
+
+    def feed(self, chunk: str) -> dict:
+        """Append *chunk* (e.g. the next recognized word) and return :meth:`state`."""
+        old = len(self.text)
+        self.text += chunk
+        # Tokens whose match cannot be affected by the new text stay; the
+        # unstable ones are always a suffix of the token list.
+        keep = len(self.tokens)
+        while keep:
+            tok = self.tokens[keep - 1]
+            if tok.start + max(MAX_LOOKAHEAD, tok.stop - tok.start + 2) <= old:
+                break
+            keep -= 1
+        start = self.tokens[keep].start if keep < len(self.tokens) else (
+            self.tokens[keep - 1].stop + 1 if keep else 0)
+        del self.tokens[keep:]
+        self._lexer.set_text(self.text, start)
+        tok = self._lexer.nextToken()
+        while tok.type != Token.EOF:
+            self.tokens.append(tok)
+            tok = self._lexer.nextToken()
+        self.lexed += len(self.text) - start
+        return self.state()
+
+    def state(self) -> dict:
+        """Current reading of the utterance.
+
+        ``status`` is ``"complete"`` (a valid command as it stands),
+        ``"partial"`` (a valid prefix) or ``"invalid"``; ``intent`` is the
+        skeleton so far, with the title words heard so far; ``due`` tells
+        whether a due spec is ``"partial"`` or ``"complete"``.
+        """
+        key = tuple(tok.type for tok in self.tokens)
+        try:
+            cached = PREFIXES.get(key)
+            if cached is None:
+                cached = _parse_prefix(self.tokens)
+                PREFIXES.put(key, cached)
+            status, events = cached
+            builder = _replay_builder(events, self.tokens + [_EOF])
+        except ValueError:
+            return {"status": INVALID, "intent": None, "due": None, "tokens": len(self.tokens)}
+        intent = dict(builder.result) if builder.result else None
+        if intent is not None and intent.get("title", "") is None and builder.words:
+            intent["title"] = " ".join(builder.words)  # taskTitle still open
+        if len(builder.results) > 1:
+            intent = {"action": "sequence", "commands": builder.results[:-1] + [intent]}
+        return {"status": status, "intent": intent, "due": _due_state(builder.due),
+                "tokens": len(self.tokens)}
@@ -0,0 +1,168 @@
+# app/gen/dsl_intents.py
+"""Typed, slotted intents for the parser's skeleton dicts.
+
+The parser engines, the fast path and the batch API keep producing
+skeleton dicts (plain data, cheap to pickle from process workers and to
+serialize). :func:`from_skeleton` turns one into an intent object once,
+when it is cached; intents are immutable by convention, so a cached
+instance is shared by every request that hits it and :meth:`Intent.resolve`
+only allocates when a relative due spec has to be resolved.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Optional, Tuple, Type
+
+from .dsl_parser import DUE_IN
+
+
+class Intent:
+    __slots__ = ()
+    action = ""
+    # slots omitted from as_dict() while None
+    _optional = ()
+
+    def __init__(self, *args, **kwargs):
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+        for name in self.__slots__[len(args):]:
+            setattr(self, name, kwargs.get(name))
+
+    def resolve(self, now: datetime | None = None) -> "Intent":
+        return self
+
+    def as_dict(self) -> dict:
+        """The skeleton dict this intent was built from (``DSLService.parse`` shape)."""
+        result = {"action": self.action}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None or name not in self._optional:
+                result[name] = value
+        return result
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class GreetIntent(Intent):
+    __slots__ = ("name",)
+    action = "greet"
+
+
+class IntroduceIntent(Intent):
+    __slots__ = ()
+    action = "introduce"
+
+
+class AskIntent(Intent):
+    __slots__ = ("question",)
+    action = "ask"
+
+
+class InstructionIntent(Intent):
+    __slots__ = ("topic",)  # tasks | greetings | infor
+    _optional = ("topic",)
+
+    @property
+    def action(self) -> str:
+        return f"instruction_{self.topic}"
+
+    def as_dict(self) -> dict:
+        return {"action": self.action}
+
+
+class CreateIntent(Intent):
+    __slots__ = ("title", "task_date", "task_time", "repeat", "status", DUE_IN)
+    action = "create"
+    _optional = (DUE_IN,)
+
+    title: str
+    task_date: Optional[date]
+    task_time: Optional[time]
+    due_in: Optional[timedelta]
+
+    def resolve(self, now: datetime | None = None) -> "CreateIntent":
+        if self.due_in is None:
+            return self
+        due = (now or datetime.utcnow()) + self.due_in
+        return CreateIntent(self.title, due.date(), due.time(), self.repeat, self.status)
+
+
+class ViewIntent(Intent):
+    __slots__ = ()
+    action = "view"
+
+
+class NextPageIntent(Intent):
+    __slots__ = ()
+    action = "next_page"
+
+
+class DeleteIntent(Intent):
+    __slots__ = ("title", "task_date", "task_time")
+    action = "delete"
+
+
+class UpdateIntent(Intent):
+    __slots__ = ("title", "task_date", "task_time", "updates")
+    action = "update"
+
+    def as_dict(self) -> dict:
+        result = super().as_dict()
+        result["updates"] = dict(self.updates or {})
+        return result
+
+
+class CancelIntent(Intent):
+    __slots__ = ("title",)
+    action = "cancel"
+
+
+class ConfirmIntent(Intent):
+    __slots__ = ("value",)
+    action = "confirm"
+
+
+class SequenceIntent(Intent):
+    """Several commands said at once ("... and show tasks"), run in order."""
+    __slots__ = ("commands",)
+    action = "sequence"
+
+    commands: Tuple[Intent, ...]
+
+    def resolve(self, now: datetime | None = None) -> "SequenceIntent":
+        now = now or datetime.utcnow()
+        resolved = tuple(command.resolve(now) for command in self.commands)
+        if all(new is old for new, old in zip(resolved, self.commands)):
+            return self
+        return SequenceIntent(resolved)
+
+    def as_dict(self) -> dict:
+        return {"action": self.action, "commands": [command.as_dict() for command in self.commands]}
+
+
+_BY_ACTION: Dict[str, Type[Intent]] = {
+    cls.action: cls for cls in (GreetIntent, IntroduceIntent, AskIntent, CreateIntent, ViewIntent,
+                                NextPageIntent, DeleteIntent, UpdateIntent, CancelIntent, ConfirmIntent)
+}
+
+
+def from_skeleton(skeleton: dict) -> Optional[Intent]:
+    """Intent for a parser skeleton; None for error results."""
+    action = skeleton.get("action")
+    if action is None:
+        return None
+    if action.startswith("instruction_"):
+        return InstructionIntent(action[len("instruction_"):])
+    if action == "sequence":
+        commands = tuple(from_skeleton(command) for command in skeleton.get("commands") or ())
+        return SequenceIntent(commands) if commands and None not in commands else None
+    cls = _BY_ACTION.get(action)
+    if cls is None:
+        return None
+    return cls(*(skeleton.get(name) for name in cls.__slots__))
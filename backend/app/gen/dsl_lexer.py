@@ -0,0 +1,144 @@
+# app/gen/dsl_lexer.py
+"""Regex-based drop-in replacement for the generated ``AssistantDSLLexer``.
+
+The generated lexer runs the ANTLR lexer ATN simulator character by
+character in pure Python. Our lexer rules are simple enough to compile into
+one regular expression: keyword literals share the IDENTIFIER shape, so a
+word is matched once and looked up in the grammar's keyword table (exact,
+case-insensitive match wins over IDENTIFIER, as with ANTLR's rule order;
+a longer word stays an IDENTIFIER, as with longest match).
+
+Tokens are ``CommonToken`` objects with the same type, text, char range,
+line and column as the ANTLR lexer produces, so ``CommonTokenStream`` and
+``AssistantDSLParser`` consume them unchanged.
+"""
+import re
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import CommonToken, Token
+from antlr4.error.ErrorListener import ConsoleErrorListener, ProxyErrorListener
+
+from .assistantdsl.AssistantDSLLexer import AssistantDSLLexer
+from .dsl_fastpath import KEYWORDS
+
+L = AssistantDSLLexer
+
+# Lexer rules with character classes, translated from AssistantDSL.g4.
+# Alternatives are tried in order; at a digit DATE/TIME are longer than INT
+# whenever they match, so first match is also the longest match here.
+_TOKENS = (
+    r"(?P<WORD>[a-zA-Z][a-zA-Z0-9]*)"
+    r"|(?P<DATE>[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9])"
+    r"|(?P<TIME>[0-9][0-9]:[0-9][0-9])"
+    r"|(?P<INT>[0-9]+)"
+    r"|(?P<PUNCT>[?,=])"
+)
+_TOKEN_RE = re.compile(r"(?P<WS>[ \t\r\n]+)|" + _TOKENS)
+_GROUP_TYPE = {"DATE": L.DATE, "TIME": L.TIME, "INT": L.INT}
+
+# Rules the regex covers, besides keyword literals; a new lexer rule in the
+# grammar must be added here before this lexer can be used.
+_HANDLED = {"WS", "IDENTIFIER", "DATE", "TIME", "INT"}
+
+
+def _check_rules() -> None:
+    keyword_types = set(KEYWORDS.values())
+    for ttype, name in enumerate(L.symbolicNames):
+        if name == "<INVALID>" or ttype in keyword_types or name in _HANDLED:
+            continue
+        raise RuntimeError(f"dsl_lexer does not handle lexer rule {name}; update _TOKEN_RE")
+
+
+_check_rules()
+
+
+# Without WS, searching skips blanks and unrecognized characters exactly
+# like nextToken does, so every match is one token.
+_ANY_TOKEN_RE = re.compile(_TOKENS)
+
+
+def count_tokens(text: str, limit: int | None = None) -> int:
+    """Number of tokens (EOF excluded) the lexers produce for *text*.
+
+    Stops counting at *limit* + 1, which is enough to reject an input.
+    """
+    count = 0
+    for _ in _ANY_TOKEN_RE.finditer(text):
+        count += 1
+        if limit is not None and count > limit:
+            break
+    return count
+
+
+class RegexLexer:
+    """Token source compatible with ``CommonTokenStream``."""
+
+    _factory = CommonTokenFactory.DEFAULT
+
+    def __init__(self, text: str = ""):
+        self._listeners = [ConsoleErrorListener.INSTANCE]
+        self.set_text(text)
+
+    def set_text(self, text: str, start: int = 0) -> None:
+        """Restart on new input (reuses the lexer, like ``inputStream = ...``).
+
+        With *start* lexing resumes at that offset, e.g. to re-lex only the
+        tail of a growing utterance; token offsets stay relative to *text*.
+        """
+        self._text = text
+        self._pos = start
+        self._source = (self, None)
+        self.line = text.count("\n", 0, start) + 1
+        self.column = 0
+        self._line_start = text.rfind("\n", 0, start) + 1
+
+    # error listeners, as on antlr4.Recognizer
+    def addErrorListener(self, listener) -> None:
+        self._listeners.append(listener)
+
+    def removeErrorListeners(self) -> None:
+        self._listeners = []
+
+    def getErrorListenerDispatch(self):
+        return ProxyErrorListener(self._listeners)
+
+    def getSourceName(self) -> str:
+        return "<unknown>"
+
+    def nextToken(self) -> Token:
+        text = self._text
+        n = len(text)
+        match = _TOKEN_RE.match
+        while True:
+            pos = self._pos
+            self.column = pos - self._line_start
+            if pos >= n:
+                tok = CommonToken(self._source, Token.EOF, Token.DEFAULT_CHANNEL, n, n - 1)
+                tok.text = "<EOF>"
+                return tok
+            m = match(text, pos)
+            if m is None:
+                # token recognition error: report and drop one char, like ANTLR
+                if self._listeners:
+                    self.getErrorListenerDispatch().syntaxError(
+                        self, None, self.line, self.column,
+                        f"token recognition error at: '{text[pos]}'", None)
+                self._pos = pos + 1
+                continue
+            end = m.end()
+            self._pos = end
+            group = m.lastgroup
+            if group == "WS":
+                newlines = text.count("\n", pos, end)
+                if newlines:
+                    self.line += newlines
+                    self._line_start = text.rindex("\n", pos, end) + 1
+                continue
+            value = m.group()
+            if group == "WORD" or group == "PUNCT":
+                ttype = KEYWORDS.get(value.lower(), L.IDENTIFIER)
+            else:
+                ttype = _GROUP_TYPE[group]
+            tok = CommonToken(self._source, ttype, Token.DEFAULT_CHANNEL, pos, end - 1)
+            tok.text = value
+            return tok
@@ -1,20 +1,62 @@
 from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ConsoleErrorListener, ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 from datetime import datetime, timedelta
+from time import perf_counter
+from typing import List, Tuple
+import threading
 
 from .assistantdsl.AssistantDSLLexer   import AssistantDSLLexer
 from .assistantdsl.AssistantDSLParser  import AssistantDSLParser
 from .assistantdsl.AssistantDSLVisitor import AssistantDSLVisitor
+from .dsl_lexer import RegexLexer
+from .dsl_cache import LRUCache
+from . import dsl_fastpath
+
+
+# Key of the symbolic relative due spec ("in 30 minutes") inside a skeleton.
+DUE_IN = "due_in"
+
+_UNIT_DELTA = {
+    "minute": timedelta(minutes=1),
+    "minutes": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "hours": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "days": timedelta(days=1),
+}
+
+
+def _title(ctx) -> str:
+    # taskTitle words (the word rule): IDENTIFIERs, paging keywords, 'and' / 'then'
+    return " ".join(child.getText() for child in ctx.getChildren())
+
+
+def _sequence(commands: list) -> dict:
+    # several commands in one utterance ("... and show tasks"); one stays bare
+    if len(commands) == 1:
+        return commands[0]
+    return {"action": "sequence", "commands": commands}
+
+
+def _relative_delta(amount: int, unit: str):
+    step = _UNIT_DELTA.get(unit)
+    return step * amount if step else None
 
 
 class _Visitor(AssistantDSLVisitor):
     # entry-point ────────────────────────────────────────────────────
     def visitProgram(self, ctx):
-        return self.visit(ctx.command())
+        # error recovery can leave a command without a result
+        commands = [result for result in map(self.visit, ctx.command()) if result]
+        return _sequence(commands) if commands else None
     
     # ───────────── greeting / introduce / asking ─────────────
     def visitGreeting(self, ctx):
-        # grammar: kgreeting ('my' 'name' 'is' IDENTIFIER)?
-        name = ctx.IDENTIFIER().getText() if ctx.IDENTIFIER() else None
+        # grammar: kgreeting ('my' 'name' 'is' word)?
+        name = ctx.word().getText() if ctx.word() else None
         return {"action": "greet", "name": name}
 
     def visitIntroduce(self, ctx):
@@ -40,30 +82,22 @@ class _Visitor(AssistantDSLVisitor):
     
     # ───────────── create / remind ─────────────
     def visitCreateAction(self, ctx):
-        # Extract title: taskTitle is one or more IDENTIFIER tokens
-        title = " ".join(tok.getText() for tok in ctx.taskTitle().IDENTIFIER())
+        # Extract title: taskTitle is one or more words
+        title = _title(ctx.taskTitle())
         
         # ---------- dueSpec ----------
         task_date = None
         task_time = None
+        due_in = None
         if ctx.dueSpec():
             spec_ctx = ctx.dueSpec()
             first = spec_ctx.getChild(0).getText().lower()
             if first == "in":
                 # Relative specification : in INT timeUnit
+                # Kept symbolic here, resolved against the clock in resolve()
                 amount = int(spec_ctx.INT().getText())
                 unit = spec_ctx.timeUnit().getText().lower()
-                delta = {
-                    "minute": timedelta(minutes=amount),
-                    "minutes": timedelta(minutes=amount),
-                    "hour": timedelta(hours=amount),
-                    "hours": timedelta(hours=amount),
-                    "day": timedelta(days=amount),
-                    "days": timedelta(days=amount)
-                }.get(unit)
-                if delta:
-                    due = datetime.utcnow() + delta
-                    task_date, task_time = due.date(), due.time()
+                due_in = _relative_delta(amount, unit)
             elif first == "at":
                 # Absolute specification: at DATE TIME
                 date_text = spec_ctx.DATE().getText()
@@ -84,7 +118,7 @@ class _Visitor(AssistantDSLVisitor):
             # grammar: AS STATUS
             status = ctx.statusClause().STATUS().getText().lower()
         
-        return {
+        result = {
             "action": "create",
             "title": title,
             "task_date": task_date,
@@ -92,17 +126,24 @@ class _Visitor(AssistantDSLVisitor):
             "repeat": repeat,
             "status": status,
         }
+        if due_in is not None:
+            result[DUE_IN] = due_in
+        return result
     
     # ───────────── view / list ─────────────
     def visitViewAction(self, ctx):
         #date = ctx.DATE().getText() if ctx.DATE() and ctx.DATE().getText().strip() else None
         #return {"action": "view", "date": date}
         return {"action": "view"}
+
+    def visitPageAction(self, ctx):
+        # 'next' 'page' | KVIEW? 'more' 'tasks'? -- the page after the last view
+        return {"action": "next_page"}
     
     # ───────────── delete ─────────────
     def visitDeleteAction(self, ctx):
-        # Extract title from taskTitle rule (may have multiple identifiers)
-        title = " ".join(tok.getText() for tok in ctx.taskTitle().IDENTIFIER())
+        # Extract title from taskTitle rule (may have multiple words)
+        title = _title(ctx.taskTitle())
         task_date = None
         task_time = None
         if ctx.dueSpec():
@@ -124,7 +165,7 @@ class _Visitor(AssistantDSLVisitor):
     # ───────────── update / modify ─────────────
     def visitModifyAction(self, ctx):
         # Extract title from taskTitle rule
-        title = " ".join(tok.getText() for tok in ctx.taskTitle().IDENTIFIER())
+        title = _title(ctx.taskTitle())
         task_date = None
         task_time = None
         if ctx.dueSpec():
@@ -139,12 +180,12 @@ class _Visitor(AssistantDSLVisitor):
         updates = {}
         # ctx.fieldAssign() returns a list of assignment nodes.
         for fa in ctx.fieldAssign():
-            idents = fa.IDENTIFIER()
-            if len(idents) == 2:
-                key = idents[0].getText().lower()
-                val = idents[1].getText()
-            elif len(idents) == 1 and fa.STATUS():
-                key = idents[0].getText().lower()
+            words = fa.word()
+            if len(words) == 2:
+                key = words[0].getText().lower()
+                val = words[1].getText()
+            elif len(words) == 1 and fa.STATUS():
+                key = words[0].getText().lower()
                 val = fa.STATUS().getText().lower()
             else:
                 continue
@@ -170,12 +211,561 @@ class _Visitor(AssistantDSLVisitor):
     def visitNegative(self, _):
         return {"action": "confirm", "value": False}
 
-# public helper ────────────────────────────────────────────────────
+# streaming engine ─────────────────────────────────────────────────
+P = AssistantDSLParser
+
+# skeleton a command rule starts with; slots are filled while it is parsed
+_RULE_INTENT = {
+    P.RULE_greeting:         {"action": "greet", "name": None},
+    P.RULE_introduce:        {"action": "introduce"},
+    P.RULE_asking:           {"action": "ask", "question": None},
+    P.RULE_supportTasks:     {"action": "instruction_tasks"},
+    P.RULE_supportGreetings: {"action": "instruction_greetings"},
+    P.RULE_supportInfor:     {"action": "instruction_infor"},
+    P.RULE_createAction:     {"action": "create", "title": None, "task_date": None,
+                              "task_time": None, "repeat": None, "status": None},
+    P.RULE_viewAction:       {"action": "view"},
+    P.RULE_pageAction:       {"action": "next_page"},
+    P.RULE_deleteAction:     {"action": "delete", "title": None, "task_date": None, "task_time": None},
+    P.RULE_modifyAction:     {"action": "update", "title": None, "task_date": None,
+                              "task_time": None, "updates": None},
+    P.RULE_affirmative:      {"action": "confirm", "value": True},
+    P.RULE_negative:         {"action": "confirm", "value": False},
+}
+
+
+class _IntentBuilder:
+    """Builds the same skeleton as ``_Visitor`` from parse events.
+
+    It is fed rule entries/exits and consumed tokens while the parser runs,
+    so no parse tree is needed. Slot values depend only on the enclosing
+    rules and the token, which is what lets the events be replayed later.
+    """
+    __slots__ = ("stack", "result", "results", "words", "due", "field", "question")
+
+    def __init__(self):
+        self.stack = []
+        self.result = None    # the command being built
+        self.results = []     # every command of the utterance, result last
+        self.words = []       # taskTitle words
+        self.due = {}         # dueSpec parts: kind, amount, unit, date, time
+        self.field = []       # current fieldAssign (word | STATUS) tokens
+        self.question = None  # token texts inside asking
+
+    def enter(self, rule: int) -> None:
+        self.stack.append(rule)
+        intent = _RULE_INTENT.get(rule)
+        if intent is not None:
+            self.result = dict(intent)
+            self.results.append(self.result)
+            self.words, self.due = [], {}
+            if rule == P.RULE_modifyAction:
+                self.result["updates"] = {}
+            elif rule == P.RULE_asking:
+                self.question = []
+        elif rule == P.RULE_fieldAssign:
+            self.field = []
+
+    def token(self, ttype: int, text: str) -> None:
+        if self.question is not None:
+            self.question.append(text)
+            return
+        rule = self.stack[-1]
+        if rule == P.RULE_word:
+            # a free word: its meaning depends on the rule that holds it
+            outer = self.stack[-2]
+            if outer == P.RULE_taskTitle:
+                self.words.append(text)
+            elif outer == P.RULE_fieldAssign:
+                self.field.append((ttype, text))
+            elif outer == P.RULE_greeting:
+                self.result["name"] = text
+        elif rule == P.RULE_dueSpec:
+            if ttype == P.IN or ttype == P.AT:
+                self.due["kind"] = text.lower()
+            elif ttype == P.INT:
+                self.due["amount"] = int(text)
+            elif ttype == P.DATE:
+                self.due["date"] = text
+            elif ttype == P.TIME:
+                self.due["time"] = text
+        elif rule == P.RULE_timeUnit:
+            if self.stack[-2] == P.RULE_rruleClause:
+                self.result["repeat"] = text.lower()
+            else:
+                self.due["unit"] = text.lower()
+        elif rule == P.RULE_statusClause:
+            if ttype == P.STATUS:
+                self.result["status"] = text.lower()
+        elif rule == P.RULE_fieldAssign:
+            if ttype == P.STATUS:
+                self.field.append((ttype, text))
+
+    def exit(self, rule: int) -> None:
+        self.stack.pop()
+        if rule == P.RULE_taskTitle:
+            self.result["title"] = " ".join(self.words)
+        elif rule == P.RULE_dueSpec:
+            self._finish_due()
+        elif rule == P.RULE_fieldAssign:
+            field = self.field
+            if len(field) == 2:
+                # word '=' (word | STATUS)
+                value = field[1][1].lower() if field[1][0] == P.STATUS else field[1][1]
+                self.result["updates"][field[0][1].lower()] = value
+        elif rule == P.RULE_asking:
+            self.result["question"] = "".join(self.question)
+            self.question = None
+
+    def _finish_due(self) -> None:
+        due = self.due
+        if "date" in due:
+            self.result["task_date"] = datetime.strptime(due["date"], "%Y-%m-%d").date()
+        if "time" in due:
+            self.result["task_time"] = datetime.strptime(due["time"], "%H:%M").time()
+        if due.get("kind") == "in" and self.result["action"] == "create":
+            due_in = _relative_delta(due["amount"], due["unit"])
+            if due_in is not None:
+                self.result[DUE_IN] = due_in
+
+
+    def skeleton(self) -> dict:
+        if not self.results:
+            return {"error": "cannot_parse"}
+        return _sequence(self.results)
+
+
+class ParseTimeout(Exception):
+    """Raised by the parser once its deadline has passed."""
+
+
+class _StreamingParser(AssistantDSLParser):
+    """Generated parser that reports to an ``_IntentBuilder`` when set.
+
+    With a builder the parse tree is not built: no children lists, no
+    terminal nodes. Without one it behaves exactly like the base class.
+    With a ``deadline`` (a ``perf_counter()`` value) every rule entry and
+    consumed token checks the clock, so error recovery cannot run on
+    after the caller gave up on the result.
+    """
+
+    def __init__(self, input):
+        super().__init__(input)
+        self.builder = None
+        self.deadline = None
+
+    def reset(self):
+        super().reset()
+        self.aborted = False  # set once the deadline fired
+
+    def _check_deadline(self) -> None:
+        if self.deadline is not None and perf_counter() > self.deadline:
+            self.aborted = True
+            raise ParseTimeout("parse deadline exceeded")
+
+    def enterRule(self, localctx, state: int, ruleIndex: int):
+        self._check_deadline()
+        super().enterRule(localctx, state, ruleIndex)
+        if self.builder is not None:
+            self.builder.enter(ruleIndex)
+
+    def exitRule(self):
+        # After a bail-out the generated code still exits every open rule
+        # while unwinding; those contexts carry the exception and must not
+        # finish half-parsed slots (e.g. a dueSpec without its unit). A
+        # ParseTimeout is no RecognitionException and leaves no trace in
+        # the contexts, hence the flag.
+        if self.builder is not None and not self.aborted and self._ctx.exception is None:
+            self.builder.exit(self._ctx.getRuleIndex())
+        super().exitRule()
+
+    def consume(self):
+        self._check_deadline()
+        tok = super().consume()
+        if self.builder is not None:
+            self.builder.token(tok.type, tok.text)
+        return tok
+
+
+# tracing ──────────────────────────────────────────────────────────
+class ParseTrace:
+    """Per-stage timings of one parse, filled in when passed to the engines."""
+    __slots__ = ("stages", "tokens", "prediction", "template", "_t")
+
+    def __init__(self):
+        self.stages = {}         # stage -> seconds (lex, parse, visit)
+        self.tokens = 0          # tokens before EOF
+        self.prediction = None   # "sll" | "ll"; None when a template replaced the parse
+        self.template = None     # "hit" | "miss" | "skip" with the template engine
+        self._t = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self._t
+        self._t = now
+
+    def as_dict(self) -> dict:
+        return {
+            "stages_ms": {stage: secs * 1e3 for stage, secs in self.stages.items()},
+            "tokens": self.tokens,
+            "prediction": self.prediction,
+            "template": self.template,
+        }
+
+
+# two-stage prediction ─────────────────────────────────────────────
+# How often each stage produced the result; "ll" counts SLL bail-outs.
+PREDICTION_STATS = {"sll": 0, "ll": 0}
+
+
+def _parse_sll(parser: AssistantDSLParser):
+    """Fast SLL pass; raises ParseCancellationException on any error."""
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    tree = parser.program()
+    PREDICTION_STATS["sll"] += 1
+    return tree
+
+
+def _parse_ll(parser: AssistantDSLParser, report: bool = True):
+    """Full LL re-parse with the default error recovery."""
+    PREDICTION_STATS["ll"] += 1
+    parser._errHandler = DefaultErrorStrategy()
+    parser.reset()
+    if report:
+        parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.program()
+
+
+def _parse_program(parser: AssistantDSLParser, report: bool = True, trace: ParseTrace | None = None):
+    """Parse with fast SLL prediction first, re-parse in full LL on failure.
+
+    The SLL pass bails out on the first syntax error without reporting it,
+    so only inputs that really need full-context prediction (or are
+    malformed) pay for the LL pass and its error recovery. With
+    ``report=False`` the LL pass recovers silently too.
+    """
+    try:
+        tree = _parse_sll(parser)
+        if trace is not None:
+            trace.prediction = "sll"
+        return tree
+    except ParseCancellationException:
+        if trace is not None:
+            trace.prediction = "ll"
+        return _parse_ll(parser, report)
+
+
+def _tree_skeleton(parser: AssistantDSLParser, visitor=None, report: bool = True,
+                   trace: ParseTrace | None = None) -> dict:
+    tree   = _parse_program(parser, report, trace)
+    if trace is not None:
+        trace.lap("parse")
+    result = (visitor or _Visitor()).visit(tree)
+    if trace is not None:
+        trace.lap("visit")
+    return result if result else {"error": "cannot_parse"}
+
+
+def _stream_sll(parser: _StreamingParser, builder: _IntentBuilder) -> bool:
+    """SLL pass without a parse tree feeding *builder*; False if it bailed out."""
+    parser.builder = builder
+    parser.buildParseTrees = False
+    try:
+        _parse_sll(parser)
+        return True
+    except ParseCancellationException:
+        return False
+    finally:
+        parser.builder = None
+        parser.buildParseTrees = True
+
+
+def _ll_skeleton(parser: AssistantDSLParser, visitor=None, report: bool = True,
+                 trace: ParseTrace | None = None) -> dict:
+    tree   = _parse_ll(parser, report)
+    if trace is not None:
+        trace.prediction = "ll"
+        trace.lap("parse")
+    result = (visitor or _Visitor()).visit(tree)
+    if trace is not None:
+        trace.lap("visit")
+    return result if result else {"error": "cannot_parse"}
+
+
+def _sll_done(builder: _IntentBuilder, trace: ParseTrace | None) -> dict:
+    # the stream engines build the skeleton while parsing: no visit stage
+    if trace is not None:
+        trace.prediction = "sll"
+        trace.lap("parse")
+    return builder.skeleton()
+
+
+def _stream_skeleton(parser: _StreamingParser, visitor=None, report: bool = True,
+                     trace: ParseTrace | None = None) -> dict:
+    """Single pass without a parse tree; the SLL pass emits the skeleton.
+
+    Inputs the SLL pass rejects go through the tree engine's LL pass, so
+    error recovery and its partial results stay exactly as before.
+    """
+    builder = _IntentBuilder()
+    if _stream_sll(parser, builder):
+        return _sll_done(builder, trace)
+    return _ll_skeleton(parser, visitor, report, trace)
+
+
+# token-shape templates ────────────────────────────────────────────
+# The parser only looks at token types, so every input with the same type
+# sequence takes the same path through the grammar: same rule entries and
+# exits, with the same token consumed at each step. A template is that event
+# sequence, recorded once; replaying it into an _IntentBuilder with the new
+# tokens fills the slots without running the parser.
+_ENTER, _TOKEN, _EXIT = 0, 1, 2
+
+TEMPLATE_CACHE_SIZE = 512
+# token type tuple (EOF included) -> tuple of (op, rule) events
+TEMPLATES = LRUCache(TEMPLATE_CACHE_SIZE)
+
+
+class _RecordingBuilder(_IntentBuilder):
+    """``_IntentBuilder`` that also keeps the events it was fed."""
+    __slots__ = ("events",)
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def enter(self, rule: int) -> None:
+        self.events.append((_ENTER, rule))
+        super().enter(rule)
+
+    def token(self, ttype: int, text: str) -> None:
+        self.events.append((_TOKEN, 0))
+        super().token(ttype, text)
+
+    def exit(self, rule: int) -> None:
+        self.events.append((_EXIT, rule))
+        super().exit(rule)
+
+
+def _replay(template: tuple, tokens: list) -> dict:
+    return _replay_builder(template, tokens).skeleton()
+
+
+def _replay_builder(template: tuple, tokens: list) -> _IntentBuilder:
+    builder = _IntentBuilder()
+    # consumed tokens are the on-channel tokens in order (WS is skipped)
+    i = 0
+    for op, rule in template:
+        if op == _TOKEN:
+            tok = tokens[i]
+            i += 1
+            builder.token(tok.type, tok.text)
+        elif op == _ENTER:
+            builder.enter(rule)
+        else:
+            builder.exit(rule)
+    return builder
+
+
+def _template_skeleton(parser: _StreamingParser, visitor=None, report: bool = True,
+                       trace: ParseTrace | None = None) -> dict:
+    """Stream engine behind a cache of templates keyed on token types.
+
+    Only clean SLL parses are recorded; inputs that need the LL pass (error
+    recovery) are parsed every time.
+    """
+    stream = parser.getTokenStream()
+    stream.fill()
+    tokens = stream.tokens
+    key = tuple(tok.type for tok in tokens)
+    template = TEMPLATES.get(key)
+    if template is not None:
+        result = _replay(template, tokens)
+        if trace is not None:
+            trace.template = "hit"
+            trace.lap("parse")
+        return result
+    builder = _RecordingBuilder()
+    if not _stream_sll(parser, builder):
+        if trace is not None:
+            trace.template = "skip"
+        return _ll_skeleton(parser, visitor, report, trace)
+    TEMPLATES.put(key, tuple(builder.events))
+    if trace is not None:
+        trace.template = "miss"
+    return _sll_done(builder, trace)
+
+
+ENGINES = {"tree": _tree_skeleton, "stream": _stream_skeleton, "template": _template_skeleton}
+
+# Token sources: the generated ATN lexer or the equivalent regex lexer.
+LEXERS = {
+    "antlr": lambda text: AssistantDSLLexer(InputStream(text)),
+    "regex": RegexLexer,
+}
+
+
+# public helpers ───────────────────────────────────────────────────
+def parse_skeleton(text: str, engine: str = "tree", lexer: str = "antlr",
+                   trace: ParseTrace | None = None, timeout: float | None = None) -> dict:
+    """Parse *text* into an intent skeleton.
+
+    The skeleton does not depend on the clock: a relative due spec is kept
+    as a ``timedelta`` under ``DUE_IN`` so the result can be cached and
+    resolved later with :func:`resolve`. *engine* is ``"tree"`` (parse
+    tree + visitor), ``"stream"`` (no parse tree) or ``"template"`` (stream
+    engine behind the token-shape template cache); *lexer* is a key of
+    ``LEXERS``. A *trace* receives the stage timings. Parsing raises
+    :class:`ParseTimeout` when it runs for more than *timeout* seconds.
+    """
+    started = perf_counter()
+    tokens  = CommonTokenStream(LEXERS[lexer](text))
+    if trace is not None:
+        tokens.fill()  # lex up front so the lexer gets its own stage
+        trace.tokens = len(tokens.tokens) - 1
+        trace.lap("lex")
+    parser  = _StreamingParser(tokens)
+    if timeout is not None:
+        parser.deadline = started + timeout
+    return ENGINES[engine](parser, trace=trace)
+
+
+def explain_skeleton(text: str, engine: str = "tree", lexer: str = "antlr",
+                     timeout: float | None = None) -> Tuple[dict, dict]:
+    """``parse_skeleton`` plus its trace as a plain (picklable) dict."""
+    trace = ParseTrace()
+    skeleton = parse_skeleton(text, engine, lexer, trace, timeout)
+    return skeleton, trace.as_dict()
+
+
+class BatchParser:
+    """Parses many utterances with one lexer / token stream / parser.
+
+    Syntax errors are not printed: bulk jobs read them from the results.
+    """
+
+    def __init__(self, engine: str = "tree", lexer: str = "antlr"):
+        self.lexer   = LEXERS[lexer]("")
+        self.tokens  = CommonTokenStream(self.lexer)
+        self.parser  = _StreamingParser(self.tokens)
+        self.visitor = _Visitor()
+        self.engine  = ENGINES[engine]
+
+    def parse_skeleton(self, text: str, timeout: float | None = None) -> dict:
+        started = perf_counter()
+        if isinstance(self.lexer, RegexLexer):
+            self.lexer.set_text(text)
+        else:
+            self.lexer.inputStream = InputStream(text)  # resets the lexer
+        self.tokens.setTokenSource(self.lexer)      # drops buffered tokens
+        self.parser.setTokenStream(self.tokens)     # resets the parser
+        self.parser.deadline = None if timeout is None else started + timeout
+        return self.engine(self.parser, self.visitor, report=False)
+
+
+_batch_local = threading.local()
+
+
+def parse_many(texts: List[str], fastpath: bool = True, engine: str = "tree",
+               lexer: str = "antlr", timeout: float | None = None) -> List[dict]:
+    """Skeletons for *texts* in order, reusing this worker's BatchParser.
+
+    A failing utterance yields ``{"error": "cannot_parse"}`` (or
+    ``"parse_timeout"`` past the per-utterance *timeout*) instead of
+    aborting the rest of the batch.
+    """
+    parsers = getattr(_batch_local, "parsers", None)
+    if parsers is None:
+        parsers = _batch_local.parsers = {}
+    batch = parsers.get((engine, lexer))
+    if batch is None:
+        batch = parsers[(engine, lexer)] = BatchParser(engine, lexer)
+    results = []
+    for text in texts:
+        skeleton = dsl_fastpath.match(text) if fastpath else None
+        if skeleton is None:
+            try:
+                skeleton = batch.parse_skeleton(text, timeout)
+            except ParseTimeout:
+                skeleton = {"error": "parse_timeout"}
+            except Exception:
+                skeleton = {"error": "cannot_parse"}
+        results.append(skeleton)
+    return results
+
+
+def resolve(skeleton: dict, now: datetime | None = None) -> dict:
+    """Turn a skeleton into a fresh intent dict, resolving ``DUE_IN``."""
+    result = dict(skeleton)
+    if "commands" in result:
+        # one clock reading for the whole utterance
+        now = now or datetime.utcnow()
+        result["commands"] = [resolve(command, now) for command in result["commands"]]
+    if "updates" in result:
+        result["updates"] = dict(result["updates"])
+    due_in = result.pop(DUE_IN, None)
+    if due_in is not None:
+        due = (now or datetime.utcnow()) + due_in
+        result["task_date"], result["task_time"] = due.date(), due.time()
+    return result
+
+
 def parse(text: str) -> dict:
-    stream  = InputStream(text)
-    lexer   = AssistantDSLLexer(stream)
-    tokens  = CommonTokenStream(lexer)
-    parser  = AssistantDSLParser(tokens)
-    tree    = parser.program()
-    result  = _Visitor().visit(tree)
-    return result if result else {"error": "cannot_parse"}
\ No newline at end of file
+    return resolve(parse_skeleton(text))
+
+
+class _ErrorCount(ErrorListener):
+    def __init__(self):
+        self.count = 0
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.count += 1
+
+
+def accepts(text: str) -> bool:
+    """True if *text* lexes and parses without any error (nothing is printed).
+
+    ``parse_skeleton`` recovers from errors and may still return an intent;
+    this is the strict check.
+    """
+    lexer = RegexLexer(text)
+    lexer.removeErrorListeners()
+    errors = _ErrorCount()
+    lexer.addErrorListener(errors)
+    parser = AssistantDSLParser(CommonTokenStream(lexer))
+    try:
+        _parse_sll(parser)
+    except ParseCancellationException:
+        _parse_ll(parser, report=False)
+        return errors.count == 0 and parser.getNumberOfSyntaxErrors() == 0
+    return errors.count == 0
+
+
+# One sample per command alternative; parsing them fills the shared DFA cache.
+WARM_UP_SAMPLES = (
+    "hi my name is Anna",
+    "what is your name?",
+    "how are you?",
+    "list tasks instructions",
+    "list greeting instructions",
+    "list bot information",
+    "remind me to submit report at 2025-06-01 09:00 repeat every 2 days as pending",
+    "remind me to call mom in 30 minutes",
+    "show tasks",
+    "remind me to buy bread and milk in 2 hours and then show tasks",
+    "delete task submit report at 2025-06-01 09:00",
+    "update task submit report set status=done, title=report",
+    "yes",
+    "no",
+)
+
+
+def warm_up() -> None:
+    """Import and exercise the generated parser (pool worker initializer)."""
+    for text in WARM_UP_SAMPLES:
+        for engine in ENGINES:
+            for lexer in LEXERS:
+                parse_skeleton(text, engine, lexer)
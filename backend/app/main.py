@@ -2,11 +2,11 @@ import logging
 import os
 import sys
 
-# 1) Sinh ANTLR parser từ grammar (.g4)
-from app.utils.antlr_gen import generate as gen_antlr
+# 1) Kiểm tra ANTLR parser đã sinh sẵn (chỉ sinh lại khi ANTLR_GEN_MODE=dev)
+from app.utils.antlr_gen import ensure as ensure_antlr
 
 try:
-    gen_antlr()
+    ensure_antlr()
 except Exception as e:
     logging.error("ANTLR parser generation failed: %s", e)
     sys.exit(1)
@@ -18,6 +18,9 @@ from app.routers import auth, tasks, dsl, speech, chat, protected, users
 from app.core.config import settings
 from app.core.db import init_db
 from app.services.scheduler_service import init_scheduler
+from app.services.chat_service import ChatService
+from app.services.dsl_service import DSLService
+from app.services.suggestion_service import SuggestionService
 
 app = FastAPI(title=settings.PROJECT_NAME)
 
@@ -49,4 +52,13 @@ async def on_startup():
     # Tạo bảng nếu chưa có
     await init_db()
     # Khởi chạy scheduler (ví dụ APScheduler hoặc Celery beat)
-    init_scheduler()
\ No newline at end of file
+    init_scheduler()
+    # Chỉ mục gợi ý lệnh ("did you mean") cho input không parse được
+    SuggestionService.build()
+    # Bảng hướng dẫn là tĩnh: vẽ sẵn một lần
+    ChatService.prerender()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    DSLService.shutdown()
+    await ChatService.shutdown()
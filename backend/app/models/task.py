@@ -1,6 +1,6 @@
 # app/models/task.py
 import uuid
-from sqlalchemy import Column, String, Date, Time, Enum, ForeignKey, Float
+from sqlalchemy import Column, String, Date, Time, Enum, ForeignKey, Float, Index
 from app.core.db import Base
 from app.schemas.task import Status
 
@@ -13,4 +13,7 @@ class Task(Base):
     task_date = Column(Date)
     task_time = Column(Time)
     rrule = Column(String(255))
-    status = Column(Enum(Status), default=Status.pending)
\ No newline at end of file
+    status = Column(Enum(Status), default=Status.pending)
+
+    # chat "show tasks" pages through a user's tasks by due date, both ways (TaskService.page)
+    __table_args__ = (Index("ix_tasks_owner_due", "owner_id", "task_date", "task_time", "id"),)
@@ -1,18 +1,114 @@
 # app/routers/chat.py
-from fastapi import APIRouter, Depends
+import json
+import logging
+import time
+
+from fastapi import APIRouter, Depends, Header, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
 from app.schemas.chat import ChatRequest, ChatResponse
 from app.services.chat_service import ChatService
-from app.core.security import get_current_user
+from app.core.security import decode_token, get_current_user, user_from_token, websocket_token
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.db import get_session
+from app.core.db import SessionLocal, get_session
+from app.core.config import settings
+from app.core.metrics import METRICS
+
+LOG = logging.getLogger("chat")
 
 router = APIRouter()
 
+# Accept type of clients that draw tables themselves from JSON rows
+TABLE_MEDIA_TYPE = "application/vnd.va.table+json"
+TABLE_FORMATS = ("image", "png", "svg", "table")
+
+def _table_format(accept: str, format: str | None) -> str:
+    # explicit ?format= wins, then the Accept header, then the server default
+    if format in TABLE_FORMATS:
+        return format
+    if TABLE_MEDIA_TYPE in accept:
+        return "table"
+    if "image/svg+xml" in accept:
+        return "svg"
+    return settings.CHAT_TABLE_FORMAT
+
 @router.post("", response_model=ChatResponse)
 async def chat(
     req: ChatRequest,
+    response: Response,
+    format: str | None = None,
+    accept: str = Header(""),
+    if_none_match: str | None = Header(None),
     user=Depends(get_current_user),
     session: AsyncSession = Depends(get_session)
 ):
     svc = ChatService()
-    return await svc.handle(req, user=user, session=session)
+    response.headers["Vary"] = "Accept"
+    # DSL stages are recorded by DSLService; the rest is business logic
+    if req.etag is None and if_none_match:
+        req.etag = if_none_match.strip().removeprefix("W/").strip('"')
+    with METRICS.time("chat.handle_ms"):
+        resp = await svc.handle(req, user=user, session=session, fmt=_table_format(accept, format))
+    if resp.content_hash:
+        response.headers["ETag"] = f'"{resp.content_hash}"'
+    return resp
+
+@router.websocket("/ws")
+async def chat_ws(ws: WebSocket, format: str | None = None):
+    """Chat over one socket: authenticated once, messages handled in order.
+
+    The token (``Authorization: Bearer`` or ``?token=``) is checked at the
+    handshake; the user, the ChatService and the DB session are then kept
+    for the life of the socket (the session hands its connection back to
+    the pool between messages). Client messages are ``{"text": ...}`` with
+    optional ``etag``, ``format`` and ``id``; each reply is a ChatResponse
+    object, pushed as soon as it is ready, echoing ``id``. The socket is
+    closed with 1008 once the token expires.
+    """
+    token = websocket_token(ws)
+    claims = decode_token(token) if token else None
+    async with SessionLocal() as session:
+        user = await user_from_token(token, session) if claims else None
+        if user is None:
+            await ws.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+        await session.close()  # user stays loaded, detached from the session
+        await ws.accept()
+        svc = ChatService()
+        fmt = _table_format(ws.headers.get("accept", ""), format)
+        expires = claims.get("exp")
+        try:
+            while True:
+                raw = await ws.receive_text()
+                if expires is not None and time.time() >= expires:
+                    await ws.close(code=status.WS_1008_POLICY_VIOLATION, reason="token expired")
+                    return
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    msg = None
+                if not isinstance(msg, dict) or not isinstance(msg.get("text"), str):
+                    await ws.send_json({"error": "Expected {\"text\": string}"})
+                    continue
+                req = ChatRequest(text=msg["text"], etag=msg.get("etag"))
+                kind = msg.get("format") if msg.get("format") in TABLE_FORMATS else fmt
+                try:
+                    with METRICS.time("chat.handle_ms"):
+                        resp = await svc.handle(req, user=user, session=session, fmt=kind)
+                except Exception:
+                    LOG.exception("chat message failed")
+                    reply = {"error": "Internal error"}
+                else:
+                    reply = jsonable_encoder(resp)
+                finally:
+                    await session.close()
+                if "id" in msg:
+                    reply["id"] = msg["id"]
+                await ws.send_json(reply)
+        except WebSocketDisconnect:
+            pass
+
+@router.get("/stats")
+async def chat_stats(user=Depends(get_current_user)):
+    # pending confirmations (size, bytes, hit rate) and chat handler timings;
+    # store and pool internals, so signed-in users only
+    return await ChatService.stats()
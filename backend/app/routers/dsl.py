@@ -1,9 +1,146 @@
 # app/routers/dsl.py
-from fastapi import APIRouter
+import json
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.core.security import get_current_user, user_from_token, websocket_token
+from app.gen.dsl_incremental import IncrementalParser
 from app.services.dsl_service import DSLService
 
 router = APIRouter()
 
+SPOOL_MAX_MEMORY = 1 << 20  # bytes of NDJSON batch body kept in memory
+
 @router.post('/parse')
-async def parse_command(text: str):
-    return await DSLService.parse(text)
\ No newline at end of file
+async def parse_command(text: str, explain: bool = False):
+    # explain=true adds stage timings, prediction mode and cache status
+    return await DSLService.parse(text, explain=explain)
+
+def _utterance(item: Any) -> str | None:
+    # accept either "show tasks" or {"text": "show tasks"}
+    if isinstance(item, dict):
+        item = item.get("text")
+    return item if isinstance(item, str) else None
+
+async def _iter_list(texts: List[str]) -> AsyncIterator[str]:
+    for text in texts:
+        yield text
+
+def _too_large() -> HTTPException:
+    return HTTPException(status_code=413,
+                         detail=f"Batch body larger than {settings.DSL_BATCH_MAX_BYTES} bytes")
+
+async def _spool_body(request: Request) -> SpooledTemporaryFile:
+    # The body has to be consumed before the response starts streaming
+    # (Starlette listens for client disconnects on the same channel), so
+    # it is spooled to disk past SPOOL_MAX_MEMORY instead of kept in memory,
+    # and refused past DSL_BATCH_MAX_BYTES, declared or not.
+    limit = settings.DSL_BATCH_MAX_BYTES
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > limit:
+        raise _too_large()
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    size = 0
+    async for part in request.stream():
+        size += len(part)
+        if size > limit:
+            spool.close()
+            raise _too_large()
+        spool.write(part)
+    spool.seek(0)
+    return spool
+
+async def _iter_ndjson(spool: SpooledTemporaryFile) -> AsyncIterator[str]:
+    # a malformed line becomes an empty utterance and reports cannot_parse
+    try:
+        for line in spool:
+            if line.strip():
+                yield _ndjson_utterance(line)
+    finally:
+        spool.close()
+
+def _ndjson_utterance(line: bytes) -> str:
+    try:
+        return _utterance(json.loads(line)) or ""
+    except ValueError:
+        return ""
+
+@router.post('/parse/batch')
+async def parse_batch(request: Request, parallel: bool = False, user=Depends(get_current_user)):
+    """Parse a JSON array or NDJSON stream of utterances.
+
+    Results stream back as NDJSON lines ``{"index": i, "result": {...}}``
+    in input order. Signed-in users only; the body is capped at
+    ``DSL_BATCH_MAX_BYTES``.
+    """
+    spool = await _spool_body(request)
+    if "ndjson" in request.headers.get("content-type", ""):
+        texts = _iter_ndjson(spool)
+    else:
+        try:
+            body = json.load(spool)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body is not valid JSON")
+        finally:
+            spool.close()
+        items = [_utterance(item) for item in body] if isinstance(body, list) else None
+        if items is None or None in items:
+            raise HTTPException(status_code=400,
+                                detail="Expected a JSON array of strings or {\"text\": string} objects")
+        texts = _iter_list(items)
+
+    async def lines():
+        index = 0
+        async for result in DSLService.parse_batch(texts, parallel=parallel):
+            yield json.dumps({"index": index, "result": jsonable_encoder(result)}) + "\n"
+            index += 1
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.websocket('/incremental')
+async def parse_incremental(ws: WebSocket):
+    """Live parsing of an utterance that arrives in chunks (speech input).
+
+    Client messages: ``{"text": "<next words>"}`` appends a chunk and gets
+    the partial reading back (status, intent so far, due spec state);
+    ``{"final": true}`` parses the whole utterance like ``POST /parse``
+    and starts a new one; ``{"reset": true}`` drops it. The token
+    (``Authorization: Bearer`` or ``?token=``) is checked once, at the
+    handshake; without a valid one the socket is closed with 1008.
+    """
+    token = websocket_token(ws)
+    async with SessionLocal() as session:
+        user = await user_from_token(token, session) if token else None
+    if user is None:
+        await ws.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await ws.accept()
+    parser = IncrementalParser()
+    try:
+        while True:
+            msg = await ws.receive_json()
+            if not isinstance(msg, dict):
+                await ws.send_json({"error": "Expected a JSON object"})
+            elif msg.get("final"):
+                result = await DSLService.parse(parser.text)
+                parser.reset()
+                await ws.send_json({"final": jsonable_encoder(result)})
+            elif msg.get("reset"):
+                parser.reset()
+                await ws.send_json(parser.state())
+            elif isinstance(msg.get("text"), str):
+                await ws.send_json(jsonable_encoder(DSLService.feed(parser, msg["text"])))
+            else:
+                await ws.send_json({"error": "Expected {\"text\": string}, {\"final\": true} or {\"reset\": true}"})
+    except WebSocketDisconnect:
+        pass
+
+@router.get('/stats')
+async def parser_stats(user=Depends(get_current_user)):
+    # cache and pool internals: signed-in users only
+    return DSLService.stats()
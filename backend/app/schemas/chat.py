@@ -1,8 +1,29 @@
 # app/schemas/chat.py
+from typing import Any, List, Literal
+
 from pydantic import BaseModel
 
 class ChatRequest(BaseModel):
     text: str
+    # content_hash of the table image the client already has (or If-None-Match)
+    etag: str | None = None
+
+class TableColumn(BaseModel):
+    name: str
+    type: Literal["string", "date", "time"] = "string"
+
+class Table(BaseModel):
+    # cells are JSON values of their column's type: dates / times as ISO strings, null if unset
+    columns: List[TableColumn]
+    rows: List[List[Any]]
 
 class ChatResponse(BaseModel):
     reply: str
+    # content address of the table image in *reply*; same hash, same image
+    content_hash: str | None = None
+    # the request's etag still matches: *reply* is empty, reuse the cached image
+    not_modified: bool = False
+    # structured rows instead of an image, when the client asked for tables
+    table: Table | None = None
+    # a command sequence with several tables: all of them, in reply order (table is then unset)
+    tables: List[Table] | None = None
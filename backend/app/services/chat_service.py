@@ -1,69 +1,33 @@
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from enum import Enum
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Any, List, Tuple, Type
 
 from fastapi import Depends
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas.chat import ChatRequest, ChatResponse
+from app.schemas.chat import ChatRequest, ChatResponse, Table, TableColumn
 from app.schemas.task import TaskCreate, TaskUpdate
+from app.gen.dsl_intents import (AskIntent, CancelIntent, ConfirmIntent, CreateIntent, DeleteIntent,
+                                 GreetIntent, InstructionIntent, Intent, IntroduceIntent, NextPageIntent,
+                                 SequenceIntent, UpdateIntent, ViewIntent)
 from app.services.dsl_service import DSLService  # wraps our DSL parser
+from app.services.pending_store import make_store
+from app.services.render_service import RENDERERS, RenderService, render_table, table_key
 from app.services.task_service import TaskService
 from app.core.security import get_current_user
 from app.core.db import get_session
+from app.core.config import settings
+from app.core.metrics import METRICS
 
-# In‑memory store for pending confirmations
-_PENDING: Dict[Any, Dict[str, Any]] = {}
+# Pending confirmations, expired after PENDING_TTL (in memory or in Redis)
+_PENDING = make_store()
+# Where each user's "show tasks" listing stopped, for "more" / "next page"
+_CURSORS = make_store(name="view-cursor")
 
 # ────────────────────────── helpers ───────────────────────────
-from PIL import Image, ImageDraw, ImageFont  # used only for table rendering
-import io, base64
-
-def _table_to_img(rows: List[List[str]], max_width: int = 1000) -> str:
-    try:
-        font = ImageFont.truetype("arial.ttf", 11)
-    except IOError:
-        font = ImageFont.load_default()
-    pad, border = 8, 1
-    # Tính chiều rộng từng cột
-    col_w = [0] * len(rows[0])
-    for row in rows:
-        for i, cell in enumerate(row):
-            bbox = font.getbbox(cell)
-            w = bbox[2] - bbox[0]
-            col_w[i] = max(col_w[i], w)
-
-    row_h = (font.getbbox("Ag")[3] - font.getbbox("Ag")[1]) + pad * 2
-    tbl_w = sum(col_w) + pad * 2 * len(col_w) + border * (len(col_w) + 1)
-    tbl_h = row_h * len(rows) + border * (len(rows) + 1)
-    # Vẽ bảng lên ảnh gốc
-    img = Image.new("RGB", (tbl_w, tbl_h), "white")
-    draw = ImageDraw.Draw(img)
-    y = border
-    for row in rows:
-        x = border
-        for i, cell in enumerate(row):
-            cw = col_w[i] + pad * 2
-            draw.rectangle([x, y, x + cw, y + row_h], outline="black", width=border)
-            text_bbox = font.getbbox(cell)
-            text_w = text_bbox[2] - text_bbox[0]
-            text_h = text_bbox[3] - text_bbox[1]
-            tx = x + pad
-            ty = y + (row_h - text_h) // 2
-            draw.text((tx, ty), cell, fill="black", font=font)
-            x += cw + border
-        y += row_h + border
-    # Nếu quá rộng, thu nhỏ xuống max_width
-    if tbl_w > max_width:
-        scale = max_width / tbl_w
-        new_size = (int(tbl_w * scale), int(tbl_h * scale))
-        img = img.resize(new_size, Image.LANCZOS)
-    # Xuất ra data-URL
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    b64 = base64.b64encode(buf.getvalue()).decode()
-    return f'<img src="data:image/png;base64,{b64}" alt="table" />'
-
 def _build_instruction_rows(topic: str) -> List[List[str]]:
     """Return table rows with command names, descriptions, and examples for a given support topic."""
     if topic == "tasks":
@@ -86,9 +50,14 @@ def _build_instruction_rows(topic: str) -> List[List[str]]:
             ],
             [
                 "show tasks",
-                "List all tasks regardless date",
+                "List tasks a page at a time: upcoming first, then undated, then overdue",
                 "show tasks",
             ],
+            [
+                "more / next page",
+                "Show the next page of tasks",
+                "more",
+            ],
             [
                 "show tasks on <YYYY-MM-DD>",
                 "List tasks scheduled for specific date",
@@ -114,6 +83,11 @@ def _build_instruction_rows(topic: str) -> List[List[str]]:
                 "Confirm or cancel a pending action",
                 "yes",
             ],
+            [
+                "<command> and <command> ...",
+                "Run several commands at once; one yes/no answers them all",
+                "remind me to pay rent in 2 days and show tasks",
+            ],
         ]
     if topic == "greetings":
         return [
@@ -161,22 +135,61 @@ def _build_instruction_rows(topic: str) -> List[List[str]]:
     # default
     return [["Command", "Description", "Example"], ["help", "Show help tables", "help"]]
 
-async def _apply_pending(uid, positive: bool, session: AsyncSession, user) -> str:
-    if uid not in _PENDING:
-        return "⚠️ Nothing pending"
-    data = _PENDING.pop(uid)
+# Help tables never change while the app runs: (topic, kind) -> (reply, table_key)
+_INSTRUCTION_TABLES: Dict[Tuple[str, str], Tuple[str, str]] = {}
+INSTRUCTION_TOPICS = ("tasks", "greetings", "info")
+
+def _instruction_table(topic: str, kind: str = "png") -> Tuple[str, str]:
+    table = _INSTRUCTION_TABLES.get((topic, kind))
+    if table is None:
+        rows = _build_instruction_rows(topic)
+        reply, _ = render_table(rows, kind=kind)
+        table = _INSTRUCTION_TABLES[topic, kind] = (reply, table_key(rows, kind=kind))
+    return table
+
+@lru_cache(maxsize=None)
+def _instruction_data(topic: str) -> Table:
+    header, *rows = _build_instruction_rows(topic)
+    return Table(columns=[TableColumn(name=name) for name in header], rows=rows)
+
+_TASK_COLUMNS = [
+    TableColumn(name="Title"),
+    TableColumn(name="Status"),
+    TableColumn(name="Date", type="date"),
+    TableColumn(name="Time", type="time"),
+    TableColumn(name="Recurrence"),
+]
+
+def _cell_text(value: Any, type_: str) -> str:
+    if type_ == "date":
+        return value.strftime('%d/%m/%Y') if value else "N/A"
+    if type_ == "time":
+        return value.strftime('%H:%M') if value else "N/A"
+    if isinstance(value, Enum):  # Status: str() would give "Status.pending"
+        return str(value.value)
+    return "" if value is None else str(value)
+
+def _display_rows(table: Table) -> List[List[str]]:
+    """Header + text cells, as drawn in the image."""
+    types = [c.type for c in table.columns]
+    return [[c.name for c in table.columns]] + [
+        [_cell_text(value, t) for value, t in zip(row, types)] for row in table.rows
+    ]
+
+def _created_reply(task) -> str:
+    due_str = (
+        f"{task.task_time.strftime('%H:%M')} {task.task_date.strftime('%d/%m/%Y')}"
+        if task.task_date and task.task_time else "no due date"
+    )
+    return f"✅ Created reminder \"{task.title}\" – due {due_str}"
+
+async def _apply_action(data: dict, session: AsyncSession, user) -> str:
     action = data["action"]
-    if not positive:
-        return "❌ Okay, I’ve cancelled that request"
     # CREATE -------------------------------------------------------------------
     if action == "create":
         payload: dict[str, Any] = data["payload"]
         task = await TaskService.create(TaskCreate(**payload), session=session, user=user)
-        due_str = (
-            f"{task.task_time.strftime('%H:%M')} {task.task_date.strftime('%d/%m/%Y')}"
-            if task.task_date and task.task_time else "no due date"
-        )
-        return f"✅ Created reminder \"{task.title}\" – due {due_str}"
+        return _created_reply(task)
     # DELETE -------------------------------------------------------------------
     if action == "delete":
         await TaskService.delete(data["task_id"], session=session, user=user)
@@ -187,6 +200,246 @@ async def _apply_pending(uid, positive: bool, session: AsyncSession, user) -> st
         return "✏️ Task updated"
     return "⚠️ Unsupported pending action"
 
+async def _apply_pending(uid, positive: bool, session: AsyncSession, user) -> str:
+    data = await _PENDING.pop(uid)
+    if data is None:
+        return "⚠️ Nothing pending"
+    if not positive:
+        return "❌ Okay, I’ve cancelled that request"
+    if data["action"] != "batch":
+        return await _apply_action(data, session, user)
+    # BATCH (questions of one multi-command utterance) -------------------------
+    # every task write in one transaction; a missing task is reported, not raised
+    actions = data["actions"]
+    changes = [a for a in actions if a["action"] != "create"]
+    created, found = await TaskService.apply_many(
+        [TaskCreate(**a["payload"]) for a in actions if a["action"] == "create"],
+        [(a["task_id"], TaskUpdate(**a["updates"]) if a["action"] == "update" else None) for a in changes],
+        session=session, user=user,
+    )
+    lines = [_created_reply(t) for t in created]
+    for a, ok in zip(changes, found):
+        if not ok:
+            lines.append("⚠️ Task not found")
+        else:
+            lines.append("🗑️ Task deleted" if a["action"] == "delete" else "✏️ Task updated")
+    return "\n".join(lines)
+
+
+# ────────────────────────── intent handlers ───────────────────────────
+class _Context:
+    """Per-request state handed to every intent handler."""
+    __slots__ = ("uid", "session", "user", "fmt", "etag", "creates", "held")
+
+    def __init__(self, user, session: AsyncSession, fmt: str = "image", etag: str | None = None):
+        self.uid = getattr(user, "id", None)
+        self.session = session
+        self.user = user
+        self.fmt = fmt    # tables as "png" (<img>), "svg" (inline) or "table" (JSON rows)
+        self.etag = etag  # content_hash of the table the client already has
+        # inside a SequenceIntent: tasks to create together, actions to confirm together
+        self.creates: List[TaskCreate] | None = None
+        self.held: List[dict] | None = None
+
+async def _hold(ctx: _Context, data: dict) -> None:
+    # wait for a "yes"; a sequence asks once for all of its actions
+    if ctx.held is not None:
+        ctx.held.append(data)
+    else:
+        await _PENDING.put(ctx.uid, data)
+
+# One coroutine per intent type: (intent, ctx) -> ChatResponse.
+
+# 2️⃣ Greetings ---------------------------------------------------------------
+async def _greet(intent: GreetIntent, ctx: _Context) -> ChatResponse:
+    name = intent.name
+    return ChatResponse(reply=f"Hello {name + ' ' if name else ''}👋 What can I do for you ?")
+
+# 3️⃣ Introduce ---------------------------------------------------------------
+async def _introduce(intent: IntroduceIntent, ctx: _Context) -> ChatResponse:
+    return ChatResponse(reply="My name is HAF. How can I assist you ?")
+
+# 3.1️⃣ Ask -------------------------------------------------------------------
+async def _ask(intent: AskIntent, ctx: _Context) -> ChatResponse:
+    return ChatResponse(reply=f"That's an interesting question: '{intent.question or ''}'. 🤖")
+
+# 4️⃣ Instructions ------------------------------------------------------------
+async def _instruction(intent: InstructionIntent, ctx: _Context) -> ChatResponse:
+    # topics produced by the DSL visitor: tasks / greetings / infor
+    topic = intent.topic or "tasks"
+    if topic == "infor":
+        topic = "info"  # nicer alias
+    if ctx.fmt == "table":
+        return ChatResponse(reply=f"📖 {topic.capitalize()} commands", table=_instruction_data(topic))
+    reply, digest = _instruction_table(topic, ctx.fmt)
+    if ctx.etag == digest:
+        return ChatResponse(reply="", content_hash=digest, not_modified=True)
+    return ChatResponse(reply=reply, content_hash=digest)
+
+# 5️⃣ Create ------------------------------------------------------------------
+async def _create(intent: CreateIntent, ctx: _Context) -> ChatResponse:
+    payload = {
+        "title": intent.title,
+        "task_date": intent.task_date,
+        "task_time": intent.task_time,
+        "rrule": intent.repeat,
+        "status": intent.status or "pending",
+    }
+    missing: List[str] = [
+        label for cond, label in (
+            (payload["task_date"], "date"),
+            (payload["task_time"], "time"),
+            (payload["rrule"],    "recurrence rule"),
+        ) if cond is None
+    ]
+    if missing:
+        await _hold(ctx, {"action": "create", "payload": payload})
+        parts = ", ".join(missing)
+        return ChatResponse(reply=(f"You didn't specify {parts}. Create reminder \"{payload['title']}\" anyway? (Yes/No)"))
+    if ctx.creates is not None:
+        # written with the rest of the sequence (_sequence)
+        ctx.creates.append(TaskCreate(**payload))
+        return ChatResponse(reply=_created_reply(ctx.creates[-1]))
+    task = await TaskService.create(TaskCreate(**payload), session=ctx.session, user=ctx.user)
+    return ChatResponse(reply=_created_reply(task))
+
+# 6️⃣ Delete ------------------------------------------------------------------
+async def _delete(intent: DeleteIntent, ctx: _Context) -> ChatResponse:
+    task = await TaskService.get_by_ref(
+        intent.title,
+        task_date=intent.task_date,
+        task_time=intent.task_time,
+        session=ctx.session, user=ctx.user,
+    )
+    if not task:
+        return ChatResponse(reply="⚠️ Task not found")
+    await _hold(ctx, {"action": "delete", "task_id": task.id})
+    return ChatResponse(reply=f"Delete task \"{task.title}\" ? (Yes/No)")
+
+# 7️⃣ Update ------------------------------------------------------------------
+async def _update(intent: UpdateIntent, ctx: _Context) -> ChatResponse:
+    if not intent.updates:
+        # nothing parsed after "set": never confirm an empty edit
+        return ChatResponse(reply="⚠️ Nothing to update. Use: update task <title> set <field>=<value>")
+    task = await TaskService.get_by_ref(
+        intent.title,
+        task_date=intent.task_date,
+        task_time=intent.task_time,
+        session=ctx.session, user=ctx.user,
+    )
+    if not task:
+        return ChatResponse(reply="⚠️ Task not found")
+    try:
+        # checked now, so a "yes" never applies an edit that cannot be written
+        updates = TaskUpdate(**intent.updates).model_dump(exclude_unset=True)
+    except ValidationError:
+        return ChatResponse(reply="⚠️ Invalid value. Use: update task <title> set <field>=<value>")
+    if not updates:
+        # only unknown fields, e.g. "set colour=red"
+        return ChatResponse(reply="⚠️ Nothing to update. Use: update task <title> set <field>=<value>")
+    await _hold(ctx, {
+        "action": "update",
+        "task_id": task.id,
+        "updates": updates,
+    })
+    return ChatResponse(reply=f"Update task \"{task.title}\" ? (Yes/No)")
+
+# 8️⃣ Cancel ------------------------------------------------------------------
+async def _cancel(intent: CancelIntent, ctx: _Context) -> ChatResponse:
+    ok = await TaskService.cancel_by_ref(intent.title, session=ctx.session, user=ctx.user)
+    return ChatResponse(reply="🚫 Task cancelled." if ok else "⚠️ Task not found")
+
+# 9️⃣ View --------------------------------------------------------------------
+async def _task_page(ctx: _Context, state: dict | None) -> ChatResponse:
+    # one bounded page, upcoming tasks first; the cursor is kept for "more"
+    after = state["after"] if state else None
+    shown = state["shown"] if state else 0
+    tasks, cursor = await TaskService.page(ctx.user, ctx.session, after, settings.CHAT_PAGE_SIZE)
+    if cursor is not None:
+        await _CURSORS.put(ctx.uid, {"after": cursor, "shown": shown + len(tasks)})
+    if not tasks:
+        return ChatResponse(reply="📭 No more tasks" if state else "📭 You have no tasks")
+    # Build table with detailed task info: Title, Status, Date, Time, Recurrence
+    table = Table(columns=_TASK_COLUMNS, rows=[
+        [t.title, t.status, t.task_date, t.task_time, getattr(t, "rrule", None) or None] for t in tasks
+    ])
+    more = "\nSay \"more\" for the next page." if cursor is not None else ""
+    if ctx.fmt == "table":
+        return ChatResponse(reply=f"📋 Tasks {shown + 1}–{shown + len(tasks)}{more}", table=table)
+    # drawn in the render pool: a long task list must not block the event loop
+    reply, key = await RenderService.table(_display_rows(table), etag=ctx.etag, kind=ctx.fmt)
+    if reply is None:
+        return ChatResponse(reply="", content_hash=key, not_modified=True)
+    return ChatResponse(reply=reply + more, content_hash=key)
+
+async def _view(intent: ViewIntent, ctx: _Context) -> ChatResponse:
+    await _CURSORS.pop(ctx.uid)  # a new listing starts over
+    return await _task_page(ctx, None)
+
+async def _next_page(intent: NextPageIntent, ctx: _Context) -> ChatResponse:
+    state = await _CURSORS.pop(ctx.uid)
+    if state is None:
+        return ChatResponse(reply="📭 No more tasks. Say \"show tasks\" to start over.")
+    return await _task_page(ctx, state)
+
+# 🔟 Confirm ------------------------------------------------------------------
+async def _confirm(intent: ConfirmIntent, ctx: _Context) -> ChatResponse:
+    msg = await _apply_pending(ctx.uid, bool(intent.value), ctx.session, ctx.user)
+    return ChatResponse(reply=msg)
+
+# 1️⃣1️⃣ Sequence -------------------------------------------------------------
+async def _flush(ctx: _Context) -> None:
+    if ctx.creates:
+        await TaskService.create_many(ctx.creates, session=ctx.session, user=ctx.user)
+        ctx.creates = []
+
+async def _sequence(intent: SequenceIntent, ctx: _Context) -> ChatResponse:
+    """Run the commands of one utterance in order and join their replies.
+
+    Consecutive creates are written in one transaction (one flush, one
+    commit, one reminder-scheduling call), before any later command that
+    reads or changes tasks. Questions are asked once: a single "yes" or
+    "no" answers all of them. With ``fmt="table"`` several tables come back
+    in ``tables``, one per command that listed something.
+    """
+    ctx.creates, ctx.held = [], []
+    ctx.etag = None  # the joined reply is never "not modified"
+    replies: List[ChatResponse] = []
+    for command in intent.commands:
+        if not isinstance(command, CreateIntent):
+            await _flush(ctx)
+        handler = _HANDLERS.get(type(command))
+        if handler is not None and handler is not _sequence:
+            replies.append(await handler(command, ctx))
+    await _flush(ctx)
+    lines = [r.reply for r in replies if r.reply]
+    if len(ctx.held) == 1:
+        await _PENDING.put(ctx.uid, ctx.held[0])
+    elif ctx.held:
+        await _PENDING.put(ctx.uid, {"action": "batch", "actions": ctx.held})
+        lines.append(f"One yes / no answers all {len(ctx.held)} questions.")
+    tables = [r.table for r in replies if r.table is not None]
+    if len(tables) > 1:
+        return ChatResponse(reply="\n".join(lines), tables=tables)
+    return ChatResponse(reply="\n".join(lines), table=tables[0] if tables else None)
+
+_Handler = Callable[[Intent, _Context], Awaitable[ChatResponse]]
+
+_HANDLERS: Dict[Type[Intent], _Handler] = {
+    GreetIntent: _greet,
+    IntroduceIntent: _introduce,
+    AskIntent: _ask,
+    InstructionIntent: _instruction,
+    CreateIntent: _create,
+    DeleteIntent: _delete,
+    UpdateIntent: _update,
+    CancelIntent: _cancel,
+    ViewIntent: _view,
+    NextPageIntent: _next_page,
+    ConfirmIntent: _confirm,
+    SequenceIntent: _sequence,
+}
+
 
 # ────────────────────────── ChatService ───────────────────────────
 class ChatService:
@@ -195,123 +448,48 @@ class ChatService:
         req: ChatRequest,
         user = Depends(get_current_user),
         session: AsyncSession = Depends(get_session),
+        fmt: str = "image",
     ) -> ChatResponse:
-        """Main entry – parse DSL then route to business logic."""
-        parsed = await DSLService.parse(req.text)
+        """Main entry – parse DSL then route to business logic.
+
+        *fmt* selects how table replies are sent: ``"png"`` / ``"svg"``
+        put an image in ``reply`` (``"image"``: ``RENDER_IMAGE_FORMAT``),
+        ``"table"`` returns the rows in ``table`` instead.
+        """
+        if fmt == "image":
+            fmt = settings.RENDER_IMAGE_FORMAT
+        intent = await DSLService.parse_intent(req.text)
 
         # 1️⃣ Parse errors ------------------------------------------------------
-        if "error" in parsed:
-            return ChatResponse(reply=parsed["error"])
-
-        action = parsed["action"]
-        uid = getattr(user, "id", None)
-
-        # 2️⃣ Greetings ---------------------------------------------------------
-        if action == "greet":
-            name = parsed.get("name")
-            return ChatResponse(reply=f"Hello {name + ' ' if name else ''}👋 What can I do for you ?")
-
-        # 3️⃣ Introduce ---------------------------------------------------------
-        if action == "introduce":
-            return ChatResponse(reply="My name is HAF. How can I assist you ?")
-
-        # 3.1️⃣ Ask -------------------------------------------------------------
-        if action == "ask":
-            question = parsed.get("question", "")
-            return ChatResponse(reply=f"That's an interesting question: '{question}'. 🤖")
-
-        # 4️⃣ Instructions ------------------------------------------------------
-        if action.startswith("instruction"):
-            # Example actions produced by DSL visitor:
-            #   instruction_tasks / instruction_greetings / instruction_infor
-            topic = action.split("_", 1)[-1] if "_" in action else "tasks"
-            if topic == "infor":
-                topic = "info"  # nicer alias
-            rows = _build_instruction_rows(topic)
-            return ChatResponse(reply=_table_to_img(rows))
-
-        # 5️⃣ Create ------------------------------------------------------------
-        if action == "create":
-            payload = {
-                "title": parsed.get("title"),
-                "task_date": parsed.get("task_date"),
-                "task_time": parsed.get("task_time"),
-                "rrule": parsed.get("repeat"),
-                "status": parsed.get("status") or "pending",
-            }
-            missing: List[str] = [
-                label for cond, label in (
-                    (payload["task_date"], "date"),
-                    (payload["task_time"], "time"),
-                    (payload["rrule"],    "recurrence rule"),
-                ) if cond is None
-            ]
-            if missing:
-                _PENDING[uid] = {"action": "create", "payload": payload}
-                parts = ", ".join(missing)
-                return ChatResponse(reply=(f"You didn't specify {parts}. Create reminder \"{payload['title']}\" anyway? (Yes/No)"))
-            task = await TaskService.create(TaskCreate(**payload), session=session, user=user)
-            due_str = (
-                f"{task.task_time.strftime('%H:%M')} {task.task_date.strftime('%d/%m/%Y')}"
-                if task.task_date and task.task_time else "no due date"
-            )
-            return ChatResponse(reply=f"✅ Created reminder \"{task.title}\" – due {due_str}")
-
-        # 6️⃣ Delete ------------------------------------------------------------
-        if action == "delete":
-            task = await TaskService.get_by_ref(
-                parsed.get("title"),
-                task_date=parsed.get("task_date"),
-                task_time=parsed.get("task_time"),
-                session=session, user=user,
-            )
-            if not task:
-                return ChatResponse(reply="⚠️ Task not found")
-            _PENDING[uid] = {"action": "delete", "task_id": task.id}
-            return ChatResponse(reply=f"Delete task \"{task.title}\" ? (Yes/No)")
-
-        # 7️⃣ Update ------------------------------------------------------------
-        if action == "update":
-            task = await TaskService.get_by_ref(
-                parsed.get("title"),
-                task_date=parsed.get("task_date"),
-                task_time=parsed.get("task_time"),
-                session=session, user=user,
-            )
-            if not task:
-                return ChatResponse(reply="⚠️ Task not found")
-            _PENDING[uid] = {
-                "action": "update",
-                "task_id": task.id,
-                "updates": parsed.get("updates", {})
-            }
-            return ChatResponse(reply=f"Update task \"{task.title}\" ? (Yes/No)")
-
-        # 8️⃣ Cancel ------------------------------------------------------------
-        if action == "cancel":
-            ok = await TaskService.cancel_by_ref(parsed["title"], session=session, user=user)
-            return ChatResponse(reply="🚫 Task cancelled." if ok else "⚠️ Task not found")
-
-                # 9️⃣ View --------------------------------------------------------------
-        if action == "view":
-            # Ignore any date filter to list all tasks
-            tasks = await TaskService.list(None, session=session, user=user)
-            if not tasks:
-                return ChatResponse(reply="📭 You have no tasks")
-            # Build table with detailed task info: Title, Status, Date, Time, Recurrence
-            rows: List[List[str]] = [["Title", "Status", "Date", "Time", "Recurrence"]]
-            for t in tasks:
-                date_str = t.task_date.strftime('%d/%m/%Y') if t.task_date else "N/A"
-                time_str = t.task_time.strftime('%H:%M') if t.task_time else "N/A"
-                recurrence = t.rrule if getattr(t, "rrule", None) else ""
-                rows.append([t.title, t.status, date_str, time_str, recurrence])
-            return ChatResponse(reply=_table_to_img(rows))
-
-        # 🔟 Confirm ------------------------------------------------------------
-        if action == "confirm":
-            positive: bool = parsed["value"]
-            msg = await _apply_pending(uid, positive, session, user)
-            return ChatResponse(reply=msg)
+        if not isinstance(intent, Intent):
+            reply = intent["error"]
+            if intent.get("did_you_mean"):
+                examples = " / ".join(f'"{s["example"]}"' for s in intent["did_you_mean"])
+                reply += f" Did you mean: {examples}?"
+            return ChatResponse(reply=reply)
+
+        handler = _HANDLERS.get(type(intent))
+        if handler is not None:
+            return await handler(intent, _Context(user, session, fmt, req.etag))
 
         # Fallback -------------------------------------------------------------
         return ChatResponse(reply="❓ Sorry, I don't have a response for that yet")
+
+    @staticmethod
+    def prerender() -> None:
+        """Render the help tables once, so instruction replies cost no drawing."""
+        for topic in INSTRUCTION_TOPICS:
+            for kind in RENDERERS:
+                _instruction_table(topic, kind)
+
+    @staticmethod
+    async def stats() -> dict:
+        return {"pending": await _PENDING.stats(), "cursors": await _CURSORS.stats(),
+                "render": RenderService.stats(),
+                "metrics": METRICS.snapshot("chat.")}
+
+    @staticmethod
+    async def shutdown() -> None:
+        RenderService.shutdown()
+        await _PENDING.close()
+        await _CURSORS.close()
@@ -1,18 +1,241 @@
 # app/services/dsl_service.py
+import asyncio
+import logging
+from collections import deque
+from time import perf_counter
+from typing import AsyncIterable, AsyncIterator, List
 
-from app.gen.dsl_parser import parse as antlr_parse
+from app.core.config import settings
+from app.core.metrics import METRICS
+from app.gen import dsl_fastpath
+from app.gen.dsl_cache import LRUCache, normalize
+from app.gen.dsl_incremental import PREFIXES, IncrementalParser
+from app.gen.dsl_intents import Intent, from_skeleton
+from app.gen.dsl_lexer import count_tokens
+from app.gen.dsl_parser import (PREDICTION_STATS, TEMPLATES, ParseTimeout, explain_skeleton,
+                                parse_many, parse_skeleton, resolve, warm_up)
+from app.services.suggestion_service import SuggestionService
+from app.services.worker_pool import PoolBusy, WorkerPool
+
+LOG = logging.getLogger("dsl_service")
+
+# Intents keyed on normalized text; relative due specs stay symbolic so a
+# cached entry is resolved against the clock on every lookup.
+_cache = LRUCache(maxsize=settings.DSL_CACHE_SIZE)
+_fastpath_hits = 0
+
+# ANTLR parsing is CPU-bound; keep it off the event loop.
+_pool = WorkerPool(
+    mode=settings.DSL_EXECUTOR,
+    workers=settings.DSL_WORKERS,
+    queue_size=settings.DSL_QUEUE_SIZE,
+    timeout=settings.DSL_TIMEOUT,
+    initializer=warm_up if settings.DSL_EXECUTOR == "process" else None,
+    name="dsl-parse",
+)
+
+def _fast_skeleton(text: str) -> dict | None:
+    global _fastpath_hits
+    skeleton = dsl_fastpath.match(text)
+    if skeleton is None:
+        return None
+    _fastpath_hits += 1
+    if settings.DEBUG:
+        # Consistency check: the pre-parser must agree with ANTLR.
+        expected = parse_skeleton(text)
+        if expected != skeleton:
+            LOG.error("DSL fast path mismatch for %r: %r != %r", text, skeleton, expected)
+            return expected
+    return skeleton
+
+def _record(info: dict) -> None:
+    for stage, ms in info["stages_ms"].items():
+        METRICS.observe(f"dsl.{stage}_ms", ms)
+    if "tokens" in info:
+        METRICS.observe("dsl.tokens", info["tokens"])
+
+def _check_limits(text: str) -> dict | None:
+    # cheap checks on the event loop, so oversized input never reaches a worker
+    if len(text) > settings.DSL_MAX_CHARS:
+        return {"error": "input_too_long", "limit": settings.DSL_MAX_CHARS, "length": len(text)}
+    tokens = count_tokens(text, settings.DSL_MAX_TOKENS)
+    if tokens > settings.DSL_MAX_TOKENS:
+        return {"error": "too_many_tokens", "limit": settings.DSL_MAX_TOKENS}
+    return None
+
+def _unparsed(text: str, error: str) -> dict:
+    # closest valid commands, so the user does not have to guess variations
+    result = {"error": error}
+    if settings.DSL_SUGGESTIONS > 0:
+        suggestions = SuggestionService.suggest(text, settings.DSL_SUGGESTIONS)
+        if suggestions:
+            result["did_you_mean"] = suggestions
+    return result
+
+# Utterances handed to a worker at once by parse_batch.
+BATCH_CHUNK_SIZE = 64
+
+async def _parse_chunk(chunk: List[str]) -> List[dict]:
+    rejected = [_check_limits(text) for text in chunk]
+    accepted = [text for text, error in zip(chunk, rejected) if error is None]
+    skeletons = []
+    while accepted:
+        try:
+            skeletons = await _pool.run(parse_many, accepted, settings.DSL_FASTPATH,
+                                        settings.DSL_ENGINE, settings.DSL_LEXER,
+                                        settings.DSL_PARSE_DEADLINE)
+            break
+        except PoolBusy:
+            # batch jobs yield to interactive traffic instead of failing
+            await asyncio.sleep(0.05)
+        except asyncio.TimeoutError:
+            skeletons = [{"error": "parse_timeout"}] * len(accepted)
+            break
+    parsed = iter(skeletons)
+    return [error or resolve(next(parsed)) for error in rejected]
+
+async def _parse(text: str, explain: bool = False):
+    """``(intent or error dict, trace info or None)`` for *text*.
+
+    The cache holds :class:`Intent` objects, built once per entry; hits
+    share them and only relative due specs are resolved per lookup.
+    """
+    rejected = _check_limits(text)
+    if rejected is not None:
+        return rejected, None
+    traced = explain or METRICS.enabled
+    info = None
+    t0 = perf_counter() if traced else 0.0
+    skeleton = _fast_skeleton(text) if settings.DSL_FASTPATH else None
+    if skeleton is not None:
+        intent = from_skeleton(skeleton)
+        if traced:
+            info = {"cache": "fastpath", "stages_ms": {}}
+    else:
+        key = normalize(text)
+        t1 = perf_counter() if traced else 0.0
+        intent = _cache.get(key)
+        if traced:
+            info = {"cache": "miss" if intent is None else "hit",
+                    "stages_ms": {"cache": (perf_counter() - t1) * 1e3}}
+        if intent is None:
+            try:
+                if traced:
+                    skeleton, trace = await _pool.run(explain_skeleton, text,
+                                                      settings.DSL_ENGINE, settings.DSL_LEXER,
+                                                      settings.DSL_PARSE_DEADLINE)
+                    info["stages_ms"].update(trace.pop("stages_ms"))
+                    info.update(trace)
+                else:
+                    skeleton = await _pool.run(parse_skeleton, text,
+                                               settings.DSL_ENGINE, settings.DSL_LEXER,
+                                               None, settings.DSL_PARSE_DEADLINE)
+            except PoolBusy:
+                return {"error": "parser_busy"}, None
+            except (asyncio.TimeoutError, ParseTimeout):
+                return {"error": "parse_timeout"}, None
+            except Exception as e:
+                print("Parser error:", e)
+                return _unparsed(text, "cannot_parse"), None
+            # workers hand back plain skeleton dicts; error results are cached as-is
+            intent = from_skeleton(skeleton) if isinstance(skeleton, dict) else None
+            _cache.put(key, intent or skeleton)
+
+    # error input
+    if isinstance(intent, Intent):
+        result = intent.resolve()
+    else:
+        result = _unparsed(text, "Error input! Please check your input again.")
+
+    if info is not None:
+        info["stages_ms"]["total"] = (perf_counter() - t0) * 1e3
+        _record(info)
+    return result, info
 
 class DSLService:
     @staticmethod
-    async def parse(text: str) -> dict:
-        try:
-            result = antlr_parse(text)
-        except Exception as e:
-            print("Parser error:", e)
-            return {"error": "cannot_parse"}
+    async def parse(text: str, explain: bool = False) -> dict:
+        """Parse *text* into an intent dict.
 
-        # error input
-        if not isinstance(result, dict) or "action" not in result:
-            return {"error": "Error input! Please check your input again."}
+        With *explain* (or ``METRICS_ENABLED``) the parse is traced: stage
+        timings in ms, token count, prediction mode and cache status. They
+        go to ``METRICS`` and, with *explain*, into ``result["explain"]``.
+        """
+        result, info = await _parse(text, explain)
+        if isinstance(result, Intent):
+            result = result.as_dict()
+        if explain and info is not None:
+            result["explain"] = info
+        return result
 
+    @staticmethod
+    async def parse_intent(text: str) -> Intent | dict:
+        """Parse *text* into an :class:`Intent`, or an error dict."""
+        result, _ = await _parse(text)
         return result
+
+    @staticmethod
+    async def parse_batch(texts: AsyncIterable[str], parallel: bool = False) -> AsyncIterator[dict]:
+        """Yield one result per utterance, in input order, as chunks complete.
+
+        Utterances are parsed in chunks by the worker pool, each worker
+        reusing a single lexer/parser pair. With *parallel* up to
+        ``DSL_WORKERS`` chunks are in flight; otherwise one at a time.
+        Only the in-flight chunks are held in memory. The interactive
+        parse cache is bypassed so bulk jobs do not evict hot entries.
+        """
+        window = max(1, _pool.workers) if parallel else 1
+        pending: deque = deque()
+        chunk: List[str] = []
+        try:
+            async for text in texts:
+                chunk.append(text)
+                if len(chunk) < BATCH_CHUNK_SIZE:
+                    continue
+                pending.append(asyncio.ensure_future(_parse_chunk(chunk)))
+                chunk = []
+                while len(pending) >= window:
+                    for result in await pending.popleft():
+                        yield result
+            if chunk:
+                pending.append(asyncio.ensure_future(_parse_chunk(chunk)))
+            while pending:
+                for result in await pending.popleft():
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def feed(parser: IncrementalParser, chunk: str) -> dict:
+        """Append *chunk* of a live utterance and return its partial reading.
+
+        Runs on the event loop: only the tail of the utterance is re-lexed
+        and parses of known token prefixes are replayed from a cache.
+        """
+        if len(parser.text) + len(chunk) > settings.DSL_MAX_CHARS:
+            parser.reset()
+            return {"error": "input_too_long", "limit": settings.DSL_MAX_CHARS}
+        state = parser.feed(chunk)
+        if state["tokens"] > settings.DSL_MAX_TOKENS:
+            parser.reset()
+            return {"error": "too_many_tokens", "limit": settings.DSL_MAX_TOKENS}
+        if state["intent"] is not None:
+            state["intent"] = resolve(state["intent"])
+        return state
+
+    @staticmethod
+    def stats() -> dict:
+        return {
+            "cache": _cache.stats(),
+            "fastpath_hits": _fastpath_hits,
+            "prediction": dict(PREDICTION_STATS),
+            "templates": TEMPLATES.stats(),
+            "prefixes": PREFIXES.stats(),
+            "metrics": METRICS.snapshot(),
+            "pool": _pool.stats(),
+        }
+
+    @staticmethod
+    def shutdown() -> None:
+        _pool.shutdown()
@@ -0,0 +1,225 @@
+# app/services/pending_store.py
+"""Pending chat actions waiting for a "yes" / "no", one per user.
+
+Entries expire after ``ttl`` seconds and at most ``maxsize`` are kept (the
+oldest is evicted first). ``memory`` keeps them in the process and suits a
+single uvicorn worker; ``redis`` shares them between workers, so the
+confirmation may land on any of them. Both store the JSON-encoded action,
+dates and times as ISO strings (the Task schemas parse them back).
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, time as dtime
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+BACKENDS = ("memory", "redis")
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, (date, dtime)):
+        return value.isoformat()
+    raise TypeError(f"cannot store {type(value).__name__} in a pending action")
+
+
+def encode(data: dict) -> str:
+    return json.dumps(data, default=_default, separators=(",", ":"))
+
+
+class MemoryPendingStore:
+    """In-process store: an insertion-ordered dict of ``uid -> (expires, json)``.
+
+    With one TTL for every entry the insertion order is also the expiry
+    order, so expired entries are purged from the front without a scan.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 10_000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def _drop(self, uid: Hashable) -> str:
+        _, raw = self._data.pop(uid)
+        self._bytes -= len(raw)
+        return raw
+
+    def _purge(self, now: float) -> None:
+        while self._data:
+            uid, (expires, _) = next(iter(self._data.items()))
+            if expires > now:
+                break
+            self._drop(uid)
+            self.expired += 1
+
+    async def put(self, uid: Hashable, data: dict) -> None:
+        raw = encode(data)
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            if uid in self._data:
+                self._drop(uid)
+            self._data[uid] = (now + self.ttl, raw)
+            self._bytes += len(raw)
+            while len(self._data) > self.maxsize:
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+
+    async def pop(self, uid: Hashable) -> Optional[dict]:
+        with self._lock:
+            self._purge(self._clock())
+            if uid not in self._data:
+                self.misses += 1
+                return None
+            self.hits += 1
+            raw = self._drop(uid)
+        return json.loads(raw)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.expired = self.evictions = 0
+
+    async def stats(self) -> dict:
+        with self._lock:
+            self._purge(self._clock())
+            lookups = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisPendingStore:
+    """Store shared by every worker through Redis.
+
+    ``<prefix>data`` is a hash ``uid -> json`` and ``<prefix>expires`` a
+    sorted set ``uid -> expiry timestamp``: expired entries are dropped on
+    every access and the lowest scores are evicted past ``maxsize``. The
+    counters live in ``<prefix>stats`` so hit rates cover all workers.
+    """
+
+    def __init__(self, url: str, ttl: float = 300, maxsize: int = 10_000,
+                 prefix: str = "va:pending:", client=None):
+        if client is None:
+            import redis.asyncio as redis  # only needed with PENDING_BACKEND=redis
+            client = redis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._redis = client
+        self._data = prefix + "data"
+        self._expires = prefix + "expires"
+        self._stats = prefix + "stats"
+
+    async def _purge(self, now: float) -> None:
+        from redis.exceptions import WatchError
+
+        # WATCH the sorted set: if another worker's put refreshes an entry
+        # between the read and the delete, the transaction is dropped and
+        # the expired entries are read again, so a fresh action survives
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(self._expires)
+                    expired = await pipe.zrangebyscore(self._expires, "-inf", now)
+                    if not expired:
+                        return
+                    pipe.multi()
+                    pipe.hdel(self._data, *expired)
+                    pipe.zrem(self._expires, *expired)
+                    pipe.hincrby(self._stats, "expired", len(expired))
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    async def put(self, uid: Hashable, data: dict) -> None:
+        now = time.time()
+        await self._purge(now)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._data, str(uid), encode(data))
+            pipe.zadd(self._expires, {str(uid): now + self.ttl})
+            pipe.zcard(self._expires)
+            # nothing outlives its TTL, even if no worker touches the store again
+            pipe.expire(self._data, int(self.ttl) + 1)
+            pipe.expire(self._expires, int(self.ttl) + 1)
+            size = (await pipe.execute())[2]
+        if size > self.maxsize:
+            evicted = [uid for uid, _ in await self._redis.zpopmin(self._expires, size - self.maxsize)]
+            if evicted:
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.hdel(self._data, *evicted)
+                    pipe.hincrby(self._stats, "evictions", len(evicted))
+                    await pipe.execute()
+
+    async def pop(self, uid: Hashable) -> Optional[dict]:
+        await self._purge(time.time())
+        # read and delete in one transaction: only one worker gets the action
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hget(self._data, str(uid))
+            pipe.hdel(self._data, str(uid))
+            pipe.zrem(self._expires, str(uid))
+            raw = (await pipe.execute())[0]
+        await self._redis.hincrby(self._stats, "misses" if raw is None else "hits", 1)
+        return None if raw is None else json.loads(raw)
+
+    async def clear(self) -> None:
+        await self._redis.delete(self._data, self._expires, self._stats)
+
+    async def stats(self) -> dict:
+        await self._purge(time.time())
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(self._expires)
+            pipe.hgetall(self._stats)
+            pipe.memory_usage(self._data)
+            size, counters, used = await pipe.execute()
+        hits, misses = int(counters.get("hits", 0)), int(counters.get("misses", 0))
+        lookups = hits + misses
+        return {
+            "backend": "redis",
+            "size": size,
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "bytes": used or 0,
+            "hits": hits,
+            "misses": misses,
+            "expired": int(counters.get("expired", 0)),
+            "evictions": int(counters.get("evictions", 0)),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def make_store(backend: str | None = None, name: str = "pending"):
+    """Store selected by ``settings.PENDING_BACKEND``; *name* keeps Redis keys apart."""
+    backend = backend or settings.PENDING_BACKEND
+    if backend == "memory":
+        return MemoryPendingStore(settings.PENDING_TTL, settings.PENDING_MAX_SIZE)
+    if backend == "redis":
+        return RedisPendingStore(settings.REDIS_URL, settings.PENDING_TTL, settings.PENDING_MAX_SIZE,
+                                 prefix=f"va:{name}:")
+    raise ValueError(f"unknown pending store {backend!r}, expected one of {BACKENDS}")
@@ -0,0 +1,259 @@
+# app/services/render_service.py
+"""Table images for chat replies, rendered off the event loop.
+
+Two kinds: ``png`` (PIL raster, sent as a base64 ``<img>`` data-URL) and
+``svg`` (inline vector markup, far cheaper to build and to send for
+text-only tables); ``RENDER_IMAGE_FORMAT`` picks the default.
+
+Drawing, the optional LANCZOS resize, PNG encoding and base64 run in a
+bounded :class:`WorkerPool`. The font and the text measurements are
+cached per worker (per process in ``process`` mode), not loaded per call.
+Finished replies are cached on the event loop by content address, which
+doubles as the ETag clients send back to skip an unchanged image.
+"""
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core.config import settings
+from app.core.metrics import METRICS
+from app.gen.dsl_cache import LRUCache
+from app.services.worker_pool import PoolBusy, WorkerPool
+
+LOG = logging.getLogger("render_service")
+
+FONT_NAME, FONT_SIZE = "arial.ttf", 11
+
+
+@lru_cache(maxsize=1)
+def _font():
+    try:
+        return ImageFont.truetype(FONT_NAME, FONT_SIZE)
+    except IOError:
+        return ImageFont.load_default()
+
+
+# bounded per worker; the font is fixed, so the text alone is the key
+TEXT_METRICS_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=TEXT_METRICS_CACHE_SIZE)
+def _text_bbox(text: str) -> Tuple[int, int, int, int]:
+    # cells repeat a lot (headers, statuses, dates)
+    return _font().getbbox(text)
+
+
+def table_png(rows: List[List[str]], max_width: int = 1000) -> bytes:
+    font = _font()
+    pad, border = 8, 1
+    # One measuring pass: every cell's box is reused for widths and placement
+    boxes = [[_text_bbox(cell) for cell in row] for row in rows]
+    # Tính chiều rộng từng cột
+    col_w = [0] * len(rows[0])
+    for row in boxes:
+        for i, bbox in enumerate(row):
+            col_w[i] = max(col_w[i], bbox[2] - bbox[0])
+
+    ag = _text_bbox("Ag")
+    row_h = (ag[3] - ag[1]) + pad * 2
+    tbl_w = sum(col_w) + pad * 2 * len(col_w) + border * (len(col_w) + 1)
+    tbl_h = row_h * len(rows) + border * (len(rows) + 1)
+    # Cell x / y origins; each cell is framed at [x, x + cw] x [y, y + row_h]
+    xs, x = [], border
+    for w in col_w:
+        xs.append(x)
+        x += w + pad * 2 + border
+    ys = [border + i * (row_h + border) for i in range(len(rows))]
+    right, bottom = xs[-1] + col_w[-1] + pad * 2, ys[-1] + row_h
+    # Vẽ bảng lên ảnh gốc: the grid as whole lines, not one rectangle per cell
+    img = Image.new("RGB", (tbl_w, tbl_h), "white")
+    draw = ImageDraw.Draw(img)
+    for x, w in zip(xs, col_w):
+        draw.line([(x, border), (x, bottom)], fill="black", width=border)
+        draw.line([(x + w + pad * 2, border), (x + w + pad * 2, bottom)], fill="black", width=border)
+    for y in ys:
+        draw.line([(border, y), (right, y)], fill="black", width=border)
+        draw.line([(border, y + row_h), (right, y + row_h)], fill="black", width=border)
+    for y, row, row_boxes in zip(ys, rows, boxes):
+        for x, cell, bbox in zip(xs, row, row_boxes):
+            ty = y + (row_h - (bbox[3] - bbox[1])) // 2
+            draw.text((x + pad, ty), cell, fill="black", font=font)
+    # Nếu quá rộng, thu nhỏ xuống max_width
+    if tbl_w > max_width:
+        scale = max_width / tbl_w
+        new_size = (int(tbl_w * scale), int(tbl_h * scale))
+        img = img.resize(new_size, Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def img_tag(png: bytes) -> str:
+    # Xuất ra data-URL
+    b64 = base64.b64encode(png).decode()
+    return f'<img src="data:image/png;base64,{b64}" alt="table" />'
+
+
+def table_svg(rows: List[List[str]], max_width: int = 1000) -> str:
+    """The table as inline SVG, sized with the same cached font metrics.
+
+    Nothing is rasterized: one path holds the grid, one ``<text>`` per
+    non-empty cell, and a wide table is scaled through ``viewBox`` by the
+    client instead of being resampled here.
+    """
+    pad = 8
+    col_w = [0] * len(rows[0])
+    for row in rows:
+        for i, cell in enumerate(row):
+            bbox = _text_bbox(cell)
+            col_w[i] = max(col_w[i], bbox[2] - bbox[0])
+    ag = _text_bbox("Ag")
+    row_h = (ag[3] - ag[1]) + pad * 2
+    xs = [0]
+    for w in col_w:
+        xs.append(xs[-1] + w + pad * 2)
+    tbl_w, tbl_h = xs[-1], row_h * len(rows)
+    grid = "".join(f"M{x} 0V{tbl_h}" for x in xs) + "".join(
+        f"M0 {i * row_h}H{tbl_w}" for i in range(len(rows) + 1))
+    texts = "".join(
+        f'<text x="{x + pad}" y="{r * row_h + row_h // 2}">{escape(cell)}</text>'
+        for r, row in enumerate(rows) for x, cell in zip(xs, row) if cell)
+    width = min(tbl_w, max_width)
+    height = tbl_h * width // tbl_w if tbl_w else tbl_h
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="-1 -1 {tbl_w + 2} {tbl_h + 2}" font-family="Arial,sans-serif" '
+            f'font-size="{FONT_SIZE}" dominant-baseline="middle">'
+            f'<rect x="-1" y="-1" width="{tbl_w + 2}" height="{tbl_h + 2}" fill="#fff"/>'
+            f'<path d="{grid}" stroke="#000" fill="none" shape-rendering="crispEdges"/>'
+            f'{texts}</svg>')
+
+
+# kind -> rows, max_width -> reply; "png" is an <img> data-URL, "svg" inline markup
+RENDERERS = {
+    "png": lambda rows, max_width: img_tag(table_png(rows, max_width)),
+    "svg": table_svg,
+}
+
+
+def render_table(rows: List[List[str]], max_width: int = 1000, kind: str = "png") -> Tuple[str, int]:
+    """``(reply, reply length)``; runs in a render worker."""
+    reply = RENDERERS[kind](rows, max_width)
+    return reply, len(reply)
+
+
+def table_key(rows: List[List[str]], max_width: int = 1000, kind: str = "png") -> str:
+    """Content address of a table image: sha256 of its kind, width and rows."""
+    data = json.dumps([kind, max_width, rows], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def text_table(rows: List[List[str]]) -> str:
+    """Plain-text table, the reply when the render pool is saturated."""
+    return "\n".join(" | ".join(row) for row in rows)
+
+
+class ImageCache(LRUCache):
+    """LRU of rendered replies, bounded by total bytes as well as entries."""
+
+    def __init__(self, maxsize: int = 256, maxbytes: int = 32 << 20):
+        super().__init__(maxsize)
+        self.maxbytes = maxbytes
+        self.bytes = 0
+
+    def peek(self, key: str) -> Optional[str]:
+        # no recency update, no hit / miss counted
+        return self._data.get(key)
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value)  # data-URLs are ASCII, SVG mostly
+        if self.maxsize <= 0 or size > self.maxbytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._data[key] = value
+            self.bytes += size
+            while len(self._data) > self.maxsize or self.bytes > self.maxbytes:
+                _, evicted = self._data.popitem(last=False)
+                self.bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats.update(bytes=self.bytes, maxbytes=self.maxbytes)
+        return stats
+
+
+# rendered replies keyed on table_key()
+_cache = ImageCache(settings.RENDER_CACHE_SIZE, settings.RENDER_CACHE_BYTES)
+_not_modified = 0
+_bytes_saved = 0  # reply bytes not sent because the client had the image
+
+_pool = WorkerPool(
+    mode=settings.RENDER_EXECUTOR,
+    workers=settings.RENDER_WORKERS,
+    queue_size=settings.RENDER_QUEUE_SIZE,
+    timeout=settings.RENDER_TIMEOUT,
+    initializer=_font if settings.RENDER_EXECUTOR == "process" else None,
+    name="table-render",
+)
+
+
+class RenderService:
+    @staticmethod
+    async def table(rows: List[List[str]], max_width: int = 1000, etag: str | None = None,
+                    kind: str = "png") -> Tuple[Optional[str], Optional[str]]:
+        """Render *rows* as a *kind* image reply without blocking the event loop.
+
+        Returns ``(reply, key)``, *key* being the table's content address.
+        Identical tables are served from a cache; if *etag* already is the
+        key, the reply is ``None`` ("not modified"). A full render queue or
+        a timed-out render degrades to a text table (key ``None``) instead
+        of queueing more work behind a slow one.
+        """
+        global _not_modified, _bytes_saved
+        key = table_key(rows, max_width, kind)
+        if etag == key:
+            cached = _cache.peek(key)
+            _not_modified += 1
+            _bytes_saved += len(cached) if cached is not None else 0
+            return None, key
+        reply = _cache.get(key)
+        if reply is not None:
+            return reply, key
+        try:
+            with METRICS.time("render.table_ms"):
+                reply, size = await _pool.run(render_table, rows, max_width, kind)
+        except PoolBusy:
+            LOG.warning("render pool busy, replying with a text table (%d rows)", len(rows))
+            return text_table(rows), None
+        except asyncio.TimeoutError:
+            LOG.warning("table render timed out (%d rows)", len(rows))
+            return text_table(rows), None
+        METRICS.observe(f"render.{kind}_bytes", size)
+        METRICS.observe("render.rows", len(rows))
+        _cache.put(key, reply)
+        return reply, key
+
+    @staticmethod
+    def stats() -> dict:
+        cache = _cache.stats()
+        cache.update(not_modified=_not_modified, bytes_saved=_bytes_saved)
+        return {"pool": _pool.stats(), "cache": cache, "metrics": METRICS.snapshot("render.")}
+
+    @staticmethod
+    def shutdown() -> None:
+        _pool.shutdown()
@@ -1,4 +1,5 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime, timedelta
@@ -13,10 +14,11 @@ def init_scheduler() -> AsyncIOScheduler:
         scheduler.start()
     return scheduler
 
-async def schedule_task_reminder(task):
+def _reminder_job(task) -> dict | None:
+    """add_job() arguments for *task*'s reminder, None if nothing to schedule."""
     # Must have both date and time to schedule
     if not task.task_date or not task.task_time:
-        return
+        return None
     task_datetime = datetime.combine(task.task_date, task.task_time)
     print(f"Scheduling reminder for task {task.id} at {task_datetime}")
     # Calculate the run time: 10 minutes before the task's due time
@@ -24,7 +26,7 @@ async def schedule_task_reminder(task):
     # If the scheduled run time is in the past, skip scheduling
     if run_at < datetime.utcnow():
         print("Reminder run time already passed; no job scheduled")
-        return
+        return None
     # Determine the trigger based on recurrence rule (if provided)
     if task.rrule:
         rrule_lower = task.rrule.lower().strip()
@@ -39,8 +41,7 @@ async def schedule_task_reminder(task):
             trigger = DateTrigger(run_date=run_at)
     else:
         trigger = DateTrigger(run_date=run_at)
-    scheduler.add_job(
-        send_email,
+    return dict(
         trigger=trigger,
         kwargs=dict(
             recipient=task.owner_id,  
@@ -49,4 +50,27 @@ async def schedule_task_reminder(task):
         ),
         id=f"reminder-{task.id}",
         replace_existing=True
-    )
\ No newline at end of file
+    )
+
+async def schedule_task_reminders(tasks) -> int:
+    """Schedule the reminders of *tasks* at once; returns how many were added.
+
+    Every add_job() on a running scheduler wakes it up to re-scan its job
+    store; pausing around the batch leaves a single wake-up, on resume.
+    """
+    jobs = [job for job in map(_reminder_job, tasks) if job is not None]
+    if not jobs:
+        return 0
+    batched = scheduler.state == STATE_RUNNING
+    if batched:
+        scheduler.pause()
+    try:
+        for job in jobs:
+            scheduler.add_job(send_email, **job)
+    finally:
+        if batched:
+            scheduler.resume()
+    return len(jobs)
+
+async def schedule_task_reminder(task):
+    await schedule_task_reminders([task])
@@ -0,0 +1,174 @@
+# app/services/suggestion_service.py
+from functools import lru_cache
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from antlr4 import Token
+
+from app.gen.dsl_fastpath import KEYWORDS
+from app.gen.dsl_lexer import RegexLexer
+from app.gen.dsl_parser import AssistantDSLParser as P, accepts
+
+
+def levenshtein(a, b) -> int:
+    """Edit distance between two strings (or any two sequences)."""
+    if len(a) < len(b):
+        a, b = b, a
+    prev = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        cur = [i]
+        for j, y in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (x != y)))
+        prev = cur
+    return prev[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree: nearest words by edit distance without a full scan.
+
+    Words are strings or tuples (token-type shapes); any sequence works.
+    """
+
+    def __init__(self, words=()):
+        self._root: Optional[Tuple[Sequence[Hashable], Dict[int, tuple]]] = None
+        self.size = 0
+        self.visited = 0  # nodes compared by the last search()
+        for word in words:
+            self.add(word)
+
+    def add(self, word: Sequence[Hashable]) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            self.size = 1
+            return
+        node = self._root
+        while True:
+            d = levenshtein(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = (word, {})
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: Sequence[Hashable], tolerance: int) -> Iterator[Tuple[int, Sequence[Hashable]]]:
+        """``(distance, word)`` for every word within *tolerance*."""
+        self.visited = 0
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node, children = stack.pop()
+            self.visited += 1
+            d = levenshtein(word, node)
+            if d <= tolerance:
+                yield d, node
+            # triangle inequality: only subtrees at distance d±tolerance can match
+            for dist, child in children.items():
+                if d - tolerance <= dist <= d + tolerance:
+                    stack.append(child)
+
+
+# keyword words of the grammar, e.g. "remind", "tasks", "every"
+_KEYWORD_TREE = BKTree(sorted(w for w in KEYWORDS if w.isalpha()))
+
+
+@lru_cache(maxsize=4096)
+def _correct(word: str) -> int:
+    """Token type of the keyword *word* is a typo of, else IDENTIFIER."""
+    if len(word) < 3:  # "to" / "at" are too short to guess from
+        return P.IDENTIFIER
+    word = word.lower()
+    # two edits only for long words: "report" is two edits from "repeat"
+    tolerance = 1 if len(word) < 8 else 2
+    # closest first; on ties prefer the same first letter and length ("wat" -> "what", not "at")
+    best = min(_KEYWORD_TREE.search(word, tolerance), default=None,
+               key=lambda c: (c[0], c[1][0] != word[0], abs(len(c[1]) - len(word)), c[1]))
+    return KEYWORDS[best[1]] if best else P.IDENTIFIER
+
+
+def shape(text: str, correct: bool = True, limit: Optional[int] = None) -> Tuple[int, ...]:
+    """Token types of *text*, keyword typos corrected, IDENTIFIER runs collapsed.
+
+    With *limit* only the first *limit* tokens are read (and corrected).
+    """
+    lexer = RegexLexer(text)
+    lexer.removeErrorListeners()
+    types: List[int] = []
+    tok = lexer.nextToken()
+    while tok.type != Token.EOF and limit != 0:
+        if limit is not None:
+            limit -= 1
+        ttype = _correct(tok.text) if correct and tok.type == P.IDENTIFIER else tok.type
+        if not (ttype == P.IDENTIFIER and types and types[-1] == P.IDENTIFIER):
+            types.append(ttype)
+        tok = lexer.nextToken()
+    return tuple(types)
+
+
+# tokens read past the longest indexed shape
+SHAPE_MARGIN = 2
+
+
+class SuggestionIndex:
+    """Valid command shapes with their help-table command and example."""
+
+    def __init__(self, rows: List[Tuple[str, str]]):
+        # shape -> (help-table order, entry); the first row with a shape wins
+        self.entries: Dict[Tuple[int, ...], Tuple[int, dict]] = {}
+        for command, example in rows:
+            # help rows the grammar does not accept are not worth suggesting
+            if not accepts(example):
+                continue
+            key = shape(example, correct=False)
+            if key not in self.entries:
+                self.entries[key] = (len(self.entries), {"command": command, "example": example})
+        # One tree per shape length, each searched with its own exact radius,
+        # instead of one tree searched with the radius of the longest shape
+        self._trees: Dict[int, BKTree] = {}
+        for key in self.entries:
+            self._trees.setdefault(len(key), BKTree()).add(key)
+        self.visited = 0  # shapes compared by the last suggest()
+        # Each new word costs a keyword search, so only the beginning of an
+        # utterance is read: enough for the longest shape, plus a typo or two.
+        self.max_tokens = max(map(len, self.entries), default=0) + SHAPE_MARGIN
+
+    def suggest(self, text: str, limit: int = 3) -> List[dict]:
+        query = shape(text, limit=self.max_tokens)
+        if not query:
+            return []
+        scored = []
+        self.visited = 0
+        for length, tree in self._trees.items():
+            # a shape matches when at most half of the longer one differs
+            tolerance = max(len(query), length) // 2
+            if abs(length - len(query)) > tolerance:
+                continue  # the length difference alone is too far: skip the tree
+            scored.extend((distance, self.entries[key]) for distance, key in tree.search(query, tolerance))
+            self.visited += tree.visited
+        scored.sort(key=lambda s: (s[0], s[1][0]))
+        return [entry for _, (_, entry) in scored[:limit]]
+
+
+_index: Optional[SuggestionIndex] = None
+
+
+class SuggestionService:
+    @staticmethod
+    def build() -> SuggestionIndex:
+        """Index the example commands of the help tables (once, at startup)."""
+        global _index
+        # imported here: chat_service imports dsl_service, which uses us
+        from app.services.chat_service import INSTRUCTION_TOPICS, _build_instruction_rows
+        rows = []
+        for topic in INSTRUCTION_TOPICS:
+            rows.extend((row[0], row[2]) for row in _build_instruction_rows(topic)[1:])
+        _index = SuggestionIndex(rows)
+        return _index
+
+    @staticmethod
+    def suggest(text: str, limit: int = 3) -> List[dict]:
+        """Closest valid command shapes for an utterance that did not parse."""
+        index = _index or SuggestionService.build()
+        return index.suggest(text, limit)
@@ -2,18 +2,70 @@
 from datetime import datetime
 
 from fastapi import HTTPException
-from sqlalchemy import select, func, extract
+from sqlalchemy import and_, or_, select, func, extract
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.models.task import Task
 from app.schemas.task import (TaskCreate, TaskRead, TaskUpdate, Status)
-from app.services.scheduler_service import schedule_task_reminder
+from app.services.scheduler_service import schedule_task_reminder, schedule_task_reminders
 
-from datetime import date
-from typing import List
+from datetime import date, time
+from typing import List, Tuple
 from app.services.notification_service import send_email  
 
+# TaskService.page lists these keyset segments in order
+_SEGMENTS = ("upcoming", "undated", "overdue")
+
+
+def _after_in_day(after: dict, descending: bool):
+    """Tasks of the cursor's date (or of no date) past it in (task_time, id) order.
+
+    The columns are compared raw so ix_tasks_owner_due supplies the order;
+    a NULL time sorts before every time, as MySQL and SQLite order NULLs.
+    """
+    t = time.fromisoformat(after["time"]) if after["time"] else None
+    if not descending:
+        if t is None:
+            return or_(Task.task_time.is_not(None), and_(Task.task_time.is_(None), Task.id > after["id"]))
+        return or_(Task.task_time > t, and_(Task.task_time == t, Task.id > after["id"]))
+    if t is None:
+        return and_(Task.task_time.is_(None), Task.id < after["id"])
+    return or_(Task.task_time < t, and_(Task.task_time == t, Task.id < after["id"]),
+               Task.task_time.is_(None))
+
+
+def _segment_query(segment: str, user, today: date, after: dict | None):
+    """The user's tasks of *segment* in listing order, past the *after* cursor."""
+    stmt = select(Task).where(Task.owner_id == user.id)
+    if segment == "undated":
+        stmt = stmt.where(Task.task_date.is_(None)).order_by(Task.task_time, Task.id)
+        return stmt if after is None else stmt.where(_after_in_day(after, False))
+    if segment == "upcoming":
+        stmt = stmt.where(Task.task_date >= today).order_by(Task.task_date, Task.task_time, Task.id)
+    else:
+        stmt = stmt.where(Task.task_date < today).order_by(
+            Task.task_date.desc(), Task.task_time.desc(), Task.id.desc())
+    if after is None:
+        return stmt
+    d = date.fromisoformat(after["date"])
+    if segment == "upcoming":
+        return stmt.where(Task.task_date >= d, or_(Task.task_date > d,
+                                                   and_(Task.task_date == d, _after_in_day(after, False))))
+    return stmt.where(Task.task_date <= d, or_(Task.task_date < d,
+                                               and_(Task.task_date == d, _after_in_day(after, True))))
+
+
+def _cursor_after(segment: str, today: date, task: Task) -> dict:
+    return {
+        "today": today.isoformat(),
+        "segment": segment,
+        "date": task.task_date.isoformat() if task.task_date else None,
+        "time": task.task_time.isoformat() if task.task_time else None,
+        "id": task.id,
+    }
+
+
 class TaskService:
     @staticmethod
     async def create(data: TaskCreate, user, session: AsyncSession) -> TaskRead:
@@ -44,6 +96,57 @@ class TaskService:
         # )
         return TaskRead.model_validate(task)
 
+    @staticmethod
+    async def create_many(items: List[TaskCreate], user, session: AsyncSession) -> List[TaskRead]:
+        """Create *items* in one transaction: one flush, one commit, one scheduling call."""
+        created, _ = await TaskService.apply_many(items, [], user, session)
+        return created
+
+    @staticmethod
+    async def apply_many(creates: List[TaskCreate], changes: List[Tuple[str, TaskUpdate | None]],
+                         user, session: AsyncSession) -> Tuple[List[TaskRead], List[bool]]:
+        """Create *creates* and apply *changes* in order, all in one transaction.
+
+        A change is ``(task_id, TaskUpdate)``, or ``(task_id, None)`` to
+        delete the task. One flush, one commit, one scheduling call. A
+        change whose task is missing (or not the user's) is skipped instead
+        of raising; the second list tells, per change, if its task was found.
+        """
+        if not creates and not changes:
+            return [], []
+        tasks = [
+            Task(
+                owner_id=user.id,
+                title=data.title,
+                task_date=data.task_date,
+                task_time=data.task_time,
+                rrule=data.rrule,
+                status=Status.pending,
+            )
+            for data in creates
+        ]
+        session.add_all(tasks)
+        found, deleted = [], set()
+        for task_id, data in changes:
+            task = await session.get(Task, task_id) if task_id not in deleted else None
+            if not task or task.owner_id != user.id:
+                found.append(False)
+                continue
+            if data is None:
+                await session.delete(task)
+                deleted.add(task_id)
+            else:
+                for k, v in data.model_dump(exclude_unset=True).items():
+                    setattr(task, k, v)
+            found.append(True)
+        await session.flush()
+        # read back before the commit: no refresh round trip per task
+        created = [TaskRead.model_validate(task) for task in tasks]
+        await session.commit()
+        if tasks:
+            await schedule_task_reminders(tasks)
+        return created, found
+
     @staticmethod
     async def list(date: str | None, user, session) -> List[TaskRead]:
         stmt = select(Task).where(Task.owner_id == user.id)
@@ -58,6 +161,39 @@ class TaskService:
         rows = await session.scalars(stmt)
         return [TaskRead.model_validate(t) for t in rows]
 
+    @staticmethod
+    async def page(user, session: AsyncSession, cursor: dict | None = None,
+                   limit: int = 20) -> Tuple[List[TaskRead], dict | None]:
+        """One page of the user's tasks and the cursor of the next one.
+
+        Tasks are listed in three keyset segments (ix_tasks_owner_due), so
+        a page costs the same however many tasks the user has: due from
+        today on by (date, time, id), then undated by (time, id), then
+        overdue, the most recently due first. A task without a time comes
+        first on its date. "Today" is the UTC date, like the
+        reminder scheduler, fixed by the first page for the whole listing.
+        *cursor* is the JSON-able dict returned with the previous page;
+        the returned one is ``None`` after the last.
+        """
+        if cursor is None:
+            cursor = {"today": datetime.utcnow().date().isoformat(), "segment": _SEGMENTS[0], "id": None}
+        today = date.fromisoformat(cursor["today"])
+        first = _SEGMENTS.index(cursor["segment"])
+        tasks: List[Task] = []
+        for segment in _SEGMENTS[first:]:
+            after = cursor if segment == cursor["segment"] and cursor["id"] is not None else None
+            stmt = _segment_query(segment, user, today, after).limit(limit - len(tasks) + 1)
+            rows = list(await session.scalars(stmt))
+            if len(tasks) + len(rows) > limit:
+                rows = rows[:limit - len(tasks)]
+                tasks += rows
+                # the page may end right at the start of this segment
+                next_cursor = (_cursor_after(segment, today, rows[-1]) if rows
+                               else {"today": today.isoformat(), "segment": segment, "id": None})
+                return [TaskRead.model_validate(t) for t in tasks], next_cursor
+            tasks += rows
+        return [TaskRead.model_validate(t) for t in tasks], None
+
     @staticmethod
     async def update(task_id: str, data: TaskUpdate,
                      user,
@@ -0,0 +1,102 @@
+# app/services/worker_pool.py
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+MODES = ("inline", "thread", "process")
+
+
+class PoolBusy(Exception):
+    """Raised when the pool already holds ``queue_size`` jobs."""
+
+
+class WorkerPool:
+    """Run CPU-bound callables off the event loop with backpressure.
+
+    ``queue_size`` bounds the jobs that are queued or running at once; a job
+    that times out keeps its slot until the worker really finishes, so a
+    pathological input cannot pile up unbounded work behind the timeout.
+    ``inline`` mode calls the function directly on the loop (no pool).
+    """
+
+    def __init__(self,
+                 mode: str = "thread",
+                 workers: int = 2,
+                 queue_size: int = 64,
+                 timeout: Optional[float] = None,
+                 initializer: Optional[Callable[[], Any]] = None,
+                 name: str = "worker"):
+        if mode not in MODES:
+            raise ValueError(f"unknown pool mode {mode!r}, expected one of {MODES}")
+        self.mode = mode
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.initializer = initializer
+        self.name = name
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _get_executor(self) -> Executor:
+        # created lazily so importing the app never forks or spawns threads
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     initializer=self.initializer)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix=self.name,
+                                                    initializer=self.initializer)
+        return self._executor
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool.
+
+        Raises :class:`PoolBusy` when the queue is full and
+        :class:`asyncio.TimeoutError` when the call exceeds ``timeout``.
+        """
+        if self.mode == "inline":
+            return fn(*args)
+        with self._lock:
+            if self._in_flight >= self.queue_size:
+                self.rejected += 1
+                raise PoolBusy(f"{self.name} pool queue is full ({self.queue_size})")
+            self._in_flight += 1
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
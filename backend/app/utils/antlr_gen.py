@@ -1,7 +1,22 @@
 # utils/antlr_gen.py
+"""ANTLR parser generation.
+
+The generated ``app/gen/assistantdsl`` modules are a build artifact: they
+are committed together with ``AssistantDSL.sha256``, the hash of the grammar
+they were generated from. At startup :func:`ensure` only compares that hash
+(no Java involved); regeneration is an explicit step::
+
+    python -m app.utils.antlr_gen generate   # needs java + ANTLR_JAR_PATH
+    python -m app.utils.antlr_gen check      # exit 1 if the artifact is stale
+
+Set ``ANTLR_GEN_MODE=dev`` to regenerate automatically at startup instead.
+"""
+import argparse
+import hashlib
 import os
 import subprocess
 import logging
+import sys
 import time
 
 LOG = logging.getLogger("antlr_gen")
@@ -11,33 +26,90 @@ ANTLR_JAR = os.getenv(
     "ANTLR_JAR_PATH",
     r"D:\antlr\antlr-4.13.2-complete.jar"
 )
+# artifact: only verify the committed parser; dev: regenerate when stale
+GEN_MODE     = os.getenv("ANTLR_GEN_MODE", "artifact")
 BASE_DIR     = os.path.abspath(os.path.dirname(__file__))
-GRAMMAR_FILE = os.path.join(BASE_DIR, "..", "gen", "AssistantDSL.g4")
-OUTPUT_DIR   = os.path.join(BASE_DIR, "..", "gen", "assistantdsl")
+GEN_DIR      = os.path.join(BASE_DIR, "..", "gen")
+GRAMMAR_FILE = os.path.join(GEN_DIR, "AssistantDSL.g4")
+OUTPUT_DIR   = os.path.join(GEN_DIR, "assistantdsl")
 LEXER_FILE   = os.path.join(OUTPUT_DIR, "AssistantDSLLexer.py")
+STAMP_FILE   = os.path.join(OUTPUT_DIR, "AssistantDSL.sha256")
+
+
+def grammar_hash() -> str:
+    with open(GRAMMAR_FILE, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def stamped_hash() -> str | None:
+    try:
+        with open(STAMP_FILE, encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
 
-def generate():
+def is_up_to_date() -> bool:
+    return os.path.exists(LEXER_FILE) and stamped_hash() == grammar_hash()
+
+
+def generate(force: bool = False):
     LOG.info("Checking ANTLR parser…")
-    # Nếu đã có lexer & mới hơn grammar thì bỏ qua
-    if os.path.exists(LEXER_FILE):
-        if os.path.getmtime(LEXER_FILE) >= os.path.getmtime(GRAMMAR_FILE):
-            LOG.info("ANTLR parser up-to-date; skipping.")
-            return
+    # Nếu đã sinh từ đúng grammar này thì bỏ qua
+    if not force and is_up_to_date():
+        LOG.info("ANTLR parser up-to-date; skipping.")
+        return
 
     LOG.info("Generating ANTLR parser…")
     os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Run from the grammar directory so the generated headers stay stable
     cmd = [
         "java", "-jar", ANTLR_JAR,
         "-Dlanguage=Python3",
         "-visitor",
-        "-o", OUTPUT_DIR,
-        GRAMMAR_FILE,
+        "-o", os.path.basename(OUTPUT_DIR),
+        os.path.basename(GRAMMAR_FILE),
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=GEN_DIR)
     if result.returncode != 0:
         LOG.error("ANTLR failure: %s", result.stderr)
         raise RuntimeError("ANTLR generation error")
+    with open(STAMP_FILE, "w", encoding="utf-8") as f:
+        f.write(grammar_hash() + "\n")
     # Cập nhật timestamp để tránh watch-trigger vòng lặp
     now = time.time()
     os.utime(OUTPUT_DIR, (now, now))
     LOG.info("ANTLR parser generated successfully.")
+
+
+def ensure():
+    """Startup hook: never shells out unless ``ANTLR_GEN_MODE=dev``."""
+    if GEN_MODE == "dev":
+        generate()
+        return
+    if not os.path.exists(LEXER_FILE):
+        raise RuntimeError("Generated ANTLR parser missing; run `python -m app.utils.antlr_gen generate`")
+    if stamped_hash() != grammar_hash():
+        LOG.warning("ANTLR parser is stale (grammar hash mismatch); "
+                    "run `python -m app.utils.antlr_gen generate`")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m app.utils.antlr_gen",
+                                 description="Generate or verify the AssistantDSL parser.")
+    ap.add_argument("command", choices=("generate", "check"))
+    ap.add_argument("--force", action="store_true", help="regenerate even if up to date")
+    args = ap.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "generate":
+        generate(force=args.force)
+        return 0
+    if is_up_to_date():
+        LOG.info("ANTLR parser up-to-date (%s)", grammar_hash()[:12])
+        return 0
+    LOG.error("ANTLR parser is stale: grammar %s, stamp %s", grammar_hash()[:12], stamped_hash())
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# benchmarks/bench_chat_batch.py
+"""Task creation through chat: one command per request vs command sequences.
+
+``single`` sends every "remind me to ..." as its own request, each with a
+new session and ChatService like ``POST /chat`` (a commit and a scheduler
+wake-up per task). ``sequence`` chains ``--batch`` of them with "and" into
+one utterance: one parse, one transaction, one reminder-scheduling call.
+Both run against a fresh SQLite file with the scheduler running; the
+reminders are removed between rounds. Run from ``backend/``::
+
+    python -m benchmarks.bench_chat_batch --tasks 200 --batch 10 --json batch.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models.task  # noqa: F401
+import app.models.user  # noqa: F401
+from app.core.db import Base
+from app.schemas.chat import ChatRequest
+from app.services.chat_service import ChatService
+from app.services.scheduler_service import init_scheduler, scheduler
+
+
+def _command(i: int) -> str:
+    # complete commands: nothing is held for a "yes"
+    return f"remind me to task{i} at 2099-01-{i % 28 + 1:02d} {i % 24:02d}:00 repeat every day"
+
+
+def _utterances(mode: str, tasks: int, batch: int):
+    commands = [_command(i) for i in range(tasks)]
+    if mode == "single":
+        return commands
+    return [" and ".join(commands[i:i + batch]) for i in range(0, tasks, batch)]
+
+
+async def _run(mode: str, utterances, url: str) -> float:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    user = SimpleNamespace(id="bench")
+    t0 = time.perf_counter()
+    for text in utterances:
+        async with sessions() as session:
+            resp = await ChatService().handle(ChatRequest(text=text), user=user, session=session, fmt="table")
+            if not resp.reply.startswith("✅"):
+                raise RuntimeError(f"{mode}: unexpected reply {resp.reply!r}")
+    elapsed = time.perf_counter() - t0
+    scheduler.remove_all_jobs()
+    await engine.dispose()
+    return elapsed
+
+
+async def bench(mode: str, tasks: int, batch: int, repeat: int, url: str) -> dict:
+    utterances = _utterances(mode, tasks, batch)
+    times = [await _run(mode, utterances, url) for _ in range(repeat)]
+    best = min(times)
+    return {
+        "mode": mode,
+        "requests": len(utterances),
+        "tasks": tasks,
+        "best_s": best,
+        "tasks_per_s": tasks / best,
+        "request_ms": best / len(utterances) * 1e3,
+    }
+
+
+async def _main(args) -> list:
+    init_scheduler()
+    try:
+        return [await bench(mode, args.tasks, args.batch, args.repeat, args.url)
+                for mode in ("single", "sequence")]
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tasks", type=int, default=200)
+    ap.add_argument("--batch", type=int, default=10, help="commands per sequence (DSL_MAX_TOKENS bounds it)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--url", help="database URL (default: a temporary SQLite file)")
+    ap.add_argument("--json", dest="json_path", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        args.url = args.url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        results = asyncio.run(_main(args))
+    result = {
+        "benchmark": "chat_batch",
+        "python": platform.python_version(),
+        "batch": args.batch,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# benchmarks/bench_dsl.py
+"""DSL parser benchmark over the generated command corpus.
+
+For every command rule, parser engine and lexer it reports throughput,
+p50/p99 latency per stage (lex, parse, visit, total) and peak traced memory,
+as JSON.
+Run from ``backend/``::
+
+    python -m benchmarks.bench_dsl --per-rule 100 --json dsl.json
+    python -m benchmarks.bench_dsl --baseline dsl.json --max-regression 0.25
+
+With ``--baseline`` the total p50 of each (engine, lexer, rule) is compared with
+the earlier run and the exit status is 1 if any slowed down by more than
+``--max-regression``.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+from antlr4 import CommonTokenStream
+from antlr4.error.Errors import ParseCancellationException
+
+from app.gen.assistantdsl.AssistantDSLParser import AssistantDSLParser
+from app.gen.dsl_parser import (ENGINES, LEXERS, _IntentBuilder, _StreamingParser, _Visitor,
+                                _parse_program, _parse_sll, _template_skeleton, warm_up)
+
+from benchmarks.dsl_corpus import generate
+
+STAGES = ("lex", "parse", "visit", "total")
+
+
+def _run_tree(text: str, lexer: str):
+    t0 = time.perf_counter()
+    tokens = CommonTokenStream(LEXERS[lexer](text))
+    tokens.fill()
+    t1 = time.perf_counter()
+    parser = AssistantDSLParser(tokens)
+    tree = _parse_program(parser, report=False)
+    t2 = time.perf_counter()
+    _Visitor().visit(tree)
+    t3 = time.perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2
+
+
+def _run_stream(text: str, lexer: str):
+    t0 = time.perf_counter()
+    tokens = CommonTokenStream(LEXERS[lexer](text))
+    tokens.fill()
+    t1 = time.perf_counter()
+    parser = _StreamingParser(tokens)
+    parser.builder = _IntentBuilder()
+    parser.buildParseTrees = False
+    try:
+        _parse_sll(parser)
+    except ParseCancellationException:
+        pass  # the corpus is well-formed; errors are not this benchmark's concern
+    t2 = time.perf_counter()
+    return t1 - t0, t2 - t1, 0.0
+
+
+def _run_template(text: str, lexer: str):
+    # shapes repeat across the corpus and the --repeat passes, so the
+    # percentiles mostly measure template replay rather than parsing
+    t0 = time.perf_counter()
+    tokens = CommonTokenStream(LEXERS[lexer](text))
+    tokens.fill()
+    t1 = time.perf_counter()
+    _template_skeleton(_StreamingParser(tokens), report=False)
+    t2 = time.perf_counter()
+    return t1 - t0, t2 - t1, 0.0
+
+
+RUNNERS = {"tree": _run_tree, "stream": _run_stream, "template": _run_template}
+assert set(RUNNERS) == set(ENGINES)
+
+
+def _pct(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def bench(engine: str, lexer: str, corpus, repeat: int) -> list:
+    run = RUNNERS[engine]
+    by_rule = defaultdict(list)
+    for rule, text in corpus:
+        by_rule[rule].append(text)
+
+    rows = []
+    for rule, texts in by_rule.items():
+        samples = {stage: [] for stage in STAGES}
+        for _ in range(repeat):
+            for text in texts:
+                lex, parse, visit = run(text, lexer)
+                samples["lex"].append(lex)
+                samples["parse"].append(parse)
+                samples["visit"].append(visit)
+                samples["total"].append(lex + parse + visit)
+
+        tracemalloc.start()
+        peak = 0
+        for text in texts:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            run(text, lexer)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+
+        row = {
+            "engine": engine,
+            "lexer": lexer,
+            "rule": rule,
+            "parses": len(samples["total"]),
+            "mean_tokens": statistics.mean(len(t.split()) for t in texts),
+            "throughput_per_s": len(samples["total"]) / sum(samples["total"]),
+            "peak_memory_bytes": peak,
+        }
+        for stage in STAGES:
+            row[f"{stage}_p50_us"] = _pct(samples[stage], 0.50) * 1e6
+            row[f"{stage}_p99_us"] = _pct(samples[stage], 0.99) * 1e6
+        rows.append(row)
+    return rows
+
+
+def compare(current: list, baseline: list, max_regression: float) -> list:
+    """Return the (engine, lexer, rule) rows whose total p50 regressed too much."""
+    key = lambda r: (r["engine"], r.get("lexer", "antlr"), r["rule"])
+    old = {key(r): r for r in baseline}
+    regressions = []
+    for row in current:
+        prev = old.get(key(row))
+        if not prev:
+            continue
+        change = row["total_p50_us"] / prev["total_p50_us"] - 1
+        if change > max_regression:
+            regressions.append({"engine": row["engine"], "lexer": row["lexer"],
+                                "rule": row["rule"], "change": change})
+    return regressions
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--per-rule", type=int, default=50, help="corpus size per command rule")
+    ap.add_argument("--repeat", type=int, default=5, help="passes over the corpus")
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--engine", choices=tuple(RUNNERS) + ("all",), default="all")
+    ap.add_argument("--lexer", choices=tuple(LEXERS) + ("all",), default="all")
+    ap.add_argument("--json", dest="json_path", help="write results to this file")
+    ap.add_argument("--baseline", help="earlier --json output to compare against")
+    ap.add_argument("--max-regression", type=float, default=0.25)
+    args = ap.parse_args(argv)
+
+    corpus = generate(args.per_rule, args.seed)
+    warm_up()
+    engines = RUNNERS if args.engine == "all" else (args.engine,)
+    lexers = LEXERS if args.lexer == "all" else (args.lexer,)
+    rows = [row for engine in engines for lexer in lexers
+            for row in bench(engine, lexer, corpus, args.repeat)]
+    result = {
+        "benchmark": "dsl",
+        "python": platform.python_version(),
+        "corpus": {"per_rule": args.per_rule, "seed": args.seed, "size": len(corpus)},
+        "repeat": args.repeat,
+        "results": rows,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            result["regressions"] = compare(rows, json.load(f)["results"], args.max_regression)
+        status = 1 if result["regressions"] else 0
+
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
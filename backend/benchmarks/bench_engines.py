@@ -0,0 +1,95 @@
+# benchmarks/bench_engines.py
+"""Tree+visitor engine versus the parse-tree-free streaming engine.
+
+Reports mean / p50 / p99 latency, the peak traced allocation and the
+number of memory blocks allocated per parse for each engine over the same
+inputs. Blocks are counted with the cycle collector off: the parse tree
+(parents and children refer to each other) is then still allocated when
+the parse returns, so the tree engine's extra blocks are its tree. Run
+from ``backend/``::
+
+    python -m benchmarks.bench_engines --repeat 200 --json engines.json
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from app.gen.dsl_parser import ENGINES, WARM_UP_SAMPLES, parse_skeleton, warm_up
+
+SAMPLES = WARM_UP_SAMPLES + (
+    "remind me to prepare the slides for the quarterly planning meeting with the "
+    "product and design teams in 3 days repeat every 7 days as pending",
+    "update task prepare slides set status=done, title=slides, owner=anna, priority=high",
+)
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def bench_engine(engine: str, texts, repeat: int) -> dict:
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            t = time.perf_counter()
+            parse_skeleton(text, engine)
+            latencies.append(time.perf_counter() - t)
+
+    peaks = []
+    tracemalloc.start()
+    for text in texts:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        parse_skeleton(text, engine)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+
+    # blocks the parse left allocated; tracemalloc's own snapshot objects excluded
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    blocks = []
+    gc.disable()
+    try:
+        for text in texts:
+            gc.collect()
+            before = tracemalloc.take_snapshot().filter_traces(ignore)
+            parse_skeleton(text, engine)
+            after = tracemalloc.take_snapshot().filter_traces(ignore)
+            blocks.append(sum(stat.count_diff for stat in after.compare_to(before, "filename")))
+    finally:
+        gc.enable()
+    tracemalloc.stop()
+
+    return {
+        "engine": engine,
+        "parses": len(latencies),
+        "throughput_per_s": len(latencies) / sum(latencies),
+        "mean_us": statistics.mean(latencies) * 1e6,
+        "p50_us": _percentile(latencies, 0.50) * 1e6,
+        "p99_us": _percentile(latencies, 0.99) * 1e6,
+        "peak_alloc_bytes_mean": statistics.mean(peaks),
+        "alloc_blocks_mean": statistics.mean(blocks),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=100)
+    ap.add_argument("--json", dest="json_path", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    warm_up()
+    results = {"benchmark": "engines",
+               "results": [bench_engine(engine, SAMPLES, args.repeat) for engine in ENGINES]}
+    print(json.dumps(results, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
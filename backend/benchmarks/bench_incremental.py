@@ -0,0 +1,111 @@
+# benchmarks/bench_incremental.py
+"""Incremental parsing vs a full re-parse per chunk, word-by-word input.
+
+Every corpus command is fed one word at a time, as speech recognition
+delivers it. ``naive`` lexes and SLL-parses the whole prefix after each
+word; ``incremental`` is :class:`IncrementalParser` with a warm prefix cache
+and ``incremental_cold`` the same with the cache disabled. Run from
+``backend/``::
+
+    python -m benchmarks.bench_incremental --per-rule 50 --json inc.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from antlr4 import CommonTokenStream
+from antlr4.error.Errors import ParseCancellationException
+
+from app.gen import dsl_incremental
+from app.gen.dsl_incremental import IncrementalParser
+from app.gen.dsl_lexer import RegexLexer
+from app.gen.dsl_parser import _IntentBuilder, _parse_sll, _StreamingParser, warm_up
+
+from benchmarks.bench_dsl import _pct
+from benchmarks.dsl_corpus import generate
+
+
+def _naive(chunks):
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        lexer = RegexLexer(text)
+        lexer.removeErrorListeners()
+        parser = _StreamingParser(CommonTokenStream(lexer))
+        parser.builder = _IntentBuilder()
+        parser.buildParseTrees = False
+        try:
+            _parse_sll(parser)
+        except (ParseCancellationException, ValueError):
+            pass
+
+
+def _incremental(chunks):
+    parser = IncrementalParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+
+
+def _chunks(text: str):
+    words = text.split(" ")
+    return [w + " " for w in words[:-1]] + [words[-1]]
+
+
+def bench(name: str, run, utterances, repeat: int) -> dict:
+    per_chunk = []
+    total_chunks = 0
+    t_all = time.perf_counter()
+    for _ in range(repeat):
+        for chunks in utterances:
+            t0 = time.perf_counter()
+            run(chunks)
+            per_chunk.append((time.perf_counter() - t0) / len(chunks))
+            total_chunks += len(chunks)
+    elapsed = time.perf_counter() - t_all
+    return {
+        "mode": name,
+        "chunks": total_chunks,
+        "chunks_per_s": total_chunks / elapsed,
+        "chunk_p50_us": _pct(per_chunk, 0.50) * 1e6,
+        "chunk_p99_us": _pct(per_chunk, 0.99) * 1e6,
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--per-rule", type=int, default=50)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1234)
+    ap.add_argument("--json", dest="json_path", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    utterances = [_chunks(text) for _, text in generate(args.per_rule, args.seed)]
+    warm_up()
+    rows = [bench("naive", _naive, utterances, args.repeat)]
+    rows.append(bench("incremental", _incremental, utterances, args.repeat))
+    size = dsl_incremental.PREFIXES.maxsize
+    dsl_incremental.PREFIXES.clear()
+    dsl_incremental.PREFIXES.maxsize = 0
+    try:
+        rows.append(bench("incremental_cold", _incremental, utterances, args.repeat))
+    finally:
+        dsl_incremental.PREFIXES.maxsize = size
+
+    result = {
+        "benchmark": "dsl_incremental",
+        "python": platform.python_version(),
+        "corpus": {"per_rule": args.per_rule, "seed": args.seed, "size": len(utterances)},
+        "repeat": args.repeat,
+        "results": rows,
+    }
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
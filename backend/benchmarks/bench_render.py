@@ -0,0 +1,121 @@
+# benchmarks/bench_render.py
+"""Table image rendering time versus row count.
+
+``current`` is :func:`app.services.render_service.table_png` (text
+measurements cached, one layout pass, grid drawn as whole lines);
+``legacy`` is the renderer it replaced (``getbbox`` per cell twice, a
+rectangle per cell). Both produce the same pixels. ``svg`` is
+:func:`~app.services.render_service.table_svg`. Times and sizes are for
+the finished reply (base64 ``<img>`` for the PNGs). Run from ``backend/``::
+
+    python -m benchmarks.bench_render --rows 10 100 500 1000 --json render.json
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import List
+
+from PIL import Image, ImageDraw
+
+from app.services.render_service import _font, _text_bbox, img_tag, table_png, table_svg
+
+
+def legacy_table_png(rows: List[List[str]], max_width: int = 1000) -> bytes:
+    font = _font()
+    pad, border = 8, 1
+    col_w = [0] * len(rows[0])
+    for row in rows:
+        for i, cell in enumerate(row):
+            bbox = font.getbbox(cell)
+            col_w[i] = max(col_w[i], bbox[2] - bbox[0])
+    row_h = (font.getbbox("Ag")[3] - font.getbbox("Ag")[1]) + pad * 2
+    tbl_w = sum(col_w) + pad * 2 * len(col_w) + border * (len(col_w) + 1)
+    tbl_h = row_h * len(rows) + border * (len(rows) + 1)
+    img = Image.new("RGB", (tbl_w, tbl_h), "white")
+    draw = ImageDraw.Draw(img)
+    y = border
+    for row in rows:
+        x = border
+        for i, cell in enumerate(row):
+            cw = col_w[i] + pad * 2
+            draw.rectangle([x, y, x + cw, y + row_h], outline="black", width=border)
+            text_bbox = font.getbbox(cell)
+            ty = y + (row_h - (text_bbox[3] - text_bbox[1])) // 2
+            draw.text((x + pad, ty), cell, fill="black", font=font)
+            x += cw + border
+        y += row_h + border
+    if tbl_w > max_width:
+        scale = max_width / tbl_w
+        img = img.resize((int(tbl_w * scale), int(tbl_h * scale)), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def task_rows(count: int) -> List[List[str]]:
+    """A "show tasks" table: repeated statuses / dates, distinct titles."""
+    rows = [["Title", "Status", "Date", "Time", "Recurrence"]]
+    for i in range(count):
+        rows.append([f"task {i} follow up with customer", ("pending", "done", "cancelled")[i % 3],
+                     f"{1 + i % 28:02d}/06/2025", f"{i % 24:02d}:{i % 60:02d}",
+                     "FREQ=DAILY" if i % 4 == 0 else ""])
+    return rows
+
+
+RENDERERS = {
+    "legacy": lambda rows: img_tag(legacy_table_png(rows)),
+    "current": lambda rows: img_tag(table_png(rows)),
+    "svg": table_svg,
+}
+
+
+def bench(name: str, rows: List[List[str]], repeat: int) -> dict:
+    render = RENDERERS[name]
+    _text_bbox.cache_clear()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        reply = render(rows)
+        times.append((time.perf_counter() - t0) * 1e3)
+    return {
+        "renderer": name,
+        "rows": len(rows) - 1,
+        "p50_ms": statistics.median(times),
+        "min_ms": min(times),
+        "reply_bytes": len(reply.encode()),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, nargs="+", default=[10, 100, 500, 1000])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--json", dest="json_path", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    results = []
+    for count in args.rows:
+        rows = task_rows(count)
+        if legacy_table_png(rows) != table_png(rows):
+            print(f"renderers disagree at {count} rows", file=sys.stderr)
+            return 1
+        results.extend(bench(name, rows, args.repeat) for name in RENDERERS)
+    result = {
+        "benchmark": "render",
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# benchmarks/bench_startup.py
+"""Cold-start time of ``app.main``.
+
+Each run imports the app in a fresh interpreter, so module import, grammar
+check and router setup are all included. Run from ``backend/``::
+
+    python -m benchmarks.bench_startup --runs 10 --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_PROBE = (
+    "import time; t = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def measure(runs: int, env: dict) -> list:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True,
+                             text=True, env=env)
+        if out.returncode != 0:
+            raise SystemExit(f"importing app.main failed:\n{out.stderr}")
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--mode", choices=("artifact", "dev"), default=None,
+                    help="ANTLR_GEN_MODE for the probe (default: inherit)")
+    ap.add_argument("--json", dest="json_path", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    env = dict(os.environ)
+    if args.mode:
+        env["ANTLR_GEN_MODE"] = args.mode
+    samples = measure(args.runs, env)
+    result = {
+        "benchmark": "startup",
+        "mode": env.get("ANTLR_GEN_MODE", "artifact"),
+        "runs": args.runs,
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "max_s": max(samples),
+    }
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
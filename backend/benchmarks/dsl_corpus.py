@@ -0,0 +1,124 @@
+# benchmarks/dsl_corpus.py
+"""Representative AssistantDSL command corpus.
+
+Every alternative of ``command`` in ``AssistantDSL.g4`` is covered, from
+one-word confirmations to ``modifyAction`` with many ``fieldAssign`` and
+long ``taskTitle`` runs, plus utterances chaining several commands with
+``and``. Generation is seeded, so a corpus is reproducible.
+"""
+import random
+from typing import Dict, List, Tuple
+
+from app.gen.dsl_fastpath import KEYWORDS
+
+# IDENTIFIER words: [a-zA-Z][a-zA-Z0-9]* and not a keyword of the grammar
+_WORDS = [w for w in (
+    "report submit call mom buy milk fix bug deploy release review budget "
+    "slides meeting dentist invoice backup server plan trip book flight "
+    "water plants pay rent clean kitchen study exam draft email customer "
+    "renew passport gym session update2 notes q3 roadmap"
+).split() if w.lower() not in KEYWORDS]
+
+_FIELDS = ("title", "owner", "priority", "label", "project", "note")
+_UNITS = ("minute", "minutes", "hour", "hours", "day", "days")
+_STATUS = ("pending", "done", "inprogress")
+
+# command rule -> action of the intent it produces
+RULE_ACTIONS: Dict[str, str] = {
+    "introduce": "introduce",
+    "greeting": "greet",
+    "asking": "ask",
+    "supportTasks": "instruction_tasks",
+    "supportGreetings": "instruction_greetings",
+    "supportInfor": "instruction_infor",
+    "createAction": "create",
+    "viewAction": "view",
+    "pageAction": "next_page",
+    "deleteAction": "delete",
+    "modifyAction": "update",
+    "affirmative": "confirm",
+    "negative": "confirm",
+    "program": "sequence",  # command (commandSep command)+
+}
+
+
+def _title(rng: random.Random, lo: int = 1, hi: int = 4) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+def _due(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return f"in {rng.randint(1, 120)} {rng.choice(_UNITS)}"
+    return (f"at 20{rng.randint(24, 30)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+            f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}")
+
+
+def _abs_due(rng: random.Random) -> str:
+    return f"at 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00"
+
+
+def _create(rng: random.Random, long: bool) -> str:
+    verb = rng.choice(("remind me to", "remind", "create", "Remind me", "CREATE"))
+    parts = [verb, _title(rng, 8, 24) if long else _title(rng)]
+    if rng.random() < 0.8:
+        parts.append(_due(rng))
+    if rng.random() < 0.4:
+        count = rng.choice(("", f"{rng.randint(1, 9)} "))
+        parts.append(f"repeat every {count}{rng.choice(_UNITS)}")
+    if rng.random() < 0.4:
+        parts.append(f"as {rng.choice(_STATUS)}")
+    return " ".join(parts)
+
+
+def _modify(rng: random.Random, long: bool) -> str:
+    n = rng.randint(6, 12) if long else rng.randint(1, 3)
+    fields = []
+    for _ in range(n):
+        key = rng.choice(_FIELDS + ("status",))
+        value = rng.choice(_STATUS) if key == "status" else rng.choice(_WORDS)
+        fields.append(f"{key}={value}")
+    due = f" {_abs_due(rng)}" if rng.random() < 0.3 else ""
+    title = _title(rng, 6, 16) if long else _title(rng)
+    return f"{rng.choice(('update', 'modify'))} task {title}{due} set {', '.join(fields)}"
+
+
+def _sequence(rng: random.Random, long: bool) -> str:
+    # paging words after 'and' would read as title words: no pageAction here
+    rules = rng.choices(("createAction", "viewAction", "deleteAction", "modifyAction"),
+                        k=rng.randint(4, 8) if long else rng.randint(2, 3))
+    commands = [_GENERATORS[rule](rng, False) for rule in rules]
+    return commands[0] + "".join(rng.choice((" and ", " and then ")) + c for c in commands[1:])
+
+
+_GENERATORS = {
+    "introduce":        lambda rng, long: rng.choice(("what is your name?", "what is your name")),
+    "greeting":         lambda rng, long: rng.choice(("hi", "hello", "Hey", f"hi my name is {rng.choice(_WORDS)}")),
+    "asking":           lambda rng, long: rng.choice(("how are you?", "how are you", "HOW are you?")),
+    "supportTasks":     lambda rng, long: "list tasks instructions",
+    "supportGreetings": lambda rng, long: "list greeting instructions",
+    "supportInfor":     lambda rng, long: "list bot information",
+    "createAction":     _create,
+    "viewAction":       lambda rng, long: rng.choice(("show tasks", "view tasks", "SHOW tasks")),
+    "pageAction":       lambda rng, long: rng.choice(("next page", "more", "show more", "more tasks")),
+    "deleteAction":     lambda rng, long: (f"{rng.choice(('delete', 'remove'))} task "
+                                           f"{_title(rng, 6, 16) if long else _title(rng)}"
+                                           f"{' ' + _abs_due(rng) if rng.random() < 0.5 else ''}"),
+    "modifyAction":     _modify,
+    "affirmative":      lambda rng, long: rng.choice(("yes", "yep", "ok", "OK")),
+    "negative":         lambda rng, long: rng.choice(("no", "nope", "No")),
+    "program":          _sequence,
+}
+
+
+def generate(per_rule: int = 50, seed: int = 1234, long_ratio: float = 0.2) -> List[Tuple[str, str]]:
+    """Return ``(rule, text)`` pairs, *per_rule* for every command rule.
+
+    About *long_ratio* of the create/delete/modify commands use long titles
+    and (for modify) many field assignments.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for rule, gen in _GENERATORS.items():
+        for _ in range(per_rule):
+            corpus.append((rule, gen(rng, rng.random() < long_ratio)))
+    return corpus
@@ -0,0 +1,102 @@
+# benchmarks/stress_dsl.py
+"""Fuzz stress run over AssistantDSL.g4: find the slowest inputs.
+
+Inputs are random token sequences over the grammar's vocabulary and
+mutations (token insert / drop / swap) of corpus commands, up to the
+service's token cap, so they exercise adaptive prediction and error
+recovery rather than the lexer. Run from ``backend/``::
+
+    python -m benchmarks.stress_dsl --inputs 2000 --top 10
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from app.gen.dsl_fastpath import KEYWORDS
+from app.gen.dsl_parser import ENGINES, LEXERS, ParseTimeout, parse_skeleton, warm_up
+
+from benchmarks.dsl_corpus import _WORDS, generate
+
+_VOCAB = sorted(KEYWORDS) + _WORDS[:8] + ["7", "42", "2025-06-01", "09:00", "=", ",", "?"]
+
+
+def _mutate(rng: random.Random, words: List[str]) -> List[str]:
+    for _ in range(rng.randint(1, 4)):
+        op = rng.random()
+        i = rng.randrange(len(words) + 1)
+        if op < 0.4:
+            words.insert(i, rng.choice(_VOCAB))
+        elif op < 0.7 and words:
+            del words[min(i, len(words) - 1)]
+        elif len(words) > 1:
+            j = rng.randrange(len(words))
+            i = min(i, len(words) - 1)
+            words[i], words[j] = words[j], words[i]
+    return words
+
+
+def fuzz_inputs(count: int, seed: int = 4321, max_tokens: int = 256) -> List[str]:
+    """Seeded stress inputs, each at most *max_tokens* tokens."""
+    rng = random.Random(seed)
+    corpus = [text for _, text in generate(per_rule=20, seed=seed)]
+    inputs = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            words = [rng.choice(_VOCAB) for _ in range(rng.randint(1, max_tokens))]
+        elif kind < 0.8:
+            words = _mutate(rng, rng.choice(corpus).split())
+        else:
+            # a command prefix followed by a long run of keywords and identifiers
+            words = rng.choice(corpus).split()[:3]
+            words += [rng.choice(_VOCAB) for _ in range(max_tokens - len(words))]
+        inputs.append(" ".join(words[:max_tokens]))
+    return inputs
+
+
+def slowest(inputs: List[str], engine: str = "tree", lexer: str = "antlr",
+            timeout: float | None = None, top: int = 10) -> List[Tuple[float, str]]:
+    """``(seconds, text)`` of the *top* slowest parses, slowest first."""
+    timings = []
+    for text in inputs:
+        t0 = time.perf_counter()
+        try:
+            parse_skeleton(text, engine, lexer, None, timeout)
+        except ParseTimeout:
+            pass
+        except Exception:
+            pass  # semantic errors (e.g. a bad date) are not this run's concern
+        timings.append((time.perf_counter() - t0, text))
+    timings.sort(reverse=True)
+    return timings[:top]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--inputs", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=4321)
+    ap.add_argument("--max-tokens", type=int, default=256)
+    ap.add_argument("--engine", choices=tuple(ENGINES), default="tree")
+    ap.add_argument("--lexer", choices=tuple(LEXERS), default="antlr")
+    ap.add_argument("--top", type=int, default=10)
+    args = ap.parse_args(argv)
+
+    warm_up()
+    inputs = fuzz_inputs(args.inputs, args.seed, args.max_tokens)
+    worst = slowest(inputs, args.engine, args.lexer, top=args.top)
+    print(json.dumps({
+        "benchmark": "dsl_stress",
+        "inputs": len(inputs),
+        "engine": args.engine,
+        "lexer": args.lexer,
+        "slowest": [{"ms": secs * 1e3, "tokens": len(text.split()), "text": text}
+                    for secs, text in worst],
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
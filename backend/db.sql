@@ -26,5 +26,6 @@ CREATE TABLE ppl.tasks (
     task_time TIME,
     rrule VARCHAR(255),
     status ENUM('pending','done') DEFAULT 'pending',
+    INDEX ix_tasks_owner_due (owner_id, task_date, task_time, id),
     FOREIGN KEY (owner_id) REFERENCES ppl.users(id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4; 
\ No newline at end of file
@@ -0,0 +1,377 @@
+import asyncio
+
+from app.schemas.chat import ChatRequest
+from app.services import chat_service
+from app.services.chat_service import ChatService
+from app.services.render_service import table_key
+
+
+def _handle(text: str):
+    return asyncio.run(ChatService().handle(ChatRequest(text=text), user=None, session=None))
+
+
+def test_instruction_tables_are_rendered_once():
+    chat_service._INSTRUCTION_TABLES.clear()
+    first = _handle("list tasks instructions")
+    cached = chat_service._INSTRUCTION_TABLES["tasks", "png"]
+    assert _handle("list tasks instructions").reply is cached[0] is first.reply
+    assert first.content_hash == table_key(chat_service._build_instruction_rows("tasks"))
+    assert _handle("list greeting instructions").content_hash != first.content_hash
+    again = asyncio.run(ChatService().handle(
+        ChatRequest(text="list tasks instructions", etag=first.content_hash), user=None, session=None))
+    assert again.not_modified and again.reply == "" and again.content_hash == first.content_hash
+
+
+def test_table_render_runs_in_pool_and_degrades_to_text(monkeypatch):
+    from app.services import render_service
+    from app.services.render_service import RenderService
+    from app.services.worker_pool import WorkerPool
+
+    rows = [["Title", "Status"], ["buy milk", "pending"]]
+    render_service._cache.clear()
+    reply, key = asyncio.run(RenderService.table(rows))
+    assert reply.startswith('<img src="data:image/png;base64,')
+    assert render_service._pool.stats()["completed"] >= 1
+
+    monkeypatch.setattr(render_service, "_pool", WorkerPool(queue_size=0, name="full"))
+    assert asyncio.run(RenderService.table(rows)) == (reply, key)  # cached, no render needed
+    assert asyncio.run(RenderService.table(rows + [["x", "done"]])) == (
+        "Title | Status\nbuy milk | pending\nx | done", None)
+
+
+def test_render_cache_etag_and_byte_bound():
+    from app.services import render_service
+    from app.services.render_service import ImageCache, RenderService
+
+    rows = [["Title"], ["etag test"]]
+    reply, key = asyncio.run(RenderService.table(rows))
+    saved = render_service._bytes_saved
+    assert asyncio.run(RenderService.table(rows, etag=key)) == (None, key)
+    assert render_service._bytes_saved == saved + len(reply)
+    stats = RenderService.stats()["cache"]
+    assert stats["not_modified"] >= 1 and stats["bytes"] >= len(reply)
+
+    cache = ImageCache(maxsize=10, maxbytes=10)
+    cache.put("a", "x" * 6)
+    cache.put("b", "y" * 6)  # a is evicted to stay under 10 bytes
+    cache.put("c", "z" * 11)  # larger than the whole cache: not stored
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, "y" * 6, None)
+    assert (cache.bytes, cache.evictions) == (6, 1)
+
+
+def test_table_format_returns_rows_instead_of_an_image():
+    from app.routers.chat import TABLE_MEDIA_TYPE, _table_format
+
+    resp = asyncio.run(ChatService().handle(ChatRequest(text="list tasks instructions"),
+                                            user=None, session=None, fmt="table"))
+    assert resp.content_hash is None and "<img" not in resp.reply
+    assert [c.name for c in resp.table.columns] == ["Command", "Description", "Example"]
+    assert resp.table.rows == chat_service._build_instruction_rows("tasks")[1:]
+
+    assert _table_format(f"{TABLE_MEDIA_TYPE}, application/json", None) == "table"
+    assert _table_format(TABLE_MEDIA_TYPE, "image") == "image"
+    assert _table_format("application/json", None) == "image"
+
+
+def test_display_rows_format_typed_cells():
+    from datetime import date, time
+    from app.schemas.chat import Table
+
+    table = Table(columns=chat_service._TASK_COLUMNS,
+                  rows=[["a", "pending", date(2025, 6, 1), time(9, 5), None],
+                        ["b", "done", None, None, "FREQ=DAILY"]])
+    assert chat_service._display_rows(table)[1:] == [["a", "pending", "01/06/2025", "09:05", ""],
+                                                     ["b", "done", "N/A", "N/A", "FREQ=DAILY"]]
+    assert table.model_dump(mode="json")["rows"][0][2:4] == ["2025-06-01", "09:05:00"]
+
+
+def test_single_pass_renderer_draws_the_same_pixels():
+    from app.services.render_service import table_png
+    from benchmarks.bench_render import legacy_table_png, task_rows
+
+    for rows in (task_rows(1), task_rows(40), chat_service._build_instruction_rows("tasks"),
+                 [["only"]]):
+        assert table_png(rows) == legacy_table_png(rows)
+
+
+def test_svg_tables_are_inline_and_escaped():
+    from app.services.render_service import table_svg
+
+    svg = table_svg([["Title", "Status"], ["a < b & c", ""]])
+    assert svg.startswith("<svg ") and svg.endswith("</svg>") and "\n" not in svg
+    assert ">a &lt; b &amp; c</text>" in svg and svg.count("<text") == 3  # empty cells are skipped
+
+    resp = asyncio.run(ChatService().handle(ChatRequest(text="list tasks instructions"),
+                                            user=None, session=None, fmt="svg"))
+    assert resp.reply.startswith("<svg ")
+    assert resp.content_hash == table_key(chat_service._build_instruction_rows("tasks"), kind="svg")
+
+
+def test_show_tasks_pages_upcoming_first(monkeypatch):
+    from datetime import datetime, time, timedelta
+    from types import SimpleNamespace
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    import app.models.user  # noqa: F401  (tasks.owner_id references users)
+    from app.core.config import settings
+    from app.core.db import Base
+    from app.models.task import Task
+    from app.services.task_service import TaskService
+
+    today = datetime.utcnow().date()
+    user = SimpleNamespace(id="u1")
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all([
+                Task(id="p", owner_id="u1", title="past", task_date=today - timedelta(days=1)),
+                Task(id="c", owner_id="u1", title="later", task_date=today + timedelta(days=2)),
+                Task(id="b", owner_id="u1", title="noon", task_date=today, task_time=time(12)),
+                Task(id="a", owner_id="u1", title="all day", task_date=today),
+                Task(id="d", owner_id="u1", title="noon too", task_date=today, task_time=time(12)),
+                Task(id="x", owner_id="u1", title="someday"),
+                Task(id="y", owner_id="u1", title="one day"),
+                Task(id="o", owner_id="u2", title="not mine", task_date=today),
+                Task(id="q", owner_id="u1", title="late", task_date=today - timedelta(days=3), task_time=time(9)),
+                Task(id="r", owner_id="u1", title="earlier", task_date=today - timedelta(days=3), task_time=time(8)),
+                # no time: first on the date going forward, last going back
+                Task(id="e", owner_id="u1", title="all day too", task_date=today),
+                Task(id="w", owner_id="u1", title="nine someday", task_time=time(9)),
+                Task(id="s", owner_id="u1", title="whenever", task_date=today - timedelta(days=3)),
+                Task(id="t", owner_id="u1", title="whenever too", task_date=today - timedelta(days=3)),
+            ])
+            await session.commit()
+
+            # upcoming, then undated, then overdue (most recently due first)
+            order = ["all day", "all day too", "noon", "noon too", "later", "someday", "one day",
+                     "nine someday", "past", "late", "earlier", "whenever too", "whenever"]
+            for limit in range(1, len(order) + 2):
+                titles, cursor = [], None
+                while True:
+                    tasks, cursor = await TaskService.page(user, session, cursor, limit=limit)
+                    assert 0 < len(tasks) <= limit
+                    titles.extend(t.title for t in tasks)
+                    if cursor is None:
+                        break
+                assert titles == order, limit
+
+            monkeypatch.setattr(settings, "CHAT_PAGE_SIZE", 4)
+            chat = ChatService()
+            ask = lambda text: chat.handle(ChatRequest(text=text), user=user, session=session, fmt="table")
+            first = await ask("show tasks")
+            assert first.reply.startswith("📋 Tasks 1–4") and "more" in first.reply
+            assert [r[0] for r in first.table.rows] == ["all day", "all day too", "noon", "noon too"]
+            second = await ask("more")
+            assert second.reply.startswith("📋 Tasks 5–8")
+            assert [r[0] for r in second.table.rows] == ["later", "someday", "one day", "nine someday"]
+            third = await ask("more")
+            assert third.reply.startswith("📋 Tasks 9–12")
+            assert [r[0] for r in third.table.rows] == ["past", "late", "earlier", "whenever too"]
+            fourth = await ask("more")
+            assert fourth.reply == "📋 Tasks 13–13" and [r[0] for r in fourth.table.rows] == ["whenever"]
+            assert (await ask("next page")).reply.startswith("📭 No more tasks")
+
+            # a sequence keeps every page it listed
+            both = await ask("show tasks and more")
+            assert both.table is None and [t.rows[0][0] for t in both.tables] == ["all day", "later"]
+            assert [line for line in both.reply.splitlines() if line.startswith("📋")] == ["📋 Tasks 1–4", "📋 Tasks 5–8"]
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_chat_stats_require_auth():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.security import get_current_user
+    from app.routers import chat
+
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/chat")
+    client = TestClient(app)
+    assert client.get("/chat/stats").status_code == 401
+    app.dependency_overrides[get_current_user] = lambda: object()
+    assert client.get("/chat/stats").json()["pending"]["backend"] == "memory"
+
+
+def test_chat_websocket_authenticates_once(monkeypatch):
+    import pytest
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from starlette.websockets import WebSocketDisconnect
+    from app.core import security
+    from app.core.db import Base
+    from app.core.security import create_access_token
+    from app.models.user import User
+    from app.routers import chat
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(User(id="u1", username="ann", email="ann@example.com", hashed_password="x"))
+            await session.commit()
+
+    lookups = []
+    user_from_token = security.user_from_token
+
+    async def counting(token, session):
+        lookups.append(token)
+        return await user_from_token(token, session)
+
+    monkeypatch.setattr(chat, "SessionLocal", sessionmaker(bind=engine, class_=AsyncSession,
+                                                           expire_on_commit=False))
+    monkeypatch.setattr(chat, "user_from_token", counting)
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/chat")
+    client = TestClient(app)
+    asyncio.run(setup())
+
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/chat/ws?token=bad") as ws:
+            ws.receive_json()
+    token = create_access_token({"sub": "u1"})
+    with client.websocket_connect(f"/chat/ws?token={token}&format=table") as ws:
+        ws.send_json({"text": "show tasks", "id": 1})
+        ws.send_json({"text": "hello"})
+        ws.send_text("not json")
+        first = ws.receive_json()
+        assert (first["id"], first["reply"]) == (1, "📭 You have no tasks")
+        assert "id" not in ws.receive_json()
+        assert ws.receive_json() == {"error": 'Expected {"text": string}'}
+    assert lookups == [token]
+
+
+def test_command_sequence_writes_tasks_in_one_transaction(monkeypatch):
+    from types import SimpleNamespace
+    from sqlalchemy import event, func, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    import app.models.user  # noqa: F401
+    from app.core.db import Base
+    from app.models.task import Task
+    from app.services import task_service
+
+    user = SimpleNamespace(id="u1")
+    scheduled = []
+
+    async def schedule(tasks):
+        scheduled.append(len(tasks))
+        return len(tasks)
+
+    monkeypatch.setattr(task_service, "schedule_task_reminders", schedule)
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            commits = []
+            event.listen(session.sync_session, "after_commit", lambda s: commits.append(1))
+            chat = ChatService()
+            ask = lambda text: chat.handle(ChatRequest(text=text), user=user, session=session, fmt="table")
+
+            resp = await ask("remind me to a at 2099-01-01 09:00 repeat every day and "
+                             "remind me to b at 2099-01-02 09:00 repeat every day and show tasks")
+            lines = resp.reply.splitlines()
+            assert lines[0].startswith('✅ Created reminder "a"') and lines[1].startswith('✅ Created reminder "b"')
+            assert [r[0] for r in resp.table.rows] == ["a", "b"]
+            assert (len(commits), scheduled) == (1, [2])
+
+            # one question for the whole utterance, one transaction on "yes"
+            resp = await ask("remind me to c in 2 hours and remind me to d in 3 hours")
+            assert resp.reply.count("(Yes/No)") == 2 and len(commits) == 1
+            assert resp.reply.endswith("One yes / no answers all 2 questions.")
+            resp = await ask("yes")
+            assert resp.reply.splitlines()[1].startswith('✅ Created reminder "d"')
+            assert (len(commits), scheduled) == (2, [2, 2])
+            assert await session.scalar(select(func.count()).select_from(Task)) == 4
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_confirmed_sequence_applies_every_action_in_one_transaction(monkeypatch):
+    from types import SimpleNamespace
+    from sqlalchemy import delete, event, select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    import app.models.user  # noqa: F401
+    from app.core.db import Base
+    from app.models.task import Task
+    from app.services import task_service
+
+    user = SimpleNamespace(id="u1")
+
+    async def schedule(tasks):
+        return len(tasks)
+
+    monkeypatch.setattr(task_service, "schedule_task_reminders", schedule)
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all([Task(id="r", owner_id="u1", title="report"),
+                             Task(id="m", owner_id="u1", title="memo"),
+                             Task(id="g", owner_id="u1", title="gone")])
+            await session.commit()
+            commits = []
+            event.listen(session.sync_session, "after_commit", lambda s: commits.append(1))
+            chat = ChatService()
+            ask = lambda text: chat.handle(ChatRequest(text=text), user=user, session=session, fmt="table")
+
+            assert (await ask("update task memo set status=maybe")).reply.startswith("⚠️ Invalid value")
+            resp = await ask("remind me to c in 2 hours and update task report set status=done "
+                             "and delete task gone and delete task memo")
+            assert resp.reply.endswith("One yes / no answers all 4 questions.")
+            # another request removes a task before the "yes"
+            await session.execute(delete(Task).where(Task.id == "g"))
+            await session.commit()
+            commits.clear()
+
+            resp = await ask("yes")
+            lines = resp.reply.splitlines()
+            assert lines[0].startswith('✅ Created reminder "c"')
+            assert lines[1:] == ["✏️ Task updated", "⚠️ Task not found", "🗑️ Task deleted"]
+            assert len(commits) == 1
+            session.expire_all()
+            rows = {t.title: t.status.value for t in await session.scalars(select(Task))}
+            assert rows == {"c": "pending", "report": "done"}
+            assert (await ask("yes")).reply == "⚠️ Nothing pending"
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+def test_batched_reminders_wake_the_scheduler_once(monkeypatch):
+    from datetime import date, time, timedelta
+    from types import SimpleNamespace
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from app.services import scheduler_service
+
+    due = date.today() + timedelta(days=1)
+    tasks = [SimpleNamespace(id=str(i), owner_id="u1", title=f"t{i}", task_date=due,
+                             task_time=time(9, i), rrule=None) for i in range(3)]
+
+    async def run():
+        sched = AsyncIOScheduler(timezone="UTC")
+        sched.start()
+        wakeups = []
+        wakeup = sched.wakeup
+        sched.wakeup = lambda: (wakeups.append(1), wakeup())
+        monkeypatch.setattr(scheduler_service, "scheduler", sched)
+        try:
+            assert await scheduler_service.schedule_task_reminders(tasks) == 3
+            assert len(wakeups) == 1 and sched.state == 1  # running again
+            assert {job.id for job in sched.get_jobs()} == {"reminder-0", "reminder-1", "reminder-2"}
+        finally:
+            sched.shutdown(wait=False)
+
+    asyncio.run(run())
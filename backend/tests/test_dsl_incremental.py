@@ -0,0 +1,76 @@
+import random
+
+from app.gen.dsl_incremental import IncrementalParser
+from app.gen.dsl_lexer import RegexLexer
+from app.gen.dsl_parser import DUE_IN, parse_skeleton
+
+from benchmarks.dsl_corpus import generate
+
+
+def _tokens(text):
+    lexer = RegexLexer(text)
+    lexer.removeErrorListeners()
+    out, tok = [], lexer.nextToken()
+    while tok.type != -1:
+        out.append((tok.type, tok.text, tok.start, tok.stop))
+        tok = lexer.nextToken()
+    return out
+
+
+def test_chunks_split_anywhere_lex_like_the_whole_text():
+    rng = random.Random(3)
+    parser = IncrementalParser()
+    for _, text in generate(per_rule=10, seed=21):
+        parser.reset()
+        cuts = sorted(rng.sample(range(1, len(text)), min(4, len(text) - 1))) if len(text) > 1 else []
+        for a, b in zip([0] + cuts, cuts + [len(text)]):
+            state = parser.feed(text[a:b])
+        assert [(t.type, t.text, t.start, t.stop) for t in parser.tokens] == _tokens(text), text
+        assert state["status"] == "complete", text
+        assert state["intent"] == parse_skeleton(text), text
+
+
+def test_partial_intent_while_speaking():
+    parser = IncrementalParser()
+    states = [parser.feed(w) for w in ("remind ", "me to ", "call mom ", "in 30 ", "minutes")]
+    assert [s["status"] for s in states] == ["partial", "partial", "complete", "partial", "complete"]
+    assert states[0]["intent"]["action"] == "create" and states[0]["intent"]["title"] is None
+    assert states[2]["intent"]["title"] == "call mom" and states[2]["due"] is None
+    assert states[3]["due"] == "partial" and DUE_IN not in states[3]["intent"]
+    assert states[4]["due"] == "complete" and states[4]["intent"][DUE_IN].total_seconds() == 1800
+    # only the tail is re-lexed
+    assert parser.lexed < 2 * len(parser.text)
+
+    parser.reset()
+    assert parser.feed("show ")["status"] == "partial"
+    assert parser.feed("milk")["status"] == "invalid"
+
+    parser.reset()
+    parser.feed("remind x at 2025-13-01 ")
+    assert parser.feed("09:00")["status"] == "invalid"
+    parser.reset()
+    parser.feed("remind x at 2025-12-01 ")
+    assert parser.feed("09:00")["status"] == "complete"
+
+
+def test_incremental_websocket_requires_a_token(monkeypatch):
+    import pytest
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from starlette.websockets import WebSocketDisconnect
+    from app.routers import dsl
+
+    async def user_from_token(token, session):
+        return object() if token == "good" else None
+
+    monkeypatch.setattr(dsl, "user_from_token", user_from_token)
+    app = FastAPI()
+    app.include_router(dsl.router, prefix="/dsl")
+    client = TestClient(app)
+    for url in ("/dsl/incremental", "/dsl/incremental?token=bad"):
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect(url) as ws:
+                ws.receive_json()
+    with client.websocket_connect("/dsl/incremental", headers={"Authorization": "Bearer good"}) as ws:
+        ws.send_json({"text": "show "})
+        assert ws.receive_json()["status"] == "partial"
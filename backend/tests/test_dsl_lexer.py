@@ -0,0 +1,56 @@
+import random
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from app.gen.assistantdsl.AssistantDSLLexer import AssistantDSLLexer
+from app.gen.dsl_lexer import RegexLexer, count_tokens
+from app.gen.dsl_parser import BatchParser, parse_skeleton
+
+from benchmarks.dsl_corpus import generate
+
+
+class _Collect(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+
+def _lex(lexer):
+    errors = _Collect()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    tokens = [(t.type, t.text, t.start, t.stop, t.line, t.column, t.channel, t.tokenIndex)
+              for t in stream.tokens]
+    return tokens, errors.errors
+
+
+def _fuzz(n: int, seed: int = 99):
+    rng = random.Random(seed)
+    alphabet = ("abcxyzZ0123456789 \t\n\r?,=-:_.!é日"
+                "2025-06-01 09:00 in at as set every repeat task tasks remind me to REMIND status=done")
+    pieces = alphabet.split(" ") + list(alphabet)
+    return ["".join(rng.choice(pieces) + rng.choice(("", " ", "\n"))
+                    for _ in range(rng.randint(0, 20))) for _ in range(n)]
+
+
+def test_regex_lexer_matches_antlr_token_stream():
+    corpus = [text for _, text in generate(per_rule=40, seed=7)] + _fuzz(600)
+    corpus += ["", "   ", "2025-06-0109:00", "12:3", "1234-56-789", "remindme", "Yes?", "a\nb\r\nc"]
+    for text in corpus:
+        expected = _lex(AssistantDSLLexer(InputStream(text)))
+        assert _lex(RegexLexer(text)) == expected, text
+        assert count_tokens(text) == len(expected[0]) - 1, text
+
+
+def test_regex_lexer_parses_like_antlr():
+    batch = BatchParser(lexer="regex")
+    for text in [text for _, text in generate(per_rule=20, seed=3)] + _fuzz(200, seed=5):
+        expected = parse_skeleton(text)
+        assert parse_skeleton(text, "stream", "regex") == parse_skeleton(text, "stream")
+        assert parse_skeleton(text, lexer="regex") == expected
+        assert batch.parse_skeleton(text) == expected
@@ -0,0 +1,367 @@
+from datetime import datetime, timedelta
+
+from app.gen.dsl_cache import LRUCache, normalize
+from app.gen.dsl_parser import DUE_IN, parse, parse_skeleton, resolve
+
+
+def test_relative_due_is_resolved_at_lookup():
+    skeleton = parse_skeleton("remind me to buy milk in 30 minutes")
+    assert skeleton[DUE_IN] == timedelta(minutes=30)
+    assert skeleton["task_date"] is None and skeleton["task_time"] is None
+
+    now = datetime(2025, 6, 1, 23, 45)
+    result = resolve(skeleton, now=now)
+    assert DUE_IN not in result
+    assert result["title"] == "buy milk"
+    assert (result["task_date"], result["task_time"]) == ((now + timedelta(minutes=30)).date(),
+                                                          (now + timedelta(minutes=30)).time())
+    # the skeleton itself stays symbolic
+    assert DUE_IN in skeleton
+
+
+def test_resolve_copies_updates():
+    skeleton = parse_skeleton("update task report set status=done")
+    result = resolve(skeleton)
+    result["updates"]["title"] = "x"
+    assert skeleton["updates"] == {"status": "done"}
+
+
+def test_parse_matches_previous_shapes():
+    assert parse("show tasks") == {"action": "view"}
+    assert parse("yes") == {"action": "confirm", "value": True}
+    assert parse("hi my name is Bob") == {"action": "greet", "name": "Bob"}
+    r = parse("remind me to submit report at 2025-06-01 09:00")
+    assert str(r["task_date"]) == "2025-06-01" and str(r["task_time"]) == "09:00:00"
+
+
+def test_normalize_collapses_whitespace_only():
+    assert normalize("  show \t tasks\n") == "show tasks"
+    assert normalize("hi my name is Bob") != normalize("hi my name is bob")
+
+
+def test_lru_cache_counters_and_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1      # a becomes most recent
+    cache.put("c", 3)               # evicts b
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 1, 1, 2)
+
+
+def test_fastpath_agrees_with_antlr():
+    from app.gen import dsl_fastpath
+
+    for text in ("yes", "OK", "nope", " Show \t TASKS ", "view tasks",
+                 "list tasks instructions", "LIST greeting instructions",
+                 "list bot information"):
+        assert dsl_fastpath.match(text) == parse_skeleton(text), text
+    for text in ("show tasks?", "yesterday", "show task", "remind me to x", "", "oK"):
+        assert dsl_fastpath.match(text) is None, text
+
+
+def test_sll_first_then_ll_fallback():
+    from app.gen.dsl_parser import PREDICTION_STATS
+
+    before = dict(PREDICTION_STATS)
+    assert parse_skeleton("update task a b set status=done, title=x")["updates"] == {
+        "status": "done", "title": "x"}
+    assert PREDICTION_STATS["sll"] == before["sll"] + 1
+    assert PREDICTION_STATS["ll"] == before["ll"]
+
+    # malformed input bails out of SLL and is recovered by the LL pass as before
+    assert parse_skeleton("show tasks?") == {"action": "view"}
+    assert PREDICTION_STATS["ll"] == before["ll"] + 1
+
+
+def test_parse_many_reuses_one_parser_and_keeps_order():
+    from app.gen.dsl_parser import BatchParser, parse_many
+
+    texts = ["show tasks", "blah blah", "delete task report at 2025-06-01 09:00",
+             "hi my name is Bob", "remind me to call mom in 2 hours"]
+    assert parse_many(texts) == [parse_skeleton(t) for t in texts]
+    assert parse_many(texts, fastpath=False) == [parse_skeleton(t) for t in texts]
+
+    batch = BatchParser()
+    assert [batch.parse_skeleton(t) for t in texts * 2] == [parse_skeleton(t) for t in texts * 2]
+
+
+def test_stream_engine_matches_tree_engine():
+    from app.gen.dsl_parser import WARM_UP_SAMPLES
+
+    texts = WARM_UP_SAMPLES + (
+        "remind fix bug in 2 days repeat every 7 days as pending",
+        "remind me to a b c in 3 days repeat every day as DONE",
+        "update task x set title=Done, status=pending",
+        "delete task foo in 3 days",
+        "how are you",
+        "show tasks?",          # recovered by the LL pass
+        "remind me to",
+        "remind me to x in 30",  # bails inside dueSpec
+    )
+    for text in texts:
+        assert parse_skeleton(text, "stream") == parse_skeleton(text, "tree"), text
+
+
+def test_benchmark_corpus_covers_every_command_rule():
+    from benchmarks.dsl_corpus import RULE_ACTIONS, generate
+
+    corpus = generate(per_rule=10)
+    assert {rule for rule, _ in corpus} == set(RULE_ACTIONS)
+    for rule, text in corpus:
+        assert parse_skeleton(text)["action"] == RULE_ACTIONS[rule], text
+
+
+def test_template_engine_replays_token_shapes():
+    from app.gen.dsl_parser import TEMPLATES
+    from benchmarks.dsl_corpus import generate
+
+    TEMPLATES.clear()
+    first = parse_skeleton("remind me to buy milk in 30 minutes as pending", "template")
+    # same token types, different slot values: served from the template
+    second = parse_skeleton("Remind me to call mom in 45 minutes as DONE", "template")
+    assert TEMPLATES.stats()["hits"] == 1
+    assert first == parse_skeleton("remind me to buy milk in 30 minutes as pending")
+    assert second == parse_skeleton("Remind me to call mom in 45 minutes as DONE")
+    assert second["title"] == "call mom" and second[DUE_IN] == timedelta(minutes=45)
+
+    # inputs that need the LL pass are not recorded
+    size = len(TEMPLATES)
+    assert parse_skeleton("show tasks?", "template") == parse_skeleton("show tasks?")
+    assert len(TEMPLATES) == size
+
+    for _, text in generate(per_rule=20, seed=11):
+        assert parse_skeleton(text, "template") == parse_skeleton(text), text
+
+
+def test_explain_reports_stages_prediction_and_cache():
+    import asyncio
+    from app.core.metrics import Metrics
+    from app.gen.dsl_parser import explain_skeleton
+    from app.services.dsl_service import DSLService
+
+    skeleton, trace = explain_skeleton("delete task report at 2025-06-01 09:00")
+    assert skeleton == parse_skeleton("delete task report at 2025-06-01 09:00")
+    assert set(trace["stages_ms"]) == {"lex", "parse", "visit"}
+    assert trace["tokens"] == 6 and trace["prediction"] == "sll"
+    assert explain_skeleton("show tasks?", "stream")[1]["prediction"] == "ll"
+
+    text = "remind me to explain the explain mode"
+    first = asyncio.run(DSLService.parse(text, explain=True))["explain"]
+    second = asyncio.run(DSLService.parse(text, explain=True))["explain"]
+    assert first["cache"] == "miss" and "lex" in first["stages_ms"]
+    assert second["cache"] == "hit" and set(second["stages_ms"]) == {"cache", "total"}
+    assert asyncio.run(DSLService.parse("yes", explain=True))["explain"]["cache"] == "fastpath"
+    assert "explain" not in asyncio.run(DSLService.parse(text))
+
+    off = Metrics(enabled=False)
+    with off.time("x"):
+        off.observe("y", 1.0)
+    assert off.snapshot() == {}
+
+
+def test_did_you_mean_suggestions():
+    import asyncio
+    import time
+    from app.gen.dsl_parser import accepts
+    from app.services.dsl_service import DSLService
+    from app.services.suggestion_service import SuggestionService
+
+    index = SuggestionService.build()
+    # help rows the grammar rejects ("show tasks on <date>", "cancel task") are not indexed
+    assert all(accepts(entry["example"]) for _, entry in index.entries.values())
+    assert not accepts("show tasks on 2025-06-01") and accepts("show tasks")
+
+    def first(text):
+        return SuggestionService.suggest(text)[0]["command"]
+
+    assert first("shw taks") == "show tasks"
+    assert first("delet task report") == "delete task <title>"
+    assert first("wat is yor name") == "what is your name?"
+    assert first("remnd me to buy milk at 2025-06-01 09:00").startswith("remind me to <title> at")
+    assert SuggestionService.suggest("blah blah") == []
+
+    result = asyncio.run(DSLService.parse("updte task report set status=done"))
+    assert result["did_you_mean"][0]["command"] == "update task <title> set <field>=<value>"
+
+    queries = ["remind me to call mom in 30 minuts", "list taks instrctions", "hllo"] * 100
+    t0 = time.perf_counter()
+    for text in queries:
+        SuggestionService.suggest(text)
+    assert (time.perf_counter() - t0) / len(queries) < 1e-3
+
+
+def test_suggestions_search_part_of_the_index():
+    from app.services.suggestion_service import SuggestionService, levenshtein, shape
+
+    index = SuggestionService.build()
+
+    def scan(text):
+        # every shape, filtered by the same rule: at most half of the longer one differs
+        query = shape(text)
+        scored = sorted((levenshtein(query, key), order, entry) for key, (order, entry) in index.entries.items()
+                        if levenshtein(query, key) <= max(len(query), len(key)) // 2)
+        return [entry for _, _, entry in scored[:3]]
+
+    for text in ["shw taks", "hllo", "delet task report", "wat is yor name",
+                 "remnd me to buy milk at 2025-06-01 09:00", "updte task report set status=done"]:
+        assert index.suggest(text) == scan(text)
+        assert 0 < index.visited < len(index.entries)
+
+
+def test_suggestions_read_a_bounded_prefix_of_long_input():
+    import random
+    import string
+    import time
+    from app.core.config import settings
+    from app.gen.dsl_lexer import count_tokens
+    from app.services.suggestion_service import SuggestionService, _correct
+
+    index = SuggestionService.build()
+    rnd = random.Random(7)
+
+    def words(n):
+        return " ".join("".join(rnd.choice(string.ascii_lowercase) for _ in range(8)) for _ in range(n))
+
+    # random words are all cache misses: every one read costs a keyword search
+    texts = [words(settings.DSL_MAX_TOKENS) for _ in range(10)]
+    assert all(count_tokens(text) == settings.DSL_MAX_TOKENS for text in texts)
+    _correct.cache_clear()
+    t0 = time.perf_counter()
+    for text in texts:
+        index.suggest(text)
+    elapsed = (time.perf_counter() - t0) / len(texts)
+    assert _correct.cache_info().misses <= len(texts) * index.max_tokens
+    # the full input took ~25 ms; a prefix of max_tokens words costs ~1.5 ms
+    assert elapsed < 5e-3
+    # typos are still corrected in the part that is read
+    assert index.suggest("shw taks " + words(50))[0]["command"] == "show tasks"
+
+
+def test_intents_round_trip_skeletons():
+    from app.gen.dsl_intents import CreateIntent, Intent, from_skeleton
+    from benchmarks.dsl_corpus import generate
+
+    for _, text in generate(per_rule=5, seed=11):
+        skeleton = parse_skeleton(text)
+        intent = from_skeleton(skeleton)
+        assert isinstance(intent, Intent), text
+        assert not hasattr(intent, "__dict__")
+        assert intent.as_dict() == skeleton, text
+        assert list(intent.as_dict()) == list(skeleton), text
+        assert intent.resolve(datetime(2025, 6, 1)).as_dict() == resolve(skeleton, datetime(2025, 6, 1))
+
+    intent = from_skeleton(parse_skeleton("remind me to buy milk in 30 minutes"))
+    assert isinstance(intent, CreateIntent)
+    resolved = intent.resolve(datetime(2025, 6, 1, 23, 45))
+    assert (resolved.task_date, resolved.task_time, resolved.due_in) == (
+        datetime(2025, 6, 2).date(), datetime(2025, 6, 2, 0, 15).time(), None)
+    assert intent.due_in == timedelta(minutes=30)  # the cached intent stays symbolic
+    assert from_skeleton({"error": "x"}) is None
+
+
+def test_paging_commands_and_paging_words_in_titles():
+    from app.gen.dsl_fastpath import match
+
+    for text in ("next page", "more", "MORE tasks", "show more", "view more tasks"):
+        assert parse_skeleton(text) == {"action": "next_page"}, text
+        assert parse_skeleton(text, "stream") == {"action": "next_page"}, text
+        assert match(text) == {"action": "next_page"}, text
+    # the paging keywords are still ordinary title words
+    for engine in ("tree", "stream", "template"):
+        assert parse_skeleton("remind me to read more next page in 5 minutes", engine)["title"] == \
+            "read more next page"
+        assert parse_skeleton("delete task page two", engine)["title"] == "page two"
+
+
+def test_command_sequences_and_separator_words_in_titles():
+    from app.gen.dsl_incremental import IncrementalParser
+    from app.gen.dsl_intents import SequenceIntent, from_skeleton
+
+    text = "remind me to buy bread and milk in 2 hours and then show tasks and delete task a and b"
+    for engine in ("tree", "stream", "template"):
+        skeleton = parse_skeleton(text, engine)
+        assert skeleton["action"] == "sequence", engine
+        assert [c["action"] for c in skeleton["commands"]] == ["create", "view", "delete"]
+        assert skeleton["commands"][0]["title"] == "buy bread and milk"
+        assert skeleton["commands"][2]["title"] == "a and b"
+    # a single command keeps its bare shape
+    assert parse_skeleton("remind me to read and then sleep")["title"] == "read and then sleep"
+
+    now = datetime(2025, 6, 1, 12, 0)
+    intent = from_skeleton(parse_skeleton("remind me to a in 1 hour and remind me to b in 2 hours"))
+    assert isinstance(intent, SequenceIntent)
+    resolved = intent.resolve(now)
+    assert [c.task_time.hour for c in resolved.commands] == [13, 14]
+    assert resolve(intent.as_dict(), now) == resolved.as_dict()
+
+    parser = IncrementalParser()
+    for word in "show tasks and remind me to".split():
+        state = parser.feed(word + " ")
+    assert state["status"] == "partial"
+    state = parser.feed("call")
+    assert state["status"] == "complete"
+    view, create = state["intent"]["commands"]
+    assert view == {"action": "view"} and create["title"] == "call"
+
+
+def test_paging_words_are_free_words_in_names_and_fields():
+    for engine in ("tree", "stream", "template"):
+        assert parse_skeleton("hi my name is Page", engine) == {"action": "greet", "name": "Page"}
+        assert parse_skeleton("hi my name is more", engine)["name"] == "more"
+        updates = parse_skeleton("update task x set title=more, next=page, status=done", engine)["updates"]
+        assert updates == {"title": "more", "next": "page", "status": "done"}, engine
+
+
+def test_separator_words_are_free_words_in_names_and_fields():
+    for engine in ("tree", "stream", "template"):
+        assert parse_skeleton("hi my name is Then", engine) == {"action": "greet", "name": "Then"}
+        assert parse_skeleton("update task x set note=and", engine)["updates"] == {"note": "and"}
+        skeleton = parse_skeleton("update task x set note=then and show tasks", engine)
+        assert [c["action"] for c in skeleton["commands"]] == ["update", "view"], engine
+        assert skeleton["commands"][0]["updates"] == {"note": "then"}
+
+
+def test_batch_endpoint_requires_auth_and_caps_the_body(monkeypatch):
+    import json
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.config import settings
+    from app.core.security import get_current_user
+    from app.routers import dsl
+
+    app = FastAPI()
+    app.include_router(dsl.router, prefix="/dsl")
+    client = TestClient(app)
+    body = "\n".join(json.dumps({"text": t}) for t in ("show tasks", "yes"))
+    headers = {"content-type": "application/x-ndjson"}
+    assert client.post("/dsl/parse/batch", content=body, headers=headers).status_code == 401
+
+    app.dependency_overrides[get_current_user] = lambda: object()
+    resp = client.post("/dsl/parse/batch", content=body, headers=headers)
+    assert [json.loads(line)["result"]["action"] for line in resp.text.splitlines()] == ["view", "confirm"]
+    assert client.post("/dsl/parse/batch", json=["show tasks"]).status_code == 200
+
+    monkeypatch.setattr(settings, "DSL_BATCH_MAX_BYTES", 16)
+    assert client.post("/dsl/parse/batch", content=body, headers=headers).status_code == 413
+
+    def chunks():  # no Content-Length: the limit applies while streaming
+        yield body[:10].encode()
+        yield body[10:].encode()
+
+    assert client.post("/dsl/parse/batch", content=chunks(), headers=headers).status_code == 413
+
+
+def test_stats_endpoint_requires_auth():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.security import get_current_user
+    from app.routers import dsl
+
+    app = FastAPI()
+    app.include_router(dsl.router, prefix="/dsl")
+    client = TestClient(app)
+    assert client.get("/dsl/stats").status_code == 401
+    app.dependency_overrides[get_current_user] = lambda: object()
+    assert "cache" in client.get("/dsl/stats").json()
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.gen.dsl_parser import ParseTimeout, parse_many, parse_skeleton
+from app.services.dsl_service import DSLService
+
+from benchmarks.stress_dsl import fuzz_inputs, slowest
+
+
+def test_fuzzed_inputs_parse_in_bounded_time():
+    inputs = fuzz_inputs(300, seed=8, max_tokens=settings.DSL_MAX_TOKENS)
+    worst = slowest(inputs, top=3)
+    # a few ms in practice; the bound only catches super-linear blowups
+    assert worst[0][0] < 0.25, worst[0][1]
+
+
+def test_deadline_stops_the_parser():
+    text = " ".join(["remind", "me", "to"] + ["hello ,"] * 100)
+    with pytest.raises(ParseTimeout):
+        parse_skeleton(text, timeout=0)
+    with pytest.raises(ParseTimeout):
+        parse_skeleton(text, "template", "regex", None, 0)
+    assert parse_many([text, "show tasks"], timeout=0) == [{"error": "parse_timeout"},
+                                                          {"action": "view"}]
+
+
+def test_service_rejects_oversized_input_without_parsing():
+    too_long = "remind me to " + "x" * settings.DSL_MAX_CHARS
+    assert asyncio.run(DSLService.parse(too_long)) == {
+        "error": "input_too_long", "limit": settings.DSL_MAX_CHARS, "length": len(too_long)}
+
+    too_many = "remind me to " + "a " * settings.DSL_MAX_TOKENS
+    assert asyncio.run(DSLService.parse(too_many)) == {
+        "error": "too_many_tokens", "limit": settings.DSL_MAX_TOKENS}
+
+    async def batch():
+        async def texts():
+            for text in ("show tasks", too_many, "yes"):
+                yield text
+        return [r async for r in DSLService.parse_batch(texts())]
+    results = asyncio.run(batch())
+    assert [r.get("action", r.get("error")) for r in results] == ["view", "too_many_tokens", "confirm"]
+
+
+def test_deadline_inside_a_rule_raises_parse_timeout(monkeypatch):
+    import app.gen.dsl_parser as dsl_parser
+
+    text = "remind me to x in 30 minutes"
+    for engine in ("tree", "stream", "template"):
+        expected = parse_skeleton(text, engine, "regex")
+        # the clock passes the deadline at the n-th check: every rule entry
+        # and token, including those inside the dueSpec, gets its turn
+        for n in range(2, 40):
+            dsl_parser.TEMPLATES.clear()
+            calls = iter(range(10_000))
+            monkeypatch.setattr(dsl_parser, "perf_counter", lambda: 0.0 if next(calls) < n else 2.0)
+            try:
+                assert parse_skeleton(text, engine, "regex", None, 1.0) == expected
+            except ParseTimeout:
+                pass
+            calls = iter(range(10_000))
+            assert parse_many([text], False, engine, "regex", 1.0)[0] in (expected, {"error": "parse_timeout"})
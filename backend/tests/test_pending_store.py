@@ -0,0 +1,218 @@
+import asyncio
+from datetime import date, time
+from types import SimpleNamespace
+
+from redis.exceptions import WatchError
+
+from app.services import pending_store
+from app.services.pending_store import MemoryPendingStore, RedisPendingStore
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeRedis:
+    """The few ``redis.asyncio`` commands RedisPendingStore uses, on plain dicts."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.ttls = {}
+        self.closed = False
+
+    async def zrangebyscore(self, key, low, high):
+        low = float(low)
+        return [m for m, score in sorted(self.zsets.get(key, {}).items(), key=lambda i: i[1])
+                if low <= score <= high]
+
+    async def zpopmin(self, key, count):
+        zset = self.zsets.get(key, {})
+        popped = sorted(zset.items(), key=lambda i: i[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    async def hincrby(self, key, field, amount):
+        h = self.hashes.setdefault(key, {})
+        h[field] = str(int(h.get(field, 0)) + amount)
+        return int(h[field])
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.zsets.pop(key, None)
+
+    async def aclose(self):
+        self.closed = True
+
+    # commands only issued inside a pipeline
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hdel(self, key, *fields):
+        h = self.hashes.get(key, {})
+        return sum(h.pop(f, None) is not None for f in fields)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        z = self.zsets.get(key, {})
+        return sum(z.pop(m, None) is not None for m in members)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def memory_usage(self, key):
+        h = self.hashes.get(key)
+        return sum(len(v) for v in h.values()) if h else None
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._queued = []
+        self._watched = {}       # key -> its sorted set when WATCHed
+        self._immediate = False  # between WATCH and MULTI commands run at once
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def watch(self, *keys):
+        self._watched = {key: dict(self._redis.zsets.get(key, {})) for key in keys}
+        self._immediate = True
+
+    def multi(self):
+        self._immediate = False
+
+    def __getattr__(self, name):
+        command = getattr(self._redis, name)
+        if self._immediate:
+            return command
+        return lambda *args: self._queued.append((command, args))
+
+    async def execute(self):
+        queued, watched = self._queued, self._watched
+        self._queued, self._watched, self._immediate = [], {}, False
+        if any(self._redis.zsets.get(key, {}) != members for key, members in watched.items()):
+            raise WatchError("watched key changed")
+        results = [command(*args) for command, args in queued]
+        return [await r if asyncio.iscoroutine(r) else r for r in results]
+
+
+def test_redis_store_expires_caps_and_counts(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(pending_store, "time", SimpleNamespace(time=clock))
+
+    async def run():
+        redis = _FakeRedis()
+        store = RedisPendingStore("redis://unused", ttl=60, maxsize=2, prefix="t:", client=redis)
+        payload = {"title": "x", "task_date": date(2025, 6, 1), "task_time": time(9, 0)}
+        await store.put(1, {"action": "create", "payload": payload})
+        assert redis.ttls == {"t:data": 61, "t:expires": 61}
+        assert await store.pop(1) == {"action": "create",
+                                      "payload": {"title": "x", "task_date": "2025-06-01",
+                                                  "task_time": "09:00:00"}}
+        assert await store.pop(1) is None  # popped once
+
+        await store.put(1, {"action": "delete", "task_id": 1})
+        clock.now = 61
+        assert await store.pop(1) is None  # expired
+        assert redis.hashes["t:data"] == {}
+
+        for uid in (1, 2, 3):
+            clock.now += 1
+            await store.put(uid, {"action": "delete", "task_id": uid})
+        assert await store.pop(1) is None  # evicted, oldest first
+        assert await store.pop(3) == {"action": "delete", "task_id": 3}
+
+        stats = await store.stats()
+        assert (stats["backend"], stats["size"], stats["hits"], stats["misses"]) == ("redis", 1, 2, 3)
+        assert (stats["expired"], stats["evictions"]) == (1, 1)
+        assert stats["bytes"] == len('{"action":"delete","task_id":2}')
+        assert stats["hit_rate"] == 2 / 5
+
+        await store.clear()
+        assert (await store.stats())["hits"] == 0 and redis.hashes == {}
+        await store.close()
+        assert redis.closed
+
+    asyncio.run(run())
+
+
+def test_memory_store_expires_caps_and_counts():
+    async def run():
+        clock = _Clock()
+        store = MemoryPendingStore(ttl=60, maxsize=2, clock=clock)
+        payload = {"title": "x", "task_date": date(2025, 6, 1), "task_time": time(9, 0)}
+        await store.put(1, {"action": "create", "payload": payload})
+        assert await store.pop(1) == {"action": "create",
+                                      "payload": {"title": "x", "task_date": "2025-06-01",
+                                                  "task_time": "09:00:00"}}
+        assert await store.pop(1) is None  # popped once
+
+        await store.put(1, {"action": "delete", "task_id": 1})
+        clock.now = 61
+        assert await store.pop(1) is None  # expired
+
+        for uid in (1, 2, 3):
+            await store.put(uid, {"action": "delete", "task_id": uid})
+        assert await store.pop(1) is None  # evicted, oldest first
+        assert await store.pop(3) == {"action": "delete", "task_id": 3}
+
+        stats = await store.stats()
+        assert (stats["size"], stats["hits"], stats["misses"]) == (1, 2, 3)
+        assert (stats["expired"], stats["evictions"]) == (1, 1)
+        assert stats["bytes"] == len('{"action":"delete","task_id":2}')
+
+    asyncio.run(run())
+
+
+def test_redis_purge_keeps_an_entry_refreshed_by_another_worker(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(pending_store, "time", SimpleNamespace(time=clock))
+
+    async def run():
+        redis = _FakeRedis()
+        mine = RedisPendingStore("redis://unused", ttl=60, prefix="t:", client=redis)
+        other = RedisPendingStore("redis://unused", ttl=60, prefix="t:", client=redis)
+        await mine.put(1, {"action": "delete", "task_id": "old"})
+        clock.now = 61
+
+        # another worker refreshes the action right after the purge read it as expired
+        read = redis.zrangebyscore
+        raced = []
+
+        async def zrangebyscore(*args):
+            expired = await read(*args)
+            if not raced:
+                raced.append(1)
+                redis.hset("t:data", "1", pending_store.encode({"action": "delete", "task_id": "new"}))
+                redis.zadd("t:expires", {"1": clock.now + 60})
+            return expired
+
+        monkeypatch.setattr(redis, "zrangebyscore", zrangebyscore)
+        assert await other.pop(1) == {"action": "delete", "task_id": "new"}
+        assert (await mine.stats())["expired"] == 0
+
+    asyncio.run(run())
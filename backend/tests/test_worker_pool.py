@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.gen.dsl_parser import parse_skeleton, warm_up
+from app.services.worker_pool import PoolBusy, WorkerPool
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_runs_parser_off_loop():
+    pool = WorkerPool(mode="thread", workers=1, queue_size=4, timeout=5)
+    try:
+        assert await pool.run(parse_skeleton, "show tasks") == {"action": "view"}
+        assert pool.stats()["completed"] == 1
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_limit_and_timeout():
+    gate = threading.Event()
+    pool = WorkerPool(mode="thread", workers=1, queue_size=1, timeout=0.05)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(gate.wait)
+        # the timed-out job still occupies the only slot until it finishes
+        with pytest.raises(PoolBusy):
+            await pool.run(gate.wait)
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert await pool.run(lambda: 42) == 42
+        stats = pool.stats()
+        assert (stats["timeouts"], stats["rejected"], stats["in_flight"]) == (1, 1, 0)
+    finally:
+        gate.set()
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_is_prewarmed():
+    pool = WorkerPool(mode="process", workers=1, queue_size=2, timeout=30, initializer=warm_up)
+    try:
+        result = await pool.run(parse_skeleton, "remind me to call mom in 30 minutes")
+        assert result["title"] == "call mom"
+    finally:
+        pool.shutdown()